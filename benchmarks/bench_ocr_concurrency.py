@@ -0,0 +1,88 @@
+"""Pages/sec vs. number of concurrent conversions for each OCR thread policy.
+
+Generates a synthetic scanned PDF (text rendered into a page image, no text
+layer) and converts copies of it from a thread pool at increasing levels of
+concurrency. Requires a working Tesseract installation.
+
+    python benchmarks/bench_ocr_concurrency.py --pages 4 --concurrency 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import fitz
+
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.cpu_budget import CpuBudget
+from roop_pdfmd.core.models import AppSettings, OcrThreadPolicy
+
+
+_SAMPLE_TEXT = (
+    "The quick brown fox jumps over the lazy dog. Pack my box with five dozen "
+    "liquor jugs. How vexingly quick daft zebras jump."
+)
+
+
+def make_scanned_pdf(path: Path, pages: int, dpi: int = 200) -> None:
+    source = fitz.open()
+    text_page = source.new_page()
+    text_page.insert_textbox(fitz.Rect(54, 54, 558, 738), (_SAMPLE_TEXT + "\n") * 30, fontsize=11)
+    scan = text_page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY).tobytes("png")
+
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        page.insert_image(page.rect, stream=scan)
+    doc.save(path)
+    doc.close()
+    source.close()
+
+
+def run(
+    pdf_path: Path,
+    out_dir: Path,
+    concurrency: int,
+    policy: OcrThreadPolicy,
+) -> tuple[int, float]:
+    budget = CpuBudget()
+    settings = AppSettings(ocr_thread_policy=policy)
+
+    def _convert(idx: int) -> int:
+        result = Converter(cpu_budget=budget).convert(pdf_path, out_dir / str(idx), settings)
+        return result.processed_pages
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        pages = sum(pool.map(_convert, range(concurrency)))
+    return pages, time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=4, help="Pages per document.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        pdf_path = tmp_dir / "scan.pdf"
+        make_scanned_pdf(pdf_path, args.pages)
+
+        print(f"{'policy':<12}{'concurrency':>12}{'pages':>8}{'seconds':>10}{'pages/sec':>11}")
+        for policy in OcrThreadPolicy:
+            for concurrency in args.concurrency:
+                pages, seconds = run(pdf_path, tmp_dir / "out", concurrency, policy)
+                print(
+                    f"{policy.value:<12}{concurrency:>12}{pages:>8}"
+                    f"{seconds:>10.2f}{pages / seconds:>11.2f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
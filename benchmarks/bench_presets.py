@@ -0,0 +1,121 @@
+"""Pages/sec and text accuracy of each speed/accuracy preset.
+
+Generates a synthetic corpus with known text: scanned pages (text rendered
+into a page image, no text layer), born-digital pages with a text layer, and
+pages with a short caption over a large image. Each preset converts the
+corpus and its per-page text is compared with the ground truth. Requires a
+working Tesseract installation; ``--ocr-backend stub`` only smoke-tests the
+harness.
+
+    python benchmarks/bench_presets.py --pages 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import tempfile
+import time
+from pathlib import Path
+
+import fitz
+
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.core.presets import Preset, apply_preset
+
+
+_PARAGRAPH = (
+    "Invoice 4471 was issued on 12 March for 38 units of part K-209. Payment "
+    "terms are thirty days net; late payments accrue 1.5% interest per month."
+)
+_CAPTION = "Figure 7: pump housing, rear view"
+
+
+def make_corpus(path: Path, pages: int, dpi: int = 200) -> list[str]:
+    """Write the corpus to ``path`` and return the expected text of each page."""
+    source = fitz.open()
+    text_page = source.new_page()
+    scanned_text = (_PARAGRAPH + "\n") * 12
+    text_page.insert_textbox(fitz.Rect(54, 54, 558, 738), scanned_text, fontsize=11)
+    scan = text_page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY).tobytes("png")
+
+    photo = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 400, 300), False)
+    photo.set_rect(photo.irect, (90, 120, 150))
+
+    doc = fitz.open()
+    expected: list[str] = []
+    for _ in range(pages):
+        page = doc.new_page()
+        page.insert_image(page.rect, stream=scan)
+        expected.append(scanned_text)
+
+        page = doc.new_page()
+        digital_text = (_PARAGRAPH + "\n") * 8
+        page.insert_textbox(fitz.Rect(54, 54, 558, 738), digital_text, fontsize=11)
+        expected.append(digital_text)
+
+        page = doc.new_page()
+        page.insert_image(fitz.Rect(54, 54, 558, 650), pixmap=photo)
+        page.insert_text((54, 680), _CAPTION, fontsize=11)
+        expected.append(_CAPTION)
+    doc.save(path)
+    doc.close()
+    source.close()
+    return expected
+
+
+def _normalise(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+def run(
+    pdf_path: Path,
+    out_dir: Path,
+    settings: AppSettings,
+    expected: list[str],
+) -> tuple[int, float, float]:
+    page_text: dict[int, str] = {}
+
+    def _on_page(page_result, _markdown: str, text_block: str) -> None:
+        page_text[page_result.page_number] = text_block
+
+    started = time.perf_counter()
+    result = Converter().convert(pdf_path, out_dir, settings, page_callback=_on_page)
+    seconds = time.perf_counter() - started
+
+    ratios = [
+        difflib.SequenceMatcher(
+            None, _normalise(truth), _normalise(page_text.get(number, ""))
+        ).ratio()
+        for number, truth in enumerate(expected, start=1)
+    ]
+    return result.processed_pages, seconds, sum(ratios) / len(ratios)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=3, help="Copies of each page kind.")
+    parser.add_argument("--ocr-backend", default="pytesseract")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        pdf_path = tmp_dir / "corpus.pdf"
+        expected = make_corpus(pdf_path, args.pages)
+
+        print(f"{'preset':<10}{'pages':>8}{'seconds':>10}{'pages/sec':>11}{'accuracy':>10}")
+        for preset in Preset:
+            settings = apply_preset(AppSettings(ocr_backend=args.ocr_backend), preset)
+            pages, seconds, accuracy = run(
+                pdf_path, tmp_dir / preset.value, settings, expected
+            )
+            print(
+                f"{preset.value:<10}{pages:>8}{seconds:>10.2f}"
+                f"{pages / seconds:>11.2f}{accuracy:>10.1%}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+"""Throughput of each text post-processing step, alone and combined.
+
+Runs synthetic pages (running header, page-number footer, ligatures, ragged
+whitespace, line-break and page-break hyphenation) through TextPipeline with
+one step enabled at a time, then with all of them. No Tesseract needed.
+
+    python benchmarks/bench_text_pipeline.py --pages 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from roop_pdfmd.core.text_utils import TextPipeline
+
+_WORDS = (
+    "report revenue margin ofﬁce efﬁcient workﬂow analysis quarterly forecast "
+    "customer contract increase decrease operating segment liquidity"
+).split()
+
+_STEPS = ("dehyphenate", "normalize_unicode", "collapse_whitespace", "strip_headers_footers")
+
+
+def make_pages(count: int, lines_per_page: int = 45, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    pages = []
+    for number in range(1, count + 1):
+        lines = ["ACME Corp   Annual  Report"]
+        for _ in range(lines_per_page):
+            words = rng.choices(_WORDS, k=rng.randint(6, 12))
+            line = "  ".join(words) if rng.random() < 0.2 else " ".join(words)
+            if rng.random() < 0.1:
+                line += " multi-"
+            lines.append(line)
+        lines[-1] += " conti-"
+        lines.append(f"Page {number}")
+        pages.append("\n".join(lines))
+    return pages
+
+
+def run(pages: list[str], **steps: bool) -> float:
+    pipeline = TextPipeline(**steps)
+    started = time.perf_counter()
+    for _ in pipeline.process(pages):
+        pass
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=2000)
+    args = parser.parse_args()
+
+    pages = make_pages(args.pages)
+    megabytes = sum(len(page.encode("utf-8")) for page in pages) / 1_000_000
+
+    configurations = [("none", {})]
+    configurations += [(step, {step: True}) for step in _STEPS]
+    configurations.append(("all", {step: True for step in _STEPS}))
+
+    print(f"{'steps':<24}{'seconds':>10}{'pages/sec':>12}{'MB/sec':>10}")
+    for name, steps in configurations:
+        seconds = run(pages, **steps)
+        print(
+            f"{name:<24}{seconds:>10.3f}{args.pages / seconds:>12.0f}{megabytes / seconds:>10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
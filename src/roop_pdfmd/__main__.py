@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import multiprocessing
 
-from roop_pdfmd.gui.app import run_app
+
+# Kept in sync with core.presets.Preset; listed here so parsing stays import-free.
+_PRESETS = ("fast", "balanced", "accurate")
 
 
 def main() -> int:
@@ -12,9 +15,362 @@ def main() -> int:
         action="store_true",
         help="Launch UI in smoke mode and exit immediately.",
     )
+    subparsers = parser.add_subparsers(dest="command")
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run the local HTTP conversion service.",
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument("--workers", type=int, default=2)
+    serve_parser.add_argument(
+        "--work-dir",
+        default="roop_pdfmd_service",
+        help="Directory for uploaded PDFs and job outputs.",
+    )
+    serve_parser.add_argument("--tesseract-path", default="")
+    serve_parser.add_argument(
+        "--preset",
+        choices=_PRESETS,
+        default=None,
+        help="Speed/accuracy trade-off for DPI, preprocessing and OCR mode.",
+    )
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Convert PDFs dropped into inbox folders until interrupted.",
+    )
+    watch_parser.add_argument(
+        "output_root",
+        help="Outputs of each inbox go to <output_root>/<inbox folder name>.",
+    )
+    watch_parser.add_argument("inputs", nargs="+", help="Inbox folders to watch.")
+    watch_parser.add_argument("--workers", type=int, default=2)
+    watch_parser.add_argument("--poll-seconds", type=float, default=5.0)
+    watch_parser.add_argument(
+        "--settle-seconds",
+        type=float,
+        default=10.0,
+        help="How long a file must stay unchanged before it is converted.",
+    )
+    watch_parser.add_argument("--tesseract-path", default="")
+    watch_parser.add_argument(
+        "--preset",
+        choices=_PRESETS,
+        default=None,
+        help="Speed/accuracy trade-off for DPI, preprocessing and OCR mode.",
+    )
+
+    search_parser = subparsers.add_parser(
+        "search",
+        help="Query a full-text search index built during conversion.",
+    )
+    search_parser.add_argument("index", help="Path to the search index database.")
+    search_parser.add_argument("query", nargs="+")
+    search_parser.add_argument("--limit", type=int, default=20)
+    search_parser.add_argument("--document", default=None, help="Only search this input PDF.")
+    search_parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="Pass the query to SQLite FTS5 as-is (phrases, OR, NEAR, prefix*).",
+    )
+    search_parser.add_argument("--json", action="store_true", help="Print hits as JSON lines.")
+
+    history_parser = subparsers.add_parser(
+        "history",
+        help="Inspect the run history that conversion time estimates are learned from.",
+    )
+    history_commands = history_parser.add_subparsers(dest="history_command", required=True)
+    ingest_parser = history_commands.add_parser(
+        "ingest", help="Add .meta.json records (files or folders searched recursively)."
+    )
+    ingest_parser.add_argument("history", help="Path to the run history database.")
+    ingest_parser.add_argument("paths", nargs="+")
+    accuracy_parser = history_commands.add_parser(
+        "accuracy", help="Show the fitted cost model and how well it predicted past runs."
+    )
+    accuracy_parser.add_argument("history")
+    estimate_parser = history_commands.add_parser(
+        "estimate", help="Print expected conversion times, shortest first."
+    )
+    estimate_parser.add_argument("history")
+    estimate_parser.add_argument("pdfs", nargs="+")
+    estimate_parser.add_argument("--ocr-dpi", type=int, default=300)
+
+    report_parser = subparsers.add_parser(
+        "report",
+        help="Aggregate .meta.json files into a corpus performance report.",
+    )
+    report_parser.add_argument(
+        "paths", nargs="+", help="Metadata files or output folders (searched recursively)."
+    )
+    report_parser.add_argument(
+        "--slowest", type=int, default=10, help="How many of the slowest documents to list."
+    )
+    report_parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+
+    shard_parser = subparsers.add_parser(
+        "shard",
+        help="Convert one large PDF with workers sharing a queue directory.",
+    )
+    shard_commands = shard_parser.add_subparsers(dest="shard_command", required=True)
+    publish_parser = shard_commands.add_parser("publish", help="Split a PDF into queued shards.")
+    publish_parser.add_argument("queue", help="Shared queue directory.")
+    publish_parser.add_argument("input_pdf")
+    publish_parser.add_argument("output_dir")
+    publish_parser.add_argument("--shard-pages", type=int, default=200)
+    publish_parser.add_argument("--tesseract-path", default="")
+    publish_parser.add_argument(
+        "--preset",
+        choices=_PRESETS,
+        default=None,
+        help="Speed/accuracy trade-off for DPI, preprocessing and OCR mode.",
+    )
+    work_parser = shard_commands.add_parser("work", help="Claim and convert shards.")
+    work_parser.add_argument("queue")
+    work_parser.add_argument("--job", default=None, help="Only work on this job.")
+    work_parser.add_argument("--processes", type=int, default=1)
+    work_parser.add_argument("--lease-seconds", type=float, default=600.0)
+    work_parser.add_argument(
+        "--keep-running",
+        action="store_true",
+        help="Poll for new shards instead of exiting when the queue is empty.",
+    )
+    for name, help_text in (
+        ("status", "Show shard progress of a job."),
+        ("merge", "Write the final outputs of a finished job."),
+        ("retry", "Make shards that used up their attempts claimable again."),
+    ):
+        command_parser = shard_commands.add_parser(name, help=help_text)
+        command_parser.add_argument("queue")
+        command_parser.add_argument("job")
+    shard_commands.choices["merge"].add_argument(
+        "--remove", action="store_true", help="Delete the job from the queue after merging."
+    )
+
     args = parser.parse_args()
+
+    if args.command == "search":
+        return _run_search(args)
+
+    if args.command == "shard":
+        return _run_shard(args)
+
+    if args.command == "history":
+        return _run_history(args)
+
+    if args.command == "report":
+        return _run_report(args)
+
+    if args.command == "watch":
+        return _run_watch(args)
+
+    if args.command == "serve":
+        from roop_pdfmd.service.http_server import run_server
+        from roop_pdfmd.utils.logging_utils import setup_logging
+
+        setup_logging()
+        return run_server(
+            host=args.host,
+            port=args.port,
+            work_dir=args.work_dir,
+            workers=args.workers,
+            settings=_settings_from_args(args),
+        )
+
+    # PySide6 is only loaded once we know the GUI is being launched.
+    from roop_pdfmd.gui.app import run_app
+
     return run_app(smoke=args.smoke)
 
 
+def _settings_from_args(args: argparse.Namespace):
+    from roop_pdfmd.core.models import AppSettings
+    from roop_pdfmd.core.presets import apply_preset
+
+    settings = AppSettings(tesseract_path=args.tesseract_path)
+    return apply_preset(settings, args.preset) if args.preset else settings
+
+
+def _run_search(args: argparse.Namespace) -> int:
+    import json
+    from dataclasses import asdict
+    from pathlib import Path
+
+    from roop_pdfmd.core.search_index import SearchIndex, SearchIndexError
+
+    if not Path(args.index).is_file():
+        print(f"Search index not found: {args.index}")
+        return 2
+    try:
+        with SearchIndex(args.index) as index:
+            hits = index.search(
+                " ".join(args.query), limit=args.limit, document=args.document, raw=args.raw
+            )
+    except SearchIndexError as exc:
+        print(exc)
+        return 2
+
+    for hit in hits:
+        if args.json:
+            print(json.dumps(asdict(hit), ensure_ascii=False))
+        else:
+            print(f"{hit.document}:{hit.page_number}: {hit.snippet}")
+    return 0 if hits else 1
+
+
+def _run_history(args: argparse.Namespace) -> int:
+    from pathlib import Path
+
+    from roop_pdfmd.core.history import HistoryError, RunHistory, shortest_first
+    from roop_pdfmd.core.models import AppSettings
+
+    try:
+        with RunHistory(args.history) as history:
+            if args.history_command == "ingest":
+                count = 0
+                for raw in args.paths:
+                    path = Path(raw)
+                    records = sorted(path.rglob("*.meta.json")) if path.is_dir() else [path]
+                    for metadata_path in records:
+                        history.ingest(metadata_path)
+                        count += 1
+                print(f"Recorded {count} run(s)")
+                return 0
+
+            if args.history_command == "estimate":
+                model = history.model()
+                settings = AppSettings(ocr_dpi=args.ocr_dpi)
+                for path, seconds in shortest_first(args.pdfs, settings, model):
+                    print(f"{seconds:10.1f}s  {path}")
+                return 0
+
+            report = history.accuracy()
+    except HistoryError as exc:
+        print(exc)
+        return 2
+
+    model = report.model
+    print(
+        f"Model from {model.runs} run(s), {model.extract_pages} text-layer and "
+        f"{model.ocr_pages} OCR page(s):"
+    )
+    print(f"  text-layer page   {model.extract_seconds_per_page:.3f}s")
+    print(
+        f"  OCR page          {model.ocr_base_seconds:.3f}s + "
+        f"{model.ocr_seconds_per_megapixel:.3f}s per megapixel"
+    )
+    print(f"  wall/page time    x{model.wall_factor:.2f}")
+    for label, errors in (
+        ("Back-test (each run predicted from earlier runs)", report.backtest),
+        ("Estimates made before conversion", report.estimates),
+    ):
+        if errors:
+            print(
+                f"{label}: {len(errors)} run(s), mean error "
+                f"{report.mean_error(errors):.0%}, median {report.median_error(errors):.0%}"
+            )
+    return 0
+
+
+def _run_report(args: argparse.Namespace) -> int:
+    import json
+
+    from roop_pdfmd.core.report import ReportError, build_report
+
+    try:
+        report = build_report(args.paths, slowest=args.slowest)
+    except ReportError as exc:
+        print(exc)
+        return 2
+    if not report.documents:
+        print("No readable metadata files found")
+        return 1
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(report.format_table())
+    return 0
+
+
+def _run_watch(args: argparse.Namespace) -> int:
+    from roop_pdfmd.core.converter import ConversionError
+    from roop_pdfmd.service.watch import FolderWatcher, watch_folders_from_args
+    from roop_pdfmd.utils.logging_utils import setup_logging
+
+    setup_logging()
+    try:
+        watcher = FolderWatcher(
+            watch_folders_from_args(args.output_root, args.inputs),
+            settings=_settings_from_args(args),
+            workers=args.workers,
+            poll_seconds=args.poll_seconds,
+            settle_seconds=args.settle_seconds,
+        )
+    except ConversionError as exc:
+        print(exc)
+        return 2
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    print(f"Converted {watcher.converted} file(s), {watcher.failed} failed")
+    return 0
+
+
+def _run_shard(args: argparse.Namespace) -> int:
+    from roop_pdfmd.core.converter import ConversionError
+    from roop_pdfmd.core.sharding import ShardError, ShardQueue, run_shard_workers
+    from roop_pdfmd.utils.logging_utils import setup_logging
+
+    setup_logging()
+    queue = ShardQueue(args.queue)
+    try:
+        if args.shard_command == "publish":
+            job = queue.publish(
+                args.input_pdf,
+                args.output_dir,
+                _settings_from_args(args),
+                shard_pages=args.shard_pages,
+            )
+            print(job.job_id)
+            return 0
+
+        if args.shard_command == "work":
+            converted = run_shard_workers(
+                queue.root,
+                args.processes,
+                job_id=args.job,
+                lease_seconds=args.lease_seconds,
+                exit_when_idle=not args.keep_running,
+            )
+            print(f"Converted {converted} shard(s)")
+            return 0
+
+        if args.shard_command == "retry":
+            print(f"Reopened {queue.reset_failed(args.job)} shard(s)")
+            return 0
+
+        if args.shard_command == "merge":
+            result = queue.merge(args.job, remove=args.remove)
+            print(result.markdown_path)
+            print(result.text_path)
+            return 0
+
+        status = queue.status(args.job)
+        print(
+            f"{status.job_id}: {status.done}/{status.total_shards} done, "
+            f"{status.leased} leased, {status.pending} pending, {status.failed} failed"
+        )
+        return 0 if status.complete else 1
+    except (ConversionError, ShardError) as exc:
+        print(exc)
+        return 2
+
+
 if __name__ == "__main__":
+    # Frozen builds start conversion and service worker processes from this
+    # same executable.
+    multiprocessing.freeze_support()
     raise SystemExit(main())
@@ -1,20 +1,49 @@
-from roop_pdfmd.core.converter import ConversionError, Converter
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from roop_pdfmd.core.models import (
     AppSettings,
     ConversionResult,
     PageMode,
+    PageOutput,
     PageResult,
     ProgressEvent,
     TextQuality,
 )
 
+if TYPE_CHECKING:
+    from roop_pdfmd.core.converter import ConversionError, Converter
+
+# The converter pulls in PyMuPDF, Pillow and pytesseract, so it is only
+# imported when one of its names is first accessed.
+_LAZY_ATTRS = {
+    "ConversionError": "roop_pdfmd.core.converter",
+    "Converter": "roop_pdfmd.core.converter",
+}
+
 __all__ = [
     "AppSettings",
     "ConversionError",
     "ConversionResult",
     "Converter",
     "PageMode",
+    "PageOutput",
     "PageResult",
     "ProgressEvent",
     "TextQuality",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterator, TypeVar
+
+from roop_pdfmd.core.converter import Converter, PageCallback, PdfSource, ProgressCallback
+from roop_pdfmd.core.models import AppSettings, ConversionResult, PageOutput
+
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _ProducerFailure:
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+class AsyncConversionPool:
+    """Runs conversions from one event loop with bounded concurrency.
+
+    Conversions share one :class:`Converter`, each with its own cancellation
+    token, and run on the pool's worker threads; Tesseract itself runs as a
+    subprocess.
+    """
+
+    def __init__(self, max_concurrency: int = 2, prescan_pages: int = 3) -> None:
+        self._max_concurrency = max(max_concurrency, 1)
+        self._converter = Converter(prescan_pages=prescan_pages)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrency,
+            thread_name_prefix="roop-pdfmd-async",
+        )
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    async def convert(
+        self,
+        input_pdf: str | Path,
+        output_dir: str | Path,
+        settings: AppSettings,
+        progress_callback: ProgressCallback | None = None,
+        page_callback: PageCallback | None = None,
+    ) -> ConversionResult:
+        async with self._semaphore:
+            return await self._converter.aconvert(
+                input_pdf,
+                output_dir,
+                settings,
+                progress_callback=progress_callback,
+                page_callback=page_callback,
+                executor=self._executor,
+            )
+
+    async def iter_pages(
+        self,
+        source: PdfSource,
+        settings: AppSettings,
+    ) -> AsyncIterator[PageOutput]:
+        async with self._semaphore:
+            pages = self._converter.aiter_pages(source, settings, executor=self._executor)
+            try:
+                async for output in pages:
+                    yield output
+            finally:
+                await pages.aclose()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> AsyncConversionPool:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        self.close()
+
+
+def loop_callback(
+    loop: asyncio.AbstractEventLoop,
+    callback: Callable[..., Any] | None,
+) -> Callable[..., None] | None:
+    """Wrap ``callback`` so calls from worker threads run on ``loop``."""
+    if callback is None:
+        return None
+
+    return partial(_call_soon, loop, callback)
+
+
+async def run_cancellable(
+    func: Callable[[], T],
+    cancel: Callable[[], None],
+    executor: Executor | None = None,
+) -> T:
+    """Await ``func`` on ``executor``; task cancellation calls ``cancel`` and waits."""
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor, func)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        cancel()
+        await asyncio.wait([future])
+        raise
+
+
+async def iterate_in_thread(
+    factory: Callable[[], Iterator[T]],
+    cancel: Callable[[], None],
+    executor: Executor | None = None,
+) -> AsyncIterator[T]:
+    """Drive a blocking iterator on ``executor`` and yield its items as they arrive."""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+    put = partial(_call_soon, loop, queue.put_nowait)
+
+    def _produce() -> None:
+        try:
+            for item in factory():
+                put(item)
+        except BaseException as exc:
+            put(_ProducerFailure(exc))
+        finally:
+            put(_DONE)
+
+    future = loop.run_in_executor(executor, _produce)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, _ProducerFailure):
+                raise item.exc
+            yield item
+    finally:
+        if not future.done():
+            cancel()
+            await asyncio.wait([future])
+
+
+def _call_soon(loop: asyncio.AbstractEventLoop, callback: Callable[..., Any], *args: Any) -> None:
+    with suppress(RuntimeError):  # loop already closed
+        loop.call_soon_threadsafe(callback, *args)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import fitz
+from PIL import Image
+
+from roop_pdfmd.core.models import AppSettings, TextQuality
+
+
+# A 36 DPI grayscale thumbnail of a Letter page is ~120k pixels: cheap to
+# render even from a large embedded scan, yet one line of 6 pt text still
+# shows up as ink.
+BLANK_CHECK_DPI = 36
+# Levels darker than the paper tone that count as ink; show-through from the
+# other side of a duplex scan and tinted paper stay below this.
+_INK_DELTA = 48
+# Below this share of ink pixels a page is blank or near-blank (a stray page
+# number, punch holes, speckles).
+_MAX_INK_RATIO = 0.0005
+# Scanner edges and shadows along the border are not content.
+_MARGIN_RATIO = 0.05
+# Darker "paper" than this is a photo or a dark scan, never a blank page.
+_MIN_PAPER_LEVEL = 128
+
+
+def ink_ratio(gray: Image.Image) -> float:
+    """Share of pixels clearly darker than the dominant (paper) tone, margins ignored."""
+    width, height = gray.size
+    dx = int(width * _MARGIN_RATIO)
+    dy = int(height * _MARGIN_RATIO)
+    if width - 2 * dx > 0 and height - 2 * dy > 0:
+        gray = gray.crop((dx, dy, width - dx, height - dy))
+
+    histogram = gray.histogram()
+    total = sum(histogram)
+    if not total:
+        return 0.0
+    paper = max(range(256), key=histogram.__getitem__)
+    if paper < _MIN_PAPER_LEVEL:
+        return 1.0
+    return sum(histogram[: paper - _INK_DELTA]) / total
+
+
+def is_blank_page(page: fitz.Page, dpi: int = BLANK_CHECK_DPI) -> bool:
+    """Render ``page`` at a very low resolution and check it for ink."""
+    pixmap = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+    gray = Image.frombytes("L", (pixmap.width, pixmap.height), pixmap.samples)
+    return ink_ratio(gray) < _MAX_INK_RATIO
+
+
+def skip_as_blank(page: fitz.Page, quality: TextQuality, settings: AppSettings) -> bool:
+    """Whether a page without a usable text layer can skip OCR because it is blank.
+
+    Only pages whose text layer is within ``ocr_min_text_chars`` qualify, the
+    same cutoff below which the text layer is not trusted.
+    """
+    return (
+        settings.skip_blank_pages
+        and quality.non_whitespace_len <= settings.ocr_min_text_chars
+        and is_blank_page(page)
+    )
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import time
+from dataclasses import replace
+from typing import TYPE_CHECKING, Callable
+
+import fitz
+
+from roop_pdfmd.core.blank_page import skip_as_blank
+from roop_pdfmd.core.image_index import DocumentImageIndex
+from roop_pdfmd.core.models import AppSettings, CalibrationCandidate, CalibrationResult
+from roop_pdfmd.core.text_quality import detect_page_text_quality, page_needs_ocr
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+CALIBRATION_DPIS = (150, 200, 300)
+# (grayscale, autocontrast, threshold)
+PREPROCESS_VARIANTS = (
+    (True, False, False),
+    (True, True, False),
+    (True, True, True),
+)
+# Pages inspected per wanted sample while looking for pages that need OCR.
+_SCAN_FACTOR = 4
+
+PrepareImage = Callable[[fitz.Page, AppSettings], "Image.Image"]
+MeasureConfidence = Callable[["Image.Image"], float]
+
+
+def candidate_grid(settings: AppSettings) -> list[CalibrationCandidate]:
+    """The DPI x preprocessing grid, plus the configured settings if not already in it."""
+    configured = (
+        settings.ocr_dpi,
+        settings.ocr_preprocess_grayscale,
+        settings.ocr_preprocess_autocontrast,
+        settings.ocr_preprocess_threshold,
+    )
+    grid = [(dpi, *variant) for dpi in CALIBRATION_DPIS for variant in PREPROCESS_VARIANTS]
+    if configured not in grid:
+        grid.append(configured)
+    return [
+        CalibrationCandidate(
+            ocr_dpi=dpi,
+            ocr_preprocess_grayscale=grayscale,
+            ocr_preprocess_autocontrast=autocontrast,
+            ocr_preprocess_threshold=threshold,
+        )
+        for dpi, grayscale, autocontrast, threshold in grid
+    ]
+
+
+def apply_candidate(settings: AppSettings, candidate: CalibrationCandidate) -> AppSettings:
+    return replace(
+        settings,
+        ocr_dpi=candidate.ocr_dpi,
+        ocr_preprocess_grayscale=candidate.ocr_preprocess_grayscale,
+        ocr_preprocess_autocontrast=candidate.ocr_preprocess_autocontrast,
+        ocr_preprocess_threshold=candidate.ocr_preprocess_threshold,
+    )
+
+
+def sample_ocr_pages(
+    doc: fitz.Document,
+    settings: AppSettings,
+    image_index: DocumentImageIndex,
+    count: int,
+    pages: range | None = None,
+) -> list[int]:
+    """Pick up to ``count`` page indexes that need OCR, spread across ``pages``."""
+    pages = pages if pages is not None else range(doc.page_count)
+    count = max(count, 1)
+    probes = min(len(pages), count * _SCAN_FACTOR)
+    if probes <= 0:
+        return []
+
+    positions = sorted(
+        {round(step * (len(pages) - 1) / max(probes - 1, 1)) for step in range(probes)}
+    )
+    sampled: list[int] = []
+    for position in positions:
+        idx = pages[position]
+        page = doc.load_page(idx)
+        quality = detect_page_text_quality(page, image_index)
+        needs_ocr = page_needs_ocr(quality, settings)
+        if needs_ocr and not skip_as_blank(page, quality, settings):
+            sampled.append(idx)
+    if len(sampled) <= count:
+        return sampled
+    # Keep the spread when more pages qualified than needed.
+    return [sampled[round(step * (len(sampled) - 1) / max(count - 1, 1))] for step in range(count)]
+
+
+def choose_candidate(
+    candidates: list[CalibrationCandidate],
+    target_confidence: float,
+) -> tuple[CalibrationCandidate | None, bool]:
+    """Fastest candidate meeting the target, else the most confident one."""
+    if not candidates:
+        return None, False
+    passing = [candidate for candidate in candidates if candidate.confidence >= target_confidence]
+    if passing:
+        return min(passing, key=lambda candidate: candidate.seconds), True
+    return max(candidates, key=lambda candidate: candidate.confidence), False
+
+
+def run_calibration(
+    doc: fitz.Document,
+    settings: AppSettings,
+    image_index: DocumentImageIndex,
+    prepare_image: PrepareImage,
+    measure_confidence: MeasureConfidence,
+    pages: range | None = None,
+) -> CalibrationResult:
+    """OCR sampled pages with every grid candidate and pick the configuration to use.
+
+    A candidate's ``seconds`` covers rendering, preprocessing and OCR of all
+    sampled pages, and its ``confidence`` is the mean over those pages.
+    """
+    started_at = time.perf_counter()
+    sample = sample_ocr_pages(doc, settings, image_index, settings.ocr_calibration_pages, pages)
+    candidates = candidate_grid(settings) if sample else []
+
+    for candidate in candidates:
+        candidate_settings = apply_candidate(settings, candidate)
+        confidences = []
+        candidate_started = time.perf_counter()
+        for idx in sample:
+            image = prepare_image(doc.load_page(idx), candidate_settings)
+            confidences.append(measure_confidence(image))
+        candidate.seconds = time.perf_counter() - candidate_started
+        candidate.confidence = sum(confidences) / len(confidences)
+
+    chosen, met_target = choose_candidate(candidates, settings.ocr_calibration_target)
+    return CalibrationResult(
+        sample_pages=[idx + 1 for idx in sample],
+        target_confidence=settings.ocr_calibration_target,
+        chosen=chosen,
+        met_target=met_target,
+        seconds=time.perf_counter() - started_at,
+        candidates=candidates,
+    )
@@ -2,49 +2,218 @@ from __future__ import annotations
 
 import json
 import time
-from dataclasses import asdict
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from threading import Event
-from typing import Callable
+from threading import Event, Lock
+from typing import AsyncIterator, BinaryIO, Callable, Iterable, Iterator
 
 import fitz
-import pytesseract
 from PIL import Image
 
+from roop_pdfmd.core.blank_page import skip_as_blank
+from roop_pdfmd.core.calibration import apply_candidate, run_calibration
+from roop_pdfmd.core.cpu_budget import CpuBudget, default_cpu_budget, tesseract_env
+from roop_pdfmd.core.embedded_scan import extract_embedded_scan
+from roop_pdfmd.core.history import (
+    HistoryError,
+    RunHistory,
+    estimate_features,
+    page_area_sq_in,
+)
+from roop_pdfmd.core.image_index import DocumentImageIndex
 from roop_pdfmd.core.models import (
     AppSettings,
+    CalibrationResult,
     ConversionResult,
+    PageAttempt,
     PageMode,
+    PageOutput,
     PageResult,
     ProgressEvent,
 )
+from roop_pdfmd.core.ocr_backends import DEFAULT_OCR_BACKEND, OcrBackend, create_ocr_backend
 from roop_pdfmd.core.ocr_preprocess import preprocess_for_ocr
-from roop_pdfmd.core.text_quality import detect_page_text_quality, should_use_ocr, text_signature
-from roop_pdfmd.core.text_utils import dehyphenate_text
+from roop_pdfmd.core.page_index import join_page_blocks, page_index_path_for, write_page_index
+from roop_pdfmd.core.page_retry import RetryStep, render_banded, retry_steps
+from roop_pdfmd.core.presets import matching_preset
+from roop_pdfmd.core.resources import MemoryGuard, ResourceMonitor, thread_cpu_seconds
+from roop_pdfmd.core.search_index import (
+    DocumentIndexWriter,
+    SearchIndex,
+    SearchIndexError,
+)
+from roop_pdfmd.core.tesseract import OcrCancelledError, tesseract_version
+from roop_pdfmd.core.text_quality import (
+    detect_page_text_quality,
+    page_needs_ocr,
+    text_signature,
+)
+from roop_pdfmd.core.text_utils import TextPipeline
 from roop_pdfmd.utils.logging_utils import get_logger
-from roop_pdfmd.utils.paths import detect_tesseract_binary
+from roop_pdfmd.utils.paths import detect_tesseract_binary, resolve_output_relative_path
 
 
+PdfSource = str | Path | bytes | bytearray | memoryview | BinaryIO
 ProgressCallback = Callable[[ProgressEvent], None]
 PageCallback = Callable[[PageResult, str, str], None]
+TesseractResolver = Callable[[str], str]
+OcrBackendFactory = Callable[[str], OcrBackend]
 
 
 class ConversionError(Exception):
     """Raised when conversion cannot proceed."""
 
 
+@dataclass(slots=True)
+class _PendingPage:
+    """A page between classification and output; ``image`` is set while it awaits OCR."""
+
+    page_number: int
+    mode: PageMode
+    text: str = ""
+    error: str = ""
+    image: Image.Image | None = None
+    ocr_source: str = ""
+    ocr_threads: int = 0
+    ocr_batch_size: int = 0
+    ocr_dpi: int = 0
+    image_bytes: int = 0
+    page_area_sq_in: float = 0.0
+    duration_seconds: float = 0.0
+    classify_seconds: float = 0.0
+    render_seconds: float = 0.0
+    ocr_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rss_bytes: int = 0
+    python_peak_bytes: int = 0
+    attempts: list[PageAttempt] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Run:
+    """State of one conversion, so a single :class:`Converter` can run several at once."""
+
+    cancel_event: Event
+    ocr_backend: OcrBackend | None = None
+    tesseract_cmd: str = ""
+    tesseract_ready: bool = False
+    resources: ResourceMonitor = field(default_factory=ResourceMonitor)
+    resource_warnings: list[str] = field(default_factory=list)
+    peak_rss_bytes: int = 0
+    python_peak_bytes: int = 0
+    calibration: CalibrationResult | None = None
+    predicted_seconds: float = 0.0
+    assembled: bool = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+
+class _PageSignatures:
+    """Text signatures of the pages classified so far, to spot repeated short pages.
+
+    ``earlier`` supplies the signatures of pages before the first one converted
+    and is only called if a short page needs them, so a page-range run
+    classifies pages exactly like a full run without rescanning in most cases.
+    """
+
+    def __init__(self, earlier: Callable[[], Iterable[str]] | None = None) -> None:
+        self._seen: set[str] = set()
+        self._earlier = earlier
+        self._earlier_seen: set[str] | None = None
+
+    def seen(self, signature: str) -> bool:
+        if signature in self._seen:
+            return True
+        if self._earlier is None:
+            return False
+        if self._earlier_seen is None:
+            self._earlier_seen = set(self._earlier())
+        return signature in self._earlier_seen
+
+    def add(self, signature: str) -> None:
+        self._seen.add(signature)
+
+
+def _pixel_count(entries: list[_PendingPage]) -> int:
+    return sum(entry.image.width * entry.image.height for entry in entries if entry.image)
+
+
+def _error_text(exc: BaseException) -> str:
+    # MemoryError and friends often carry no message.
+    return str(exc) or type(exc).__name__
+
+
+def resolve_tesseract(tesseract_path: str = "") -> str:
+    """Find the Tesseract binary (configured path first) and check that it runs."""
+    tesseract_cmd = tesseract_path.strip() or detect_tesseract_binary()
+    if not tesseract_cmd:
+        raise ConversionError(
+            "Tesseract OCR is required for this document, but no Tesseract binary was found. "
+            "Install Tesseract (with English data) or set the binary path in Settings."
+        )
+
+    try:
+        version = tesseract_version(tesseract_cmd)
+    except Exception as exc:
+        raise ConversionError(
+            "Tesseract was found but could not be executed. "
+            "Check the configured path in Settings and ensure the process has execute permissions."
+        ) from exc
+
+    get_logger("converter").info("Using Tesseract command: %s (%s)", tesseract_cmd, version)
+    return tesseract_cmd
+
+
 class Converter:
-    def __init__(self, prescan_pages: int = 3) -> None:
-        self._cancel_event = Event()
+    """Converts PDFs to Markdown and text.
+
+    Per-conversion state lives in a run context rather than on the instance,
+    so one converter may run several conversions from different threads.
+    Each conversion can be given its own ``cancel_event``; :meth:`cancel`
+    stops every conversion currently running on this converter.
+    """
+
+    def __init__(
+        self,
+        prescan_pages: int = 3,
+        cpu_budget: CpuBudget | None = None,
+        tesseract_resolver: TesseractResolver | None = None,
+        ocr_backend_factory: OcrBackendFactory | None = None,
+    ) -> None:
+        self._cpu_budget = cpu_budget or default_cpu_budget
+        self._resolve_tesseract = tesseract_resolver or resolve_tesseract
+        self._ocr_backend_factory = ocr_backend_factory or create_ocr_backend
         self._logger = get_logger("converter")
-        self._tesseract_ready = False
         self._prescan_pages = max(prescan_pages, 1)
+        self._lock = Lock()
+        self._active: set[Event] = set()
 
     def cancel(self) -> None:
-        self._cancel_event.set()
+        """Cancel every conversion running on this converter."""
+        with self._lock:
+            active = list(self._active)
+        for cancel_event in active:
+            cancel_event.set()
 
     def is_cancelled(self) -> bool:
-        return self._cancel_event.is_set()
+        """Whether a running conversion on this converter has been cancelled."""
+        with self._lock:
+            return any(cancel_event.is_set() for cancel_event in self._active)
+
+    @contextmanager
+    def _running(self, cancel_event: Event | None = None) -> Iterator[_Run]:
+        run = _Run(cancel_event=cancel_event if cancel_event is not None else Event())
+        with self._lock:
+            self._active.add(run.cancel_event)
+        try:
+            yield run
+        finally:
+            with self._lock:
+                self._active.discard(run.cancel_event)
 
     def convert(
         self,
@@ -53,10 +222,15 @@ class Converter:
         settings: AppSettings,
         progress_callback: ProgressCallback | None = None,
         page_callback: PageCallback | None = None,
+        cancel_event: Event | None = None,
+        output_name: str = "",
     ) -> ConversionResult:
-        self._cancel_event.clear()
-        self._tesseract_ready = False
+        """Convert ``input_pdf`` and write the outputs to ``output_dir``.
 
+        Setting ``cancel_event`` stops this conversion after the current page;
+        the pages done so far are still written. Output files are named after
+        the input unless ``output_name`` gives another stem.
+        """
         input_pdf = Path(input_pdf).expanduser().resolve()
         output_dir = Path(output_dir).expanduser().resolve()
 
@@ -64,137 +238,239 @@ class Converter:
             raise ConversionError(f"Input PDF not found: {input_pdf}")
 
         output_dir.mkdir(parents=True, exist_ok=True)
-        markdown_path = output_dir / f"{input_pdf.stem}.md"
-        text_path = output_dir / f"{input_pdf.stem}.txt"
-        metadata_path = output_dir / f"{input_pdf.stem}.meta.json"
 
-        start_time = time.perf_counter()
-        page_results: list[PageResult] = []
-        errors: list[str] = []
-        md_blocks: list[str] = []
-        txt_blocks: list[str] = []
+        with self._running(cancel_event) as run:
+            start_time = time.perf_counter()
+            doc = self._open_document(input_pdf)
+            total_pages = doc.page_count
+            self._logger.info("Starting conversion | input=%s pages=%s", input_pdf, total_pages)
 
-        try:
-            doc = fitz.open(input_pdf)
-        except Exception as exc:  # pragma: no cover - backend-specific
-            raise ConversionError(f"Unable to open PDF: {exc}") from exc
+            try:
+                run.predicted_seconds = self._predict_seconds(
+                    doc, settings, resolve_output_relative_path(settings.history_path, output_dir)
+                )
+                return self._write_outputs(
+                    run,
+                    input_pdf,
+                    output_dir,
+                    settings,
+                    total_pages,
+                    self._iter_page_outputs(run, doc, settings, start_time),
+                    start_time,
+                    progress_callback,
+                    page_callback,
+                    output_name,
+                )
+            finally:
+                doc.close()
 
-        total_pages = doc.page_count
-        if total_pages <= 0:
-            doc.close()
-            raise ConversionError("PDF contains zero pages.")
+    def estimate(
+        self,
+        source: PdfSource,
+        settings: AppSettings,
+        history_path: str | Path,
+    ) -> float:
+        """Expected conversion seconds from the run history at ``history_path``.
 
-        self._logger.info("Starting conversion | input=%s pages=%s", input_pdf, total_pages)
+        0.0 when the history holds no runs yet or can't be read.
+        """
+        doc = self._open_document(self._validate_source(source))
+        try:
+            return self._predict_seconds(doc, settings, Path(history_path).expanduser())
+        finally:
+            doc.close()
 
-        if self._is_ocr_likely_needed(doc, settings):
-            self._prepare_tesseract(settings)
+    def assemble(
+        self,
+        input_pdf: str | Path,
+        output_dir: str | Path,
+        settings: AppSettings,
+        total_pages: int,
+        pages: Iterable[tuple[PageResult, str]],
+        progress_callback: ProgressCallback | None = None,
+        page_callback: PageCallback | None = None,
+        calibration: CalibrationResult | None = None,
+        cancel_event: Event | None = None,
+    ) -> ConversionResult:
+        """Write the outputs :meth:`convert` would from raw pages of :meth:`iter_page_range`.
 
-        extracted_pages = 0
-        ocr_pages = 0
-        processed_pages = 0
-        signature_counts: dict[str, int] = {}
+        ``pages`` must be in page order; text post-processing runs here, across
+        range boundaries, so the files match a single-process conversion.
+        ``calibration`` is recorded as if it had been run by this conversion.
+        The result is marked ``assembled``: its duration covers only this
+        merge, so run history and reports don't read it as a conversion time.
+        """
+        input_pdf = Path(input_pdf).expanduser().resolve()
+        output_dir = Path(output_dir).expanduser().resolve()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        start_time = time.perf_counter()
 
-        for idx in range(total_pages):
-            page_number = idx + 1
-            if self.is_cancelled():
-                self._logger.info("Cancellation requested at page %s", page_number)
-                break
+        def page_outputs(run: _Run) -> Iterator[tuple[PageOutput, ProgressEvent]]:
+            pipeline: TextPipeline[_PendingPage] = TextPipeline.from_settings(settings)
+            pending: list[_PendingPage] = []
+            for result, text in pages:
+                pending.append(
+                    _PendingPage(
+                        page_number=result.page_number,
+                        mode=result.mode,
+                        text=text,
+                        error=result.error,
+                        ocr_source=result.ocr_source,
+                        ocr_threads=result.ocr_threads,
+                        ocr_batch_size=result.ocr_batch_size,
+                        ocr_dpi=result.ocr_dpi,
+                        image_bytes=result.image_bytes,
+                        page_area_sq_in=result.page_area_sq_in,
+                        duration_seconds=result.duration_seconds,
+                        classify_seconds=result.classify_seconds,
+                        render_seconds=result.render_seconds,
+                        ocr_seconds=result.ocr_seconds,
+                        cpu_seconds=result.cpu_seconds,
+                        rss_bytes=result.rss_bytes,
+                        python_peak_bytes=result.python_peak_bytes,
+                        attempts=list(result.attempts),
+                    )
+                )
+                yield from self._drain_pending(run, pending, pipeline, total_pages, start_time)
+            yield from self._drain_pending(
+                run, pending, pipeline, total_pages, start_time, final=True
+            )
 
-            page = doc.load_page(idx)
-            page_start = time.perf_counter()
-            mode = PageMode.EXTRACT
-            error_msg = ""
-            text = ""
+        with self._running(cancel_event) as run:
+            run.calibration = calibration
+            run.assembled = True
+            return self._write_outputs(
+                run,
+                input_pdf,
+                output_dir,
+                settings,
+                total_pages,
+                page_outputs(run),
+                start_time,
+                progress_callback,
+                page_callback,
+            )
 
-            try:
-                extracted_text = page.get_text("text") or ""
-                quality = detect_page_text_quality(page)
-                page_sig = text_signature(extracted_text)
-                repeated_short = bool(
-                    page_sig
-                    and quality.non_whitespace_len < 120
-                    and signature_counts.get(page_sig, 0) >= 1
-                )
-                if page_sig:
-                    signature_counts[page_sig] = signature_counts.get(page_sig, 0) + 1
+    def _write_outputs(
+        self,
+        run: _Run,
+        input_pdf: Path,
+        output_dir: Path,
+        settings: AppSettings,
+        total_pages: int,
+        page_outputs: Iterable[tuple[PageOutput, ProgressEvent]],
+        start_time: float,
+        progress_callback: ProgressCallback | None,
+        page_callback: PageCallback | None,
+        output_name: str = "",
+    ) -> ConversionResult:
+        stem = output_name or input_pdf.stem
+        markdown_path = output_dir / f"{stem}.md"
+        text_path = output_dir / f"{stem}.txt"
+        metadata_path = output_dir / f"{stem}.meta.json"
 
-                should_ocr_page = (
-                    not settings.ocr_only_if_no_text_layer
-                    or should_use_ocr(quality, repeated_short_signature=repeated_short)
-                )
+        page_results: list[PageResult] = []
+        errors: list[str] = []
+        md_blocks: list[str] = []
+        txt_blocks: list[str] = []
+        extracted_pages = 0
+        ocr_pages = 0
+        blank_pages = 0
+        retried_pages = 0
+        processed_pages = 0
+        search_index = None
 
-                if should_ocr_page:
-                    mode = PageMode.OCR
-                    text = self._ocr_page(page, settings)
+        try:
+            search_index, search_writer = self._open_search_index(
+                settings, input_pdf, output_dir, markdown_path
+            )
+            for output, progress in page_outputs:
+                page_result = output.result
+                if page_result.error:
+                    errors.append(f"Page {page_result.page_number}: {page_result.error}")
+                elif page_result.mode == PageMode.OCR:
                     ocr_pages += 1
+                elif page_result.mode == PageMode.BLANK:
+                    blank_pages += 1
                 else:
-                    mode = PageMode.EXTRACT
-                    text = extracted_text
                     extracted_pages += 1
+                if page_result.attempts:
+                    retried_pages += 1
 
-                if settings.dehyphenate:
-                    text = dehyphenate_text(text)
-            except Exception as exc:  # pragma: no cover - error path
-                error_msg = str(exc)
-                errors.append(f"Page {page_number}: {error_msg}")
-                self._logger.exception("Page %s failed", page_number)
+                md_blocks.append(output.markdown_block)
+                txt_blocks.append(output.text_block)
+                page_results.append(page_result)
+                processed_pages += 1
+                if search_writer is not None and not page_result.error:
+                    search_writer.add_page(page_result.page_number, output.text)
 
-            block = self._format_page_block(page_number, text)
-            md_blocks.append(block)
-            txt_blocks.append(block)
+                if page_callback:
+                    page_callback(page_result, output.markdown_block, output.text_block)
+                if progress_callback:
+                    progress_callback(progress)
 
-            duration = time.perf_counter() - page_start
-            page_result = PageResult(
-                page_number=page_number,
-                mode=mode,
-                duration_seconds=duration,
-                text_length=len(text),
-                error=error_msg,
-            )
-            page_results.append(page_result)
-            processed_pages += 1
-
-            elapsed = time.perf_counter() - start_time
-            eta = (elapsed / page_number) * max(total_pages - page_number, 0)
-            progress = ProgressEvent(
-                current_page=page_number,
-                total_pages=total_pages,
-                mode=mode,
-                elapsed_seconds=elapsed,
-                eta_seconds=eta,
-            )
-
-            if page_callback:
-                page_callback(page_result, block, block)
-            if progress_callback:
-                progress_callback(progress)
+            if search_writer is not None:
+                search_writer.finish()
+        except SearchIndexError as exc:
+            raise ConversionError(str(exc)) from exc
+        finally:
+            if search_index is not None:
+                search_index.close()
 
-        doc.close()
+        # Written as bytes so the page index offsets hold on every platform.
+        markdown_content, markdown_spans = join_page_blocks(md_blocks)
+        text_content, text_spans = join_page_blocks(txt_blocks)
+        markdown_bytes = markdown_content.encode("utf-8")
+        text_bytes = text_content.encode("utf-8")
+        markdown_path.write_bytes(markdown_bytes)
+        text_path.write_bytes(text_bytes)
 
-        markdown_content = "\n".join(md_blocks).strip() + "\n"
-        text_content = "\n".join(txt_blocks).strip() + "\n"
-        markdown_path.write_text(markdown_content, encoding="utf-8")
-        text_path.write_text(text_content, encoding="utf-8")
+        page_index_path = None
+        if settings.write_page_index:
+            page_index_path = page_index_path_for(markdown_path)
+            write_page_index(
+                page_index_path,
+                [page.page_number for page in page_results],
+                markdown_spans,
+                text_spans,
+                len(markdown_bytes),
+                len(text_bytes),
+            )
 
         duration_seconds = time.perf_counter() - start_time
-        cancelled = self.is_cancelled()
+        cancelled = run.cancelled
+        self._record_resources(run)
         result = ConversionResult(
             input_pdf=input_pdf,
             output_dir=output_dir,
             markdown_path=markdown_path,
             text_path=text_path,
             metadata_path=metadata_path,
+            page_index_path=page_index_path,
             total_pages=total_pages,
             processed_pages=processed_pages,
             extracted_pages=extracted_pages,
             ocr_pages=ocr_pages,
+            blank_pages=blank_pages,
+            retried_pages=retried_pages,
+            preset=matching_preset(settings),
+            assembled=run.assembled,
             cancelled=cancelled,
             duration_seconds=duration_seconds,
+            ocr_backend=settings.ocr_backend or DEFAULT_OCR_BACKEND,
+            cpu_seconds=sum(page.cpu_seconds for page in page_results),
+            process_peak_rss_bytes=run.peak_rss_bytes,
+            process_python_peak_bytes=run.python_peak_bytes,
+            peak_image_bytes=max((page.image_bytes for page in page_results), default=0),
+            resource_warnings=list(run.resource_warnings),
+            calibration=run.calibration,
+            predicted_seconds=run.predicted_seconds,
             errors=errors,
             pages=page_results,
         )
 
         self._write_metadata(result)
+        self._record_history(result, settings)
         self._logger.info(
             "Conversion completed | processed=%s cancelled=%s errors=%s",
             processed_pages,
@@ -203,18 +479,718 @@ class Converter:
         )
         return result
 
+    async def aconvert(
+        self,
+        input_pdf: str | Path,
+        output_dir: str | Path,
+        settings: AppSettings,
+        progress_callback: ProgressCallback | None = None,
+        page_callback: PageCallback | None = None,
+        executor: Executor | None = None,
+    ) -> ConversionResult:
+        """Awaitable :meth:`convert`; cancelling the awaiting task cancels the run.
+
+        Callbacks are invoked on the event loop thread.
+        """
+        import asyncio
+
+        from roop_pdfmd.core.async_api import loop_callback, run_cancellable
+
+        loop = asyncio.get_running_loop()
+        cancel_event = Event()
+        return await run_cancellable(
+            lambda: self.convert(
+                input_pdf,
+                output_dir,
+                settings,
+                progress_callback=loop_callback(loop, progress_callback),
+                page_callback=loop_callback(loop, page_callback),
+                cancel_event=cancel_event,
+            ),
+            cancel_event.set,
+            executor,
+        )
+
+    def aiter_pages(
+        self,
+        source: PdfSource,
+        settings: AppSettings,
+        executor: Executor | None = None,
+    ) -> AsyncIterator[PageOutput]:
+        """Async counterpart of :meth:`iter_pages`."""
+        from roop_pdfmd.core.async_api import iterate_in_thread
+
+        source = self._validate_source(source)
+        cancel_event = Event()
+        return iterate_in_thread(
+            lambda: self._iter_source_pages(source, settings, cancel_event=cancel_event),
+            cancel_event.set,
+            executor,
+        )
+
+    def iter_pages(
+        self,
+        source: PdfSource,
+        settings: AppSettings,
+        cancel_event: Event | None = None,
+    ) -> Iterator[PageOutput]:
+        """Convert ``source`` lazily, yielding one :class:`PageOutput` per page.
+
+        ``source`` may be a path or the PDF itself as bytes or a binary file
+        object. Nothing is written to disk; persisting the pages is up to the
+        caller. Closing the generator early releases the document.
+        """
+        source = self._validate_source(source)
+        return self._iter_source_pages(source, settings, cancel_event=cancel_event)
+
+    def iter_page_range(
+        self,
+        source: PdfSource,
+        settings: AppSettings,
+        first_page: int,
+        last_page: int,
+        cancel_event: Event | None = None,
+    ) -> Iterator[PageOutput]:
+        """Convert pages ``first_page``..``last_page`` (1-based, inclusive) lazily.
+
+        Pages are classified as they would be in a full run, but their text is
+        not post-processed: dehyphenation and header/footer stripping look
+        across page boundaries, so they run when the ranges are put back
+        together with :meth:`assemble`.
+        """
+        source = self._validate_source(source)
+        return self._iter_source_pages(
+            source, settings, (first_page, last_page), cancel_event=cancel_event
+        )
+
+    def _iter_source_pages(
+        self,
+        source: Path | bytes,
+        settings: AppSettings,
+        page_range: tuple[int, int] | None = None,
+        cancel_event: Event | None = None,
+    ) -> Iterator[PageOutput]:
+        with self._running(cancel_event) as run:
+            yield from self._iter_run_pages(run, source, settings, page_range)
+
+    def _iter_run_pages(
+        self,
+        run: _Run,
+        source: Path | bytes,
+        settings: AppSettings,
+        page_range: tuple[int, int] | None,
+    ) -> Iterator[PageOutput]:
+        doc = self._open_document(source)
+        try:
+            pages = None
+            signatures = None
+            pipeline = None
+            if page_range is not None:
+                first_page, last_page = page_range
+                if not 1 <= first_page <= last_page <= doc.page_count:
+                    raise ConversionError(
+                        f"Invalid page range {first_page}-{last_page} "
+                        f"for a {doc.page_count}-page PDF."
+                    )
+                pages = range(first_page - 1, last_page)
+                signatures = _PageSignatures(
+                    lambda: (
+                        text_signature(doc.load_page(idx).get_text("text") or "")
+                        for idx in range(first_page - 1)
+                    )
+                )
+                pipeline = TextPipeline()
+
+            for output, _ in self._iter_page_outputs(
+                run, doc, settings, time.perf_counter(), pages, signatures, pipeline
+            ):
+                yield output
+        finally:
+            doc.close()
+
+    @staticmethod
+    def _validate_source(source: PdfSource) -> Path | bytes:
+        if isinstance(source, (str, Path)):
+            input_pdf = Path(source).expanduser().resolve()
+            if not input_pdf.exists() or not input_pdf.is_file():
+                raise ConversionError(f"Input PDF not found: {input_pdf}")
+            return input_pdf
+
+        data = source.read() if hasattr(source, "read") else source
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise ConversionError(f"Unsupported PDF source: {type(source).__name__}")
+        if not data:
+            raise ConversionError("Input PDF is empty.")
+        return bytes(data)
+
+    def _open_document(self, source: Path | bytes) -> fitz.Document:
+        try:
+            if isinstance(source, bytes):
+                doc = fitz.open(stream=source, filetype="pdf")
+            else:
+                doc = fitz.open(source)
+        except Exception as exc:  # pragma: no cover - backend-specific
+            raise ConversionError(f"Unable to open PDF: {exc}") from exc
+
+        if doc.page_count <= 0:
+            doc.close()
+            raise ConversionError("PDF contains zero pages.")
+        return doc
+
+    def _iter_page_outputs(
+        self,
+        run: _Run,
+        doc: fitz.Document,
+        settings: AppSettings,
+        start_time: float,
+        pages: range | None = None,
+        signatures: _PageSignatures | None = None,
+        pipeline: TextPipeline[_PendingPage] | None = None,
+    ) -> Iterator[tuple[PageOutput, ProgressEvent]]:
+        run.resources = ResourceMonitor(settings.track_python_memory)
+        run.resources.start()
+        try:
+            yield from self._convert_pages(
+                run, doc, settings, start_time, pages, signatures, pipeline
+            )
+        finally:
+            run.resources.stop()
+
+    def _convert_pages(
+        self,
+        run: _Run,
+        doc: fitz.Document,
+        settings: AppSettings,
+        start_time: float,
+        pages: range | None,
+        signatures: _PageSignatures | None,
+        pipeline: TextPipeline[_PendingPage] | None,
+    ) -> Iterator[tuple[PageOutput, ProgressEvent]]:
+        total_pages = doc.page_count
+        pages = pages if pages is not None else range(total_pages)
+        run.ocr_backend = self._create_ocr_backend(settings)
+        image_index = DocumentImageIndex(doc)
+        if self._is_ocr_likely_needed(doc, settings, image_index, pages.start):
+            self._prepare_tesseract(run, settings)
+        if settings.ocr_calibrate:
+            settings = self._calibrate(run, doc, settings, image_index, pages)
+
+        signatures = signatures if signatures is not None else _PageSignatures()
+        batch_size = max(settings.ocr_batch_size, 1)
+        max_batch_pixels = max(settings.ocr_batch_max_megapixels, 1) * 1_000_000
+        pending: list[_PendingPage] = []
+        if pipeline is None:
+            pipeline = TextPipeline.from_settings(settings)
+        memory_guard = MemoryGuard(settings.memory_soft_limit_mb, settings.memory_limit_action)
+
+        for idx in pages:
+            page_number = idx + 1
+            if run.cancelled:
+                self._logger.info("Cancellation requested at page %s", page_number)
+                break
+
+            page_settings, warning = memory_guard.check(settings)
+            if warning:
+                self._logger.warning("%s (page %s)", warning, page_number)
+                run.resource_warnings.append(f"Page {page_number}: {warning}")
+            degraded = page_settings is not settings
+            if degraded:
+                settings = page_settings
+                batch_size = max(settings.ocr_batch_size, 1)
+
+            queued = [item for item in pending if item.image is not None]
+            try:
+                # Release queued page images before rendering more under pressure.
+                if degraded and queued:
+                    self._recognize_pending(run, queued, settings)
+                    queued = []
+
+                entry = self._start_page(
+                    run, doc.load_page(idx), page_number, settings, image_index, signatures
+                )
+                # Recognise what is queued first if this page would push the
+                # batch past its memory cap.
+                if (
+                    entry.image is not None
+                    and queued
+                    and _pixel_count(queued) + _pixel_count([entry]) > max_batch_pixels
+                ):
+                    self._recognize_pending(run, queued, settings)
+                    queued = []
+
+                pending.append(entry)
+                if entry.image is not None:
+                    queued.append(entry)
+                if len(queued) >= batch_size:
+                    self._recognize_pending(run, queued, settings)
+                self._retry_failed(run, doc, pending, settings, image_index)
+            except OcrCancelledError:
+                self._logger.info("OCR aborted by cancellation at page %s", page_number)
+                yield from self._drain_pending(
+                    run, pending, pipeline, total_pages, start_time, final=True
+                )
+                return
+
+            yield from self._drain_pending(run, pending, pipeline, total_pages, start_time)
+
+        queued = [item for item in pending if item.image is not None]
+        if queued and not run.cancelled:
+            try:
+                self._recognize_pending(run, queued, settings)
+                self._retry_failed(run, doc, pending, settings, image_index)
+            except OcrCancelledError:
+                self._logger.info("OCR aborted by cancellation")
+        yield from self._drain_pending(
+            run, pending, pipeline, total_pages, start_time, final=True
+        )
+
+    def calibrate(
+        self,
+        source: PdfSource,
+        settings: AppSettings,
+        cancel_event: Event | None = None,
+    ) -> CalibrationResult | None:
+        """Run only the OCR calibration pass of :meth:`convert` on ``source``.
+
+        Returns None when the OCR engine cannot report confidence or calibration fails.
+        """
+        doc = self._open_document(self._validate_source(source))
+        try:
+            with self._running(cancel_event) as run:
+                run.ocr_backend = self._create_ocr_backend(settings)
+                self._calibrate(run, doc, settings, DocumentImageIndex(doc), range(doc.page_count))
+                return run.calibration
+        finally:
+            doc.close()
+
+    def _calibrate(
+        self,
+        run: _Run,
+        doc: fitz.Document,
+        settings: AppSettings,
+        image_index: DocumentImageIndex,
+        pages: range,
+    ) -> AppSettings:
+        """Pick DPI and preprocessing from sampled pages; returns the settings to convert with."""
+        backend = run.ocr_backend or self._create_ocr_backend(settings)
+
+        def measure(image: Image.Image) -> float:
+            with self._cpu_budget.lease(settings.ocr_thread_policy) as threads:
+                return backend.image_confidence(
+                    image,
+                    run.tesseract_cmd,
+                    lang="eng",
+                    cancel_event=run.cancel_event,
+                    env=tesseract_env(threads),
+                    psm=settings.ocr_psm,
+                )
+
+        try:
+            calibration = run_calibration(
+                doc,
+                settings,
+                image_index,
+                lambda page, candidate: self._prepare_ocr_image(
+                    run, page, candidate, image_index
+                )[0],
+                measure,
+                pages,
+            )
+        except OcrCancelledError:
+            self._logger.info("Calibration aborted by cancellation")
+            return settings
+        except ConversionError:
+            raise
+        except Exception as exc:
+            self._logger.warning("OCR calibration failed (%s); keeping configured settings", exc)
+            return settings
+
+        run.calibration = calibration
+        chosen = calibration.chosen
+        if chosen is None:
+            self._logger.info("OCR calibration skipped: no sampled page needs OCR")
+            return settings
+
+        self._logger.info(
+            "OCR calibration | pages=%s dpi=%s grayscale=%s autocontrast=%s threshold=%s "
+            "confidence=%.1f target_met=%s seconds=%.2f",
+            calibration.sample_pages,
+            chosen.ocr_dpi,
+            chosen.ocr_preprocess_grayscale,
+            chosen.ocr_preprocess_autocontrast,
+            chosen.ocr_preprocess_threshold,
+            chosen.confidence,
+            calibration.met_target,
+            calibration.seconds,
+        )
+        return apply_candidate(settings, chosen)
+
+    def _start_page(
+        self,
+        run: _Run,
+        page: fitz.Page,
+        page_number: int,
+        settings: AppSettings,
+        image_index: DocumentImageIndex,
+        signatures: _PageSignatures,
+    ) -> _PendingPage:
+        """Classify a page and either extract its text or prepare its OCR image."""
+        started_at = time.perf_counter()
+        cpu_started = thread_cpu_seconds()
+        entry = _PendingPage(
+            page_number=page_number,
+            mode=PageMode.EXTRACT,
+            page_area_sq_in=page_area_sq_in(page),
+        )
+
+        try:
+            extracted_text = page.get_text("text") or ""
+            quality = detect_page_text_quality(page, image_index)
+            page_sig = text_signature(extracted_text)
+            repeated_short = bool(
+                page_sig and quality.non_whitespace_len < 120 and signatures.seen(page_sig)
+            )
+            if page_sig:
+                signatures.add(page_sig)
+
+            should_ocr_page = page_needs_ocr(
+                quality, settings, repeated_short_signature=repeated_short
+            )
+            if should_ocr_page and skip_as_blank(page, quality, settings):
+                entry.mode = PageMode.BLANK
+                should_ocr_page = False
+            entry.classify_seconds = time.perf_counter() - started_at
+
+            if should_ocr_page:
+                entry.mode = PageMode.OCR
+                entry.ocr_dpi = settings.ocr_dpi
+                entry.image, entry.ocr_source, entry.image_bytes = self._prepare_ocr_image(
+                    run, page, settings, image_index
+                )
+                entry.render_seconds = time.perf_counter() - started_at - entry.classify_seconds
+            elif entry.mode == PageMode.EXTRACT:
+                entry.text = extracted_text
+        except Exception as exc:
+            entry.image = None
+            entry.error = _error_text(exc)
+            self._logger.exception("Page %s failed", page_number)
+
+        entry.duration_seconds = time.perf_counter() - started_at
+        entry.cpu_seconds = thread_cpu_seconds() - cpu_started
+        if entry.image is None:
+            self._record_resources(run, [entry])
+        return entry
+
+    def _record_resources(self, run: _Run, entries: Iterable[_PendingPage] = ()) -> None:
+        sample = run.resources.sample()
+        run.peak_rss_bytes = max(run.peak_rss_bytes, sample.rss_bytes)
+        run.python_peak_bytes = max(run.python_peak_bytes, sample.python_peak_bytes)
+        for entry in entries:
+            entry.rss_bytes = sample.rss_bytes
+            entry.python_peak_bytes = sample.python_peak_bytes
+
+    def _recognize_pending(
+        self,
+        run: _Run,
+        entries: list[_PendingPage],
+        settings: AppSettings,
+    ) -> None:
+        """OCR the queued page images, in one engine run when there are several."""
+        backend = run.ocr_backend or self._create_ocr_backend(settings)
+        images = [entry.image for entry in entries if entry.image is not None]
+        started_at = time.perf_counter()
+        cpu_started = thread_cpu_seconds()
+
+        with self._cpu_budget.lease(settings.ocr_thread_policy) as threads:
+            env = tesseract_env(threads)
+            try:
+                texts = backend.images_to_strings(
+                    images,
+                    run.tesseract_cmd,
+                    lang="eng",
+                    cancel_event=run.cancel_event,
+                    env=env,
+                    psm=settings.ocr_psm,
+                )
+                errors = [""] * len(entries)
+            except OcrCancelledError:
+                raise
+            except Exception as exc:
+                if len(entries) == 1:
+                    texts, errors = [""], [_error_text(exc)]
+                    self._logger.exception("Page %s failed", entries[0].page_number)
+                else:
+                    # Re-run page by page so a failure is pinned to its page.
+                    self._logger.warning(
+                        "Batched OCR of pages %s-%s failed (%s); retrying page by page",
+                        entries[0].page_number,
+                        entries[-1].page_number,
+                        exc,
+                    )
+                    texts, errors = self._recognize_each(
+                        run, backend, entries, env, settings.ocr_psm
+                    )
+
+        share = (time.perf_counter() - started_at) / len(entries)
+        cpu_share = (thread_cpu_seconds() - cpu_started) / len(entries)
+        for entry, text, error in zip(entries, texts, errors):
+            entry.text = text or ""
+            entry.error = error
+            entry.image = None
+            entry.ocr_threads = threads
+            entry.ocr_batch_size = len(entries)
+            entry.duration_seconds += share
+            entry.ocr_seconds += share
+            entry.cpu_seconds += cpu_share
+        self._record_resources(run, entries)
+
+    def _recognize_each(
+        self,
+        run: _Run,
+        backend: OcrBackend,
+        entries: list[_PendingPage],
+        env: dict[str, str],
+        psm: int,
+    ) -> tuple[list[str], list[str]]:
+        texts: list[str] = []
+        errors: list[str] = []
+        for entry in entries:
+            try:
+                texts.append(
+                    backend.image_to_string(
+                        entry.image,
+                        run.tesseract_cmd,
+                        lang="eng",
+                        cancel_event=run.cancel_event,
+                        env=env,
+                        psm=psm,
+                    )
+                )
+                errors.append("")
+            except OcrCancelledError:
+                raise
+            except Exception as exc:
+                texts.append("")
+                errors.append(_error_text(exc))
+                self._logger.exception("Page %s failed", entry.page_number)
+        return texts, errors
+
+    def _retry_failed(
+        self,
+        run: _Run,
+        doc: fitz.Document,
+        entries: list[_PendingPage],
+        settings: AppSettings,
+        image_index: DocumentImageIndex,
+    ) -> None:
+        """Re-attempt failed pages with cheaper settings, up to ``page_retry_attempts`` times."""
+        steps = retry_steps(settings, settings.page_retry_attempts)
+        if not steps:
+            return
+        for entry in entries:
+            if not entry.error or entry.image is not None or entry.attempts:
+                continue
+            entry.attempts.append(
+                PageAttempt(
+                    ocr_dpi=entry.ocr_dpi or settings.ocr_dpi,
+                    grayscale=settings.ocr_preprocess_grayscale,
+                    banded=False,
+                    seconds=entry.duration_seconds,
+                    error=entry.error,
+                )
+            )
+            page = doc.load_page(entry.page_number - 1)
+            for step in steps:
+                if run.cancelled:
+                    return
+                if self._retry_page(run, page, entry, step, image_index):
+                    break
+            self._record_resources(run, [entry])
+
+    def _retry_page(
+        self,
+        run: _Run,
+        page: fitz.Page,
+        entry: _PendingPage,
+        step: RetryStep,
+        image_index: DocumentImageIndex,
+    ) -> bool:
+        settings = step.settings
+        started_at = time.perf_counter()
+        cpu_started = thread_cpu_seconds()
+        error = ""
+        try:
+            if step.banded:
+                self._prepare_tesseract(run, settings)
+                image = preprocess_for_ocr(render_banded(page, settings.ocr_dpi), settings)
+                source, image_bytes = "banded", image.width * image.height
+            else:
+                image, source, image_bytes = self._prepare_ocr_image(
+                    run, page, settings, image_index
+                )
+            render_seconds = time.perf_counter() - started_at
+            backend = run.ocr_backend or self._create_ocr_backend(settings)
+            with self._cpu_budget.lease(settings.ocr_thread_policy) as threads:
+                text = backend.image_to_string(
+                    image,
+                    run.tesseract_cmd,
+                    lang="eng",
+                    cancel_event=run.cancel_event,
+                    env=tesseract_env(threads),
+                    psm=settings.ocr_psm,
+                )
+        except OcrCancelledError:
+            raise
+        except Exception as exc:
+            error = _error_text(exc)
+
+        seconds = time.perf_counter() - started_at
+        entry.attempts.append(
+            PageAttempt(
+                ocr_dpi=settings.ocr_dpi,
+                grayscale=True,
+                banded=step.banded,
+                seconds=seconds,
+                error=error,
+            )
+        )
+        entry.duration_seconds += seconds
+        entry.cpu_seconds += thread_cpu_seconds() - cpu_started
+        if error:
+            self._logger.warning(
+                "Retry of page %s at %s DPI failed: %s", entry.page_number, settings.ocr_dpi, error
+            )
+            return False
+
+        self._logger.info(
+            "Page %s recovered at %s DPI%s",
+            entry.page_number,
+            settings.ocr_dpi,
+            " (banded)" if step.banded else "",
+        )
+        entry.mode = PageMode.OCR
+        entry.text = text or ""
+        entry.error = ""
+        entry.ocr_source = source
+        entry.ocr_threads = threads
+        entry.ocr_batch_size = 1
+        entry.ocr_dpi = settings.ocr_dpi
+        entry.image_bytes = image_bytes
+        entry.render_seconds += render_seconds
+        entry.ocr_seconds += seconds - render_seconds
+        return True
+
+    def _drain_pending(
+        self,
+        run: _Run,
+        pending: list[_PendingPage],
+        pipeline: TextPipeline,
+        total_pages: int,
+        start_time: float,
+        final: bool = False,
+    ) -> Iterator[tuple[PageOutput, ProgressEvent]]:
+        """Yield finished pages from the front of ``pending``, keeping page order.
+
+        Text goes through ``pipeline``, which may hold a page back until the
+        next one arrives; ``final`` releases it.
+        """
+        ready: list[tuple[_PendingPage, str]] = []
+        while pending and pending[0].image is None:
+            entry = pending.pop(0)
+            ready.extend(pipeline.push(entry, entry.text))
+        if final:
+            ready.extend(pipeline.finish())
+
+        for entry, text in ready:
+            block = self._format_page_block(entry.page_number, text)
+            page_result = PageResult(
+                page_number=entry.page_number,
+                mode=entry.mode,
+                duration_seconds=entry.duration_seconds,
+                text_length=len(text),
+                error=entry.error,
+                ocr_source=entry.ocr_source,
+                ocr_threads=entry.ocr_threads,
+                ocr_batch_size=entry.ocr_batch_size,
+                ocr_dpi=entry.ocr_dpi,
+                image_bytes=entry.image_bytes,
+                page_area_sq_in=entry.page_area_sq_in,
+                classify_seconds=entry.classify_seconds,
+                render_seconds=entry.render_seconds,
+                ocr_seconds=entry.ocr_seconds,
+                cpu_seconds=entry.cpu_seconds,
+                rss_bytes=entry.rss_bytes,
+                python_peak_bytes=entry.python_peak_bytes,
+                attempts=entry.attempts,
+            )
+
+            elapsed = time.perf_counter() - start_time
+            eta = (elapsed / entry.page_number) * max(total_pages - entry.page_number, 0)
+            if run.predicted_seconds > 0:
+                # Trust the history-based estimate early and the observed rate later.
+                weight = entry.page_number / max(total_pages, 1)
+                eta = weight * eta + (1 - weight) * max(run.predicted_seconds - elapsed, 0.0)
+            progress = ProgressEvent(
+                current_page=entry.page_number,
+                total_pages=total_pages,
+                mode=entry.mode,
+                elapsed_seconds=elapsed,
+                eta_seconds=eta,
+            )
+
+            output = PageOutput(
+                result=page_result,
+                text=text,
+                markdown_block=block,
+                text_block=block,
+            )
+            yield output, progress
+
+    def _open_search_index(
+        self,
+        settings: AppSettings,
+        input_pdf: Path,
+        output_dir: Path,
+        markdown_path: Path,
+    ) -> tuple[SearchIndex | None, DocumentIndexWriter | None]:
+        index_path = resolve_output_relative_path(settings.search_index_path, output_dir)
+        if index_path is None:
+            return None, None
+
+        search_index = SearchIndex(index_path)
+        try:
+            writer = search_index.writer(input_pdf, markdown_path)
+        except Exception:
+            search_index.close()
+            raise
+        self._logger.info("Indexing pages for search | index=%s", index_path)
+        return search_index, writer
+
     def _write_metadata(self, result: ConversionResult) -> None:
         payload = {
             "input_pdf": str(result.input_pdf),
             "output_dir": str(result.output_dir),
             "markdown_path": str(result.markdown_path),
             "text_path": str(result.text_path),
+            "page_index_path": str(result.page_index_path) if result.page_index_path else None,
             "total_pages": result.total_pages,
             "processed_pages": result.processed_pages,
             "extracted_pages": result.extracted_pages,
             "ocr_pages": result.ocr_pages,
+            "blank_pages": result.blank_pages,
+            "retried_pages": result.retried_pages,
             "cancelled": result.cancelled,
             "duration_seconds": result.duration_seconds,
+            "ocr_backend": result.ocr_backend,
+            "preset": result.preset or "custom",
+            "assembled": result.assembled,
+            "cpu_seconds": result.cpu_seconds,
+            "process_peak_rss_bytes": result.process_peak_rss_bytes,
+            "process_python_peak_bytes": result.process_python_peak_bytes,
+            "peak_image_bytes": result.peak_image_bytes,
+            "resource_warnings": result.resource_warnings,
+            "calibration": asdict(result.calibration) if result.calibration else None,
+            "predicted_seconds": result.predicted_seconds,
             "errors": result.errors,
             "pages": [
                 {
@@ -226,16 +1202,55 @@ class Converter:
         }
         result.metadata_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
-    def _is_ocr_likely_needed(self, doc: fitz.Document, settings: AppSettings) -> bool:
+    def _predict_seconds(
+        self,
+        doc: fitz.Document,
+        settings: AppSettings,
+        history_path: Path | None,
+    ) -> float:
+        if history_path is None:
+            return 0.0
+        try:
+            with RunHistory(history_path) as history:
+                model = history.model()
+            if not model.runs:
+                return 0.0
+            predicted = model.predict(estimate_features(doc, settings))
+        except HistoryError as exc:
+            self._logger.warning("Run history unavailable, no estimate: %s", exc)
+            return 0.0
+        self._logger.info(
+            "Estimated conversion time %.1fs from %s earlier run(s)", predicted, model.runs
+        )
+        return predicted
+
+    def _record_history(self, result: ConversionResult, settings: AppSettings) -> None:
+        history_path = resolve_output_relative_path(settings.history_path, result.output_dir)
+        if history_path is None:
+            return
+        try:
+            with RunHistory(history_path) as history:
+                history.ingest(result.metadata_path)
+        except HistoryError as exc:
+            # History feeds estimates only; the conversion itself succeeded.
+            self._logger.warning("Could not record run history: %s", exc)
+
+    def _is_ocr_likely_needed(
+        self,
+        doc: fitz.Document,
+        settings: AppSettings,
+        image_index: DocumentImageIndex,
+        first_idx: int = 0,
+    ) -> bool:
         if not settings.ocr_only_if_no_text_layer:
             return True
 
         signature_counts: dict[str, int] = {}
-        scan_pages = min(doc.page_count, self._prescan_pages)
+        scan_end = min(doc.page_count, first_idx + self._prescan_pages)
 
-        for idx in range(scan_pages):
+        for idx in range(first_idx, scan_end):
             page = doc.load_page(idx)
-            quality = detect_page_text_quality(page)
+            quality = detect_page_text_quality(page, image_index)
             extracted_text = page.get_text("text") or ""
             page_sig = text_signature(extracted_text)
 
@@ -247,50 +1262,62 @@ class Converter:
             if page_sig:
                 signature_counts[page_sig] = signature_counts.get(page_sig, 0) + 1
 
-            if should_use_ocr(quality, repeated_short_signature=repeated_short):
+            if page_needs_ocr(
+                quality, settings, repeated_short_signature=repeated_short
+            ) and not skip_as_blank(page, quality, settings):
                 self._logger.info("OCR likely needed based on pre-scan page %s", idx + 1)
                 return True
 
         self._logger.info("OCR not needed for pre-scan pages")
         return False
 
-    def _prepare_tesseract(self, settings: AppSettings) -> None:
-        if self._tesseract_ready:
-            return
+    def _create_ocr_backend(self, settings: AppSettings) -> OcrBackend:
+        try:
+            backend = self._ocr_backend_factory(settings.ocr_backend)
+        except ValueError as exc:
+            raise ConversionError(str(exc)) from exc
+        self._logger.info("Using OCR backend: %s", backend.name)
+        return backend
 
-        tesseract_cmd = settings.tesseract_path.strip() or detect_tesseract_binary()
-        if not tesseract_cmd:
-            raise ConversionError(
-                "Tesseract OCR is required for this document, but no Tesseract binary was found. "
-                "Install Tesseract (with English data) or set the binary path in Settings."
-            )
+    def _prepare_tesseract(self, run: _Run, settings: AppSettings) -> None:
+        if run.tesseract_ready:
+            return
+        if run.ocr_backend is not None and not run.ocr_backend.requires_tesseract_binary:
+            run.tesseract_ready = True
+            return
 
-        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
-        try:
-            _ = pytesseract.get_tesseract_version()
-        except Exception as exc:
-            raise ConversionError(
-                "Tesseract was found but could not be executed. "
-                "Check the configured path in Settings and ensure the process has execute permissions."
-            ) from exc
+        run.tesseract_cmd = self._resolve_tesseract(settings.tesseract_path)
+        run.tesseract_ready = True
 
-        self._logger.info("Using Tesseract command: %s", tesseract_cmd)
-        self._tesseract_ready = True
+    def _prepare_ocr_image(
+        self,
+        run: _Run,
+        page: fitz.Page,
+        settings: AppSettings,
+        image_index: DocumentImageIndex,
+    ) -> tuple[Image.Image, str, int]:
+        """Return the preprocessed OCR image, its source and the decoded image size."""
+        self._prepare_tesseract(run, settings)
 
-    def _ocr_page(self, page: fitz.Page, settings: AppSettings) -> str:
-        self._prepare_tesseract(settings)
+        image = None
+        source = "embedded"
+        if settings.ocr_use_embedded_images:
+            image = extract_embedded_scan(page, image_index)
 
-        dpi = max(72, settings.ocr_dpi)
-        scale = dpi / 72.0
-        matrix = fitz.Matrix(scale, scale)
-        pix = page.get_pixmap(matrix=matrix, alpha=False)
+        if image is not None:
+            image_bytes = image.width * image.height * len(image.getbands())
+        else:
+            source = "render"
+            dpi = max(72, settings.ocr_dpi)
+            scale = dpi / 72.0
+            matrix = fitz.Matrix(scale, scale)
+            pix = page.get_pixmap(matrix=matrix, alpha=False)
+            image_bytes = len(pix.samples)
 
-        mode = self._pixmap_mode(pix.n)
-        image = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
-        image = preprocess_for_ocr(image, settings)
+            mode = self._pixmap_mode(pix.n)
+            image = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
 
-        text = pytesseract.image_to_string(image, lang="eng")
-        return text or ""
+        return preprocess_for_ocr(image, settings), source, image_bytes
 
     @staticmethod
     def _pixmap_mode(channels: int) -> str:
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from threading import Lock
+from typing import Iterator
+
+from roop_pdfmd.core.models import OcrThreadPolicy
+
+
+class CpuBudget:
+    """Shares the machine's CPUs between concurrently running Tesseract processes.
+
+    Tesseract parallelises with OpenMP and, left alone, every process starts a
+    thread team sized to the whole machine. Each OCR invocation takes a lease
+    and runs with ``OMP_THREAD_LIMIT`` set from the number of active leases:
+
+    - ``THROUGHPUT``: one thread per process; parallelism comes from running
+      several pages or documents at once.
+    - ``LATENCY``: the CPUs are split evenly between the active invocations, so
+      a lone conversion uses the whole machine. A running invocation keeps its
+      threads, so a new lease gets at most the CPUs not yet leased, but never
+      less than one thread: ``n`` concurrent invocations use at most
+      ``cpu_count + n - 1`` threads.
+    """
+
+    def __init__(self, cpu_count: int | None = None) -> None:
+        self._cpu_count = max(cpu_count or os.cpu_count() or 1, 1)
+        self._active = 0
+        self._leased = 0
+        self._lock = Lock()
+
+    @property
+    def cpu_count(self) -> int:
+        return self._cpu_count
+
+    @property
+    def active(self) -> int:
+        with self._lock:
+            return self._active
+
+    @property
+    def leased(self) -> int:
+        """Threads held by the active leases."""
+        with self._lock:
+            return self._leased
+
+    @contextmanager
+    def lease(self, policy: OcrThreadPolicy | str) -> Iterator[int]:
+        with self._lock:
+            self._active += 1
+            threads = self.threads_for(policy, self._active, self._leased)
+            self._leased += threads
+        try:
+            yield threads
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._leased -= threads
+
+    def threads_for(self, policy: OcrThreadPolicy | str, active: int, leased: int = 0) -> int:
+        """Threads for a new lease among ``active`` ones whose others hold ``leased``."""
+        if OcrThreadPolicy(policy) == OcrThreadPolicy.LATENCY:
+            share = self._cpu_count // max(active, 1)
+            return max(min(share, self._cpu_count - leased), 1)
+        return 1
+
+
+def tesseract_env(threads: int) -> dict[str, str]:
+    env = dict(os.environ)
+    env["OMP_THREAD_LIMIT"] = str(max(threads, 1))
+    return env
+
+
+default_cpu_budget = CpuBudget()
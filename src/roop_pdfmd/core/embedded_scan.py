@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import math
+
+import fitz
+from PIL import Image
+
+from roop_pdfmd.core.image_index import DocumentImageIndex
+
+
+_MIN_PAGE_COVERAGE = 0.95
+_MIN_NATIVE_DPI = 150
+_AXIS_TOLERANCE = 1e-3
+
+
+def extract_embedded_scan(
+    page: fitz.Page,
+    image_index: DocumentImageIndex,
+    min_dpi: int = _MIN_NATIVE_DPI,
+) -> Image.Image | None:
+    """Return the page's single full-page scan at native resolution, upright.
+
+    Returns ``None`` whenever rendering the page would produce something other
+    than the scan itself: several images, partial coverage, transparency,
+    visible text or vector overlays, annotations, skewed placement, or a scan
+    whose native resolution is below ``min_dpi``.
+    """
+    placements = image_index.placements(page)
+    if len(placements) != 1:
+        return None
+    placement = placements[0]
+
+    page_rect = page.rect * page.derotation_matrix
+    page_area = max(page_rect.get_area(), 1.0)
+    if (placement.bbox & page_rect).get_area() / page_area < _MIN_PAGE_COVERAGE:
+        return None
+
+    if _has_soft_mask(page, placement.xref) or _has_visible_overlays(page):
+        return None
+
+    transpose = _orientation_transpose(placement.transform * page.rotation_matrix)
+    if transpose is False:
+        return None
+
+    pix = image_index.pixmap(placement.xref)
+    if pix is None:
+        return None
+
+    bbox_square_inches = placement.bbox.get_area() / (72.0 * 72.0)
+    native_dpi = math.sqrt(pix.width * pix.height / max(bbox_square_inches, 1e-6))
+    if native_dpi < min_dpi:
+        return None
+
+    image = _pixmap_to_image(pix)
+    if image is None:
+        return None
+    if transpose is not None:
+        image = image.transpose(transpose)
+    return image
+
+
+def _has_soft_mask(page: fitz.Page, xref: int) -> bool:
+    for image_info in page.get_images(full=True):
+        if image_info and image_info[0] == xref and image_info[1]:
+            return True
+    return False
+
+
+def _has_visible_overlays(page: fitz.Page) -> bool:
+    if page.first_annot is not None or page.first_widget is not None:
+        return True
+    if page.get_drawings():
+        return True
+    # Text render mode 3 is invisible (typical for OCR text layers over scans).
+    return any(span.get("type") != 3 for span in page.get_texttrace())
+
+
+def _orientation_transpose(matrix: fitz.Matrix) -> Image.Transpose | None | bool:
+    """Map an image-to-page matrix to the PIL transpose that makes it upright.
+
+    Returns ``None`` for an already upright placement and ``False`` when the
+    placement is not axis-aligned.
+    """
+    a, b, c, d = matrix.a, matrix.b, matrix.c, matrix.d
+    if abs(b) <= _AXIS_TOLERANCE and abs(c) <= _AXIS_TOLERANCE:
+        if a > 0 and d > 0:
+            return None
+        if a < 0 and d > 0:
+            return Image.Transpose.FLIP_LEFT_RIGHT
+        if a > 0 and d < 0:
+            return Image.Transpose.FLIP_TOP_BOTTOM
+        return Image.Transpose.ROTATE_180
+
+    if abs(a) <= _AXIS_TOLERANCE and abs(d) <= _AXIS_TOLERANCE:
+        if b > 0 and c < 0:
+            return Image.Transpose.ROTATE_270
+        if b < 0 and c > 0:
+            return Image.Transpose.ROTATE_90
+        if b > 0 and c > 0:
+            return Image.Transpose.TRANSPOSE
+        return Image.Transpose.TRANSVERSE
+
+    return False
+
+
+def _pixmap_to_image(pix: fitz.Pixmap) -> Image.Image | None:
+    if pix.colorspace is None:
+        return None
+    if pix.alpha:
+        pix = fitz.Pixmap(pix, 0)
+    if pix.n not in (1, 3):
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+
+    mode = "L" if pix.n == 1 else "RGB"
+    return Image.frombytes(mode, (pix.width, pix.height), pix.samples)
@@ -0,0 +1,535 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterable
+
+import fitz
+
+from roop_pdfmd.core.blank_page import skip_as_blank
+from roop_pdfmd.core.image_index import DocumentImageIndex
+from roop_pdfmd.core.models import AppSettings, PageMode
+from roop_pdfmd.core.text_quality import detect_page_text_quality, page_needs_ocr
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    metadata_path TEXT NOT NULL UNIQUE,
+    input_pdf TEXT NOT NULL DEFAULT '',
+    finished_at REAL NOT NULL DEFAULT 0,
+    duration_seconds REAL NOT NULL DEFAULT 0,
+    total_pages INTEGER NOT NULL DEFAULT 0,
+    processed_pages INTEGER NOT NULL DEFAULT 0,
+    ocr_pages INTEGER NOT NULL DEFAULT 0,
+    cancelled INTEGER NOT NULL DEFAULT 0,
+    predicted_seconds REAL NOT NULL DEFAULT 0,
+    assembled INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS pages (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    mode TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    area_sq_in REAL NOT NULL,
+    ocr_dpi INTEGER NOT NULL,
+    error INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS pages_run ON pages(run_id);
+"""
+
+_POINTS_PER_INCH = 72
+# US Letter; used for records written before page areas were stored.
+_DEFAULT_AREA_SQ_IN = 8.5 * 11
+# Priors until history has pages of a kind: a text-layer page costs little, an
+# OCR page roughly scales with the pixels Tesseract has to look at.
+_PRIOR_EXTRACT_SECONDS = 0.02
+_PRIOR_OCR_SECONDS_PER_MEGAPIXEL = 0.25
+_ESTIMATE_SAMPLE_PAGES = 16
+
+
+class HistoryError(Exception):
+    """Raised for unusable history files or metadata records."""
+
+
+@dataclass(slots=True)
+class DocumentFeatures:
+    pages: int
+    ocr_ratio: float
+    page_area_sq_in: float
+    ocr_dpi: int
+
+    @property
+    def ocr_megapixels(self) -> float:
+        """Pixels per OCR page, in millions."""
+        return self.page_area_sq_in * self.ocr_dpi * self.ocr_dpi / 1e6
+
+
+@dataclass(slots=True)
+class CostModel:
+    """Expected seconds per page for text-layer and OCR pages, scaled to wall time.
+
+    OCR pages cost ``ocr_base_seconds + ocr_seconds_per_megapixel * MP``; the
+    sum over pages is multiplied by ``wall_factor``, the observed ratio of run
+    wall time to summed page times (overlapping OCR work and per-run set-up).
+    """
+
+    extract_seconds_per_page: float = _PRIOR_EXTRACT_SECONDS
+    ocr_base_seconds: float = 0.0
+    ocr_seconds_per_megapixel: float = _PRIOR_OCR_SECONDS_PER_MEGAPIXEL
+    wall_factor: float = 1.0
+    runs: int = 0
+    extract_pages: int = 0
+    ocr_pages: int = 0
+
+    def predict(self, features: DocumentFeatures) -> float:
+        ocr_page = self.ocr_base_seconds + self.ocr_seconds_per_megapixel * features.ocr_megapixels
+        per_page = (
+            features.ocr_ratio * ocr_page
+            + (1.0 - features.ocr_ratio) * self.extract_seconds_per_page
+        )
+        return features.pages * per_page * self.wall_factor
+
+
+@dataclass(slots=True)
+class HistoryPage:
+    mode: PageMode
+    seconds: float
+    area_sq_in: float
+    ocr_dpi: int
+    error: bool = False
+
+
+@dataclass(slots=True)
+class HistoryRun:
+    metadata_path: str
+    input_pdf: str
+    finished_at: float
+    duration_seconds: float
+    total_pages: int
+    processed_pages: int
+    ocr_pages: int
+    cancelled: bool = False
+    predicted_seconds: float = 0.0
+    # Merged from shards; its duration is not the conversion's wall time.
+    assembled: bool = False
+    pages: list[HistoryPage] = field(default_factory=list)
+
+    def features(self) -> DocumentFeatures:
+        """The features this run turned out to have, for back-testing the model."""
+        pages = [page for page in self.pages if not page.error] or self.pages
+        ocr = [page for page in pages if page.mode == PageMode.OCR]
+        return DocumentFeatures(
+            pages=self.processed_pages,
+            ocr_ratio=len(ocr) / len(pages) if pages else 0.0,
+            page_area_sq_in=statistics.fmean(page.area_sq_in for page in pages)
+            if pages
+            else _DEFAULT_AREA_SQ_IN,
+            ocr_dpi=round(statistics.fmean(page.ocr_dpi for page in ocr)) if ocr else 0,
+        )
+
+
+@dataclass(slots=True)
+class RunError:
+    input_pdf: str
+    actual_seconds: float
+    predicted_seconds: float
+
+    @property
+    def relative_error(self) -> float:
+        return abs(self.predicted_seconds - self.actual_seconds) / max(self.actual_seconds, 1e-9)
+
+
+@dataclass(slots=True)
+class AccuracyReport:
+    """Model error when each run is predicted from the runs before it.
+
+    ``backtest`` uses each run's actual OCR ratio; ``estimates`` are the
+    predictions made before conversion started, where recorded.
+    """
+
+    model: CostModel
+    backtest: list[RunError] = field(default_factory=list)
+    estimates: list[RunError] = field(default_factory=list)
+
+    @staticmethod
+    def mean_error(errors: list[RunError]) -> float:
+        return statistics.fmean(item.relative_error for item in errors) if errors else 0.0
+
+    @staticmethod
+    def median_error(errors: list[RunError]) -> float:
+        return statistics.median(item.relative_error for item in errors) if errors else 0.0
+
+
+class RunHistory:
+    """SQLite store of finished conversions, read back as a :class:`CostModel`.
+
+    Records come from ``.meta.json`` files, so existing outputs can be
+    ingested after the fact. Safe to share between threads; separate
+    processes coordinate through SQLite's own locking.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30.0) -> None:
+        self._path = Path(path).expanduser().resolve()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        try:
+            self._conn = sqlite3.connect(
+                self._path, timeout=timeout, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as exc:
+            raise HistoryError(f"Unable to open run history {self._path}: {exc}") from exc
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> RunHistory:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def ingest(self, metadata_path: str | Path) -> HistoryRun:
+        """Add (or replace) the run recorded in a ``.meta.json`` file."""
+        metadata_path = Path(metadata_path).expanduser().resolve()
+        try:
+            payload = json.loads(metadata_path.read_text(encoding="utf-8"))
+            finished_at = metadata_path.stat().st_mtime
+        except (OSError, ValueError) as exc:
+            raise HistoryError(f"Unable to read metadata {metadata_path}: {exc}") from exc
+        run = run_from_metadata(payload, str(metadata_path), finished_at)
+        self.add(run)
+        return run
+
+    def add(self, run: HistoryRun) -> None:
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.execute(
+                    "DELETE FROM runs WHERE metadata_path = ?", (run.metadata_path,)
+                )
+                cursor = self._conn.execute(
+                    "INSERT INTO runs (metadata_path, input_pdf, finished_at, duration_seconds, "
+                    "total_pages, processed_pages, ocr_pages, cancelled, predicted_seconds, "
+                    "assembled) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        run.metadata_path,
+                        run.input_pdf,
+                        run.finished_at,
+                        run.duration_seconds,
+                        run.total_pages,
+                        run.processed_pages,
+                        run.ocr_pages,
+                        int(run.cancelled),
+                        run.predicted_seconds,
+                        int(run.assembled),
+                    ),
+                )
+                self._conn.executemany(
+                    "INSERT INTO pages (run_id, mode, seconds, area_sq_in, ocr_dpi, error) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            cursor.lastrowid,
+                            page.mode.value,
+                            page.seconds,
+                            page.area_sq_in,
+                            page.ocr_dpi,
+                            int(page.error),
+                        )
+                        for page in run.pages
+                    ],
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as exc:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise HistoryError(f"Unable to record run in {self._path}: {exc}") from exc
+
+    def runs(self) -> list[HistoryRun]:
+        """All runs, oldest first."""
+        with self._lock:
+            try:
+                run_rows = self._conn.execute(
+                    "SELECT id, metadata_path, input_pdf, finished_at, duration_seconds, "
+                    "total_pages, processed_pages, ocr_pages, cancelled, predicted_seconds, "
+                    "assembled FROM runs ORDER BY finished_at, id"
+                ).fetchall()
+                page_rows = self._conn.execute(
+                    "SELECT run_id, mode, seconds, area_sq_in, ocr_dpi, error FROM pages "
+                    "ORDER BY rowid"
+                ).fetchall()
+            except sqlite3.Error as exc:
+                raise HistoryError(f"Unable to read run history {self._path}: {exc}") from exc
+
+        pages: dict[int, list[HistoryPage]] = {}
+        for run_id, mode, seconds, area, dpi, error in page_rows:
+            pages.setdefault(run_id, []).append(
+                HistoryPage(
+                    mode=PageMode(mode),
+                    seconds=seconds,
+                    area_sq_in=area,
+                    ocr_dpi=dpi,
+                    error=bool(error),
+                )
+            )
+        return [
+            HistoryRun(
+                metadata_path=row[1],
+                input_pdf=row[2],
+                finished_at=row[3],
+                duration_seconds=row[4],
+                total_pages=row[5],
+                processed_pages=row[6],
+                ocr_pages=row[7],
+                cancelled=bool(row[8]),
+                predicted_seconds=row[9],
+                assembled=bool(row[10]),
+                pages=pages.get(row[0], []),
+            )
+            for row in run_rows
+        ]
+
+    def model(self) -> CostModel:
+        """The cost model of all runs, from totals summed by SQLite rather than loaded rows."""
+        with self._lock:
+            try:
+                (runs,) = self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()
+                extract = self._conn.execute(
+                    "SELECT COUNT(*), TOTAL(seconds) FROM pages WHERE NOT error AND mode = ?",
+                    (PageMode.EXTRACT.value,),
+                ).fetchone()
+                ocr = self._conn.execute(
+                    "SELECT COUNT(*), TOTAL(x), TOTAL(seconds), TOTAL(x * x), "
+                    "TOTAL(x * seconds) FROM (SELECT area_sq_in * ocr_dpi * ocr_dpi / 1e6 AS x, "
+                    "seconds FROM pages WHERE NOT error AND mode = ? AND ocr_dpi != 0)",
+                    (PageMode.OCR.value,),
+                ).fetchone()
+                wall = self._conn.execute(
+                    "SELECT TOTAL(runs.duration_seconds), TOTAL(timed.seconds) FROM runs "
+                    "JOIN (SELECT run_id, TOTAL(seconds) AS seconds FROM pages GROUP BY run_id) "
+                    "AS timed ON timed.run_id = runs.id "
+                    "WHERE NOT cancelled AND NOT assembled AND timed.seconds > 0"
+                ).fetchone()
+            except sqlite3.Error as exc:
+                raise HistoryError(f"Unable to read run history {self._path}: {exc}") from exc
+        return _CostSums(runs, *extract, *ocr, *wall).model()
+
+    def accuracy(self) -> AccuracyReport:
+        sums = _CostSums()
+        backtest: list[RunError] = []
+        estimates: list[RunError] = []
+        for run in self.runs():
+            if run.cancelled or not run.processed_pages:
+                continue
+            # Assembled runs' pages train the model, but their duration is only the merge.
+            if sums.runs and not run.assembled:
+                backtest.append(
+                    RunError(
+                        input_pdf=run.input_pdf,
+                        actual_seconds=run.duration_seconds,
+                        predicted_seconds=sums.model().predict(run.features()),
+                    )
+                )
+            if run.predicted_seconds > 0 and not run.assembled:
+                estimates.append(
+                    RunError(
+                        input_pdf=run.input_pdf,
+                        actual_seconds=run.duration_seconds,
+                        predicted_seconds=run.predicted_seconds,
+                    )
+                )
+            sums.add(run)
+        return AccuracyReport(model=sums.model(), backtest=backtest, estimates=estimates)
+
+
+def run_from_metadata(
+    payload: dict[str, Any],
+    metadata_path: str,
+    finished_at: float,
+) -> HistoryRun:
+    try:
+        pages = [
+            HistoryPage(
+                mode=PageMode(page["mode"]),
+                seconds=float(page["duration_seconds"]),
+                area_sq_in=float(page.get("page_area_sq_in") or _DEFAULT_AREA_SQ_IN),
+                ocr_dpi=int(page.get("ocr_dpi") or 0),
+                # Retried pages' timings include the failed attempts.
+                error=bool(page.get("error") or page.get("attempts")),
+            )
+            for page in payload.get("pages", [])
+        ]
+        return HistoryRun(
+            metadata_path=metadata_path,
+            input_pdf=str(payload.get("input_pdf", "")),
+            finished_at=finished_at,
+            duration_seconds=float(payload["duration_seconds"]),
+            total_pages=int(payload["total_pages"]),
+            processed_pages=int(payload.get("processed_pages", len(pages))),
+            ocr_pages=int(payload.get("ocr_pages", 0)),
+            cancelled=bool(payload.get("cancelled")),
+            predicted_seconds=float(payload.get("predicted_seconds") or 0.0),
+            assembled=bool(payload.get("assembled")),
+            pages=pages,
+        )
+    except (KeyError, TypeError, ValueError) as exc:
+        raise HistoryError(f"Not a conversion metadata record: {metadata_path}") from exc
+
+
+def fit_cost_model(runs: Iterable[HistoryRun]) -> CostModel:
+    """Least-squares fit of page costs; priors stand in for page kinds never seen.
+
+    Assembled runs add their pages but not to ``wall_factor``: their duration
+    is the merge, not the sharded conversion.
+    """
+    sums = _CostSums()
+    for run in runs:
+        sums.add(run)
+    return sums.model()
+
+
+@dataclass(slots=True)
+class _CostSums:
+    """The totals :func:`fit_cost_model` needs, so a fit can grow a run at a time.
+
+    OCR pages are points (megapixels, seconds) of the least-squares line.
+    """
+
+    runs: int = 0
+    extract_pages: int = 0
+    extract_seconds: float = 0.0
+    ocr_pages: int = 0
+    ocr_x: float = 0.0
+    ocr_y: float = 0.0
+    ocr_xx: float = 0.0
+    ocr_xy: float = 0.0
+    wall_seconds: float = 0.0
+    page_seconds: float = 0.0
+
+    def add(self, run: HistoryRun) -> None:
+        self.runs += 1
+        seconds = 0.0
+        for page in run.pages:
+            seconds += page.seconds
+            if page.error:
+                continue
+            if page.mode == PageMode.OCR and page.ocr_dpi:
+                megapixels = page.area_sq_in * page.ocr_dpi * page.ocr_dpi / 1e6
+                self.ocr_pages += 1
+                self.ocr_x += megapixels
+                self.ocr_y += page.seconds
+                self.ocr_xx += megapixels * megapixels
+                self.ocr_xy += megapixels * page.seconds
+            elif page.mode == PageMode.EXTRACT:
+                self.extract_pages += 1
+                self.extract_seconds += page.seconds
+        if not run.cancelled and not run.assembled and seconds > 0:
+            self.wall_seconds += run.duration_seconds
+            self.page_seconds += seconds
+
+    def model(self) -> CostModel:
+        model = CostModel(
+            runs=self.runs, extract_pages=self.extract_pages, ocr_pages=self.ocr_pages
+        )
+        if self.extract_pages:
+            model.extract_seconds_per_page = self.extract_seconds / self.extract_pages
+        if self.ocr_pages:
+            model.ocr_base_seconds, model.ocr_seconds_per_megapixel = self._fit_line()
+        if self.page_seconds > 0:
+            model.wall_factor = self.wall_seconds / self.page_seconds
+        return model
+
+    def _fit_line(self) -> tuple[float, float]:
+        """Intercept and slope, both kept non-negative; through the origin if x doesn't vary."""
+        mean_x = self.ocr_x / self.ocr_pages
+        mean_y = self.ocr_y / self.ocr_pages
+        spread = self.ocr_xx - self.ocr_x * mean_x
+        # Relative: the difference of sums leaves rounding noise when x is constant.
+        if spread > 1e-9 * self.ocr_xx:
+            slope = (self.ocr_xy - self.ocr_x * mean_y) / spread
+            intercept = mean_y - slope * mean_x
+            if slope >= 0 and intercept >= 0:
+                return intercept, slope
+            if slope < 0:
+                return mean_y, 0.0
+        if mean_x <= 0:
+            return mean_y, 0.0
+        return 0.0, self.ocr_xy / self.ocr_xx
+
+
+def page_area_sq_in(page: fitz.Page) -> float:
+    rect = page.rect
+    return round(rect.width * rect.height / (_POINTS_PER_INCH * _POINTS_PER_INCH), 2)
+
+
+def estimate_features(
+    doc: fitz.Document,
+    settings: AppSettings,
+    image_index: DocumentImageIndex | None = None,
+    sample_pages: int = _ESTIMATE_SAMPLE_PAGES,
+) -> DocumentFeatures:
+    """Predict a document's OCR ratio and page size from evenly spaced sample pages."""
+    page_count = doc.page_count
+    if page_count == 0:
+        return DocumentFeatures(pages=0, ocr_ratio=0.0, page_area_sq_in=0.0, ocr_dpi=0)
+    image_index = image_index or DocumentImageIndex(doc)
+    probes = min(page_count, max(sample_pages, 1))
+    indexes = sorted(
+        {round(step * (page_count - 1) / max(probes - 1, 1)) for step in range(probes)}
+    )
+    ocr_count = 0
+    areas: list[float] = []
+    for idx in indexes:
+        page = doc.load_page(idx)
+        areas.append(page_area_sq_in(page))
+        quality = detect_page_text_quality(page, image_index)
+        needs_ocr = page_needs_ocr(quality, settings)
+        if needs_ocr and not skip_as_blank(page, quality, settings):
+            ocr_count += 1
+    return DocumentFeatures(
+        pages=page_count,
+        ocr_ratio=ocr_count / len(indexes),
+        page_area_sq_in=statistics.fmean(areas),
+        ocr_dpi=settings.ocr_dpi,
+    )
+
+
+def estimate_seconds(path: str | Path, settings: AppSettings, model: CostModel) -> float:
+    """Expected conversion wall time of the PDF at ``path``."""
+    try:
+        with fitz.open(path) as doc:
+            return model.predict(estimate_features(doc, settings))
+    except (OSError, RuntimeError, ValueError) as exc:
+        raise HistoryError(f"Unable to open PDF {path}: {exc}") from exc
+
+
+def shortest_first(
+    paths: Iterable[str | Path],
+    settings: AppSettings,
+    model: CostModel,
+) -> list[tuple[Path, float]]:
+    """``paths`` with expected seconds, shortest first to lower mean completion time.
+
+    PDFs that can't be opened are put last so they fail after everything else.
+    """
+    estimates: list[tuple[Path, float]] = []
+    for path in paths:
+        path = Path(path)
+        try:
+            seconds = estimate_seconds(path, settings, model)
+        except HistoryError:
+            seconds = float("inf")
+        estimates.append((path, seconds))
+    return sorted(estimates, key=lambda item: item[1])
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import fitz
+
+
+@dataclass(slots=True)
+class ImagePlacement:
+    xref: int
+    bbox: fitz.Rect
+    transform: fitz.Matrix
+    width: int
+    height: int
+
+
+class DocumentImageIndex:
+    """Per-document cache of image placements keyed by page number.
+
+    ``page.get_image_rects(xref)`` decodes the image behind ``xref`` to hash it
+    and re-extracts the page's image info on every call. The index hashes each
+    xref once per document and reads every page's image info once, then matches
+    placements the same way ``get_image_rects`` does. The most recently decoded
+    pixmap is kept so a page's scan is not decoded twice when it is OCRed.
+    """
+
+    def __init__(self, doc: fitz.Document) -> None:
+        self._doc = doc
+        self._digests: dict[int, bytes | None] = {}
+        self._placements: dict[int, list[ImagePlacement]] = {}
+        self._last_pixmap: tuple[int, fitz.Pixmap] | None = None
+
+    def build(self) -> DocumentImageIndex:
+        for idx in range(self._doc.page_count):
+            self.placements(self._doc.load_page(idx))
+        return self
+
+    def placements(self, page: fitz.Page) -> list[ImagePlacement]:
+        cached = self._placements.get(page.number)
+        if cached is not None:
+            return cached
+
+        placements: list[ImagePlacement] = []
+        image_list = page.get_images(full=True)
+        if image_list:
+            try:
+                infos = page.get_image_info(hashes=True)
+            except Exception:
+                infos = []
+
+            for image_info in image_list:
+                if not image_info:
+                    continue
+                xref = image_info[0]
+                digest = self._xref_digest(xref)
+                if digest is None:
+                    continue
+                for info in infos:
+                    if info.get("digest") != digest:
+                        continue
+                    placements.append(
+                        ImagePlacement(
+                            xref=xref,
+                            bbox=fitz.Rect(info["bbox"]),
+                            transform=fitz.Matrix(info["transform"]),
+                            width=int(info.get("width", 0)),
+                            height=int(info.get("height", 0)),
+                        )
+                    )
+
+        self._placements[page.number] = placements
+        return placements
+
+    def image_area_ratio(self, page: fitz.Page) -> float:
+        page_area = max(float(page.rect.width * page.rect.height), 1.0)
+        total_area = 0.0
+        for placement in self.placements(page):
+            total_area += max(float(placement.bbox.width * placement.bbox.height), 0.0)
+        return min(total_area / page_area, 1.0)
+
+    def pixmap(self, xref: int) -> fitz.Pixmap | None:
+        if self._last_pixmap is not None and self._last_pixmap[0] == xref:
+            return self._last_pixmap[1]
+
+        try:
+            pix = fitz.Pixmap(self._doc, xref)
+        except Exception:
+            return None
+
+        self._last_pixmap = (xref, pix)
+        return pix
+
+    def _xref_digest(self, xref: int) -> bytes | None:
+        if xref in self._digests:
+            return self._digests[xref]
+
+        pix = self.pixmap(xref)
+        digest = pix.digest if pix is not None else None
+        self._digests[xref] = digest
+        return digest
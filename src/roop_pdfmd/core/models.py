@@ -8,6 +8,17 @@ from pathlib import Path
 class PageMode(str, Enum):
     EXTRACT = "EXTRACT"
     OCR = "OCR"
+    BLANK = "BLANK"
+
+
+class OcrThreadPolicy(str, Enum):
+    THROUGHPUT = "throughput"
+    LATENCY = "latency"
+
+
+class MemoryLimitAction(str, Enum):
+    WARN = "warn"
+    DEGRADE = "degrade"
 
 
 @dataclass(slots=True)
@@ -15,10 +26,32 @@ class AppSettings:
     ocr_dpi: int = 300
     tesseract_path: str = ""
     dehyphenate: bool = False
+    normalize_unicode: bool = False
+    collapse_whitespace: bool = False
+    strip_headers_footers: bool = False
     ocr_only_if_no_text_layer: bool = True
+    ocr_min_text_chars: int = 10
+    ocr_image_text_max_chars: int = 35
+    skip_blank_pages: bool = False
     ocr_preprocess_grayscale: bool = True
     ocr_preprocess_autocontrast: bool = True
     ocr_preprocess_threshold: bool = False
+    ocr_use_embedded_images: bool = True
+    ocr_psm: int = 3
+    ocr_thread_policy: OcrThreadPolicy = OcrThreadPolicy.THROUGHPUT
+    ocr_backend: str = "pytesseract"
+    ocr_batch_size: int = 1
+    ocr_batch_max_megapixels: int = 100
+    write_page_index: bool = True
+    search_index_path: str = ""
+    memory_soft_limit_mb: int = 0
+    memory_limit_action: MemoryLimitAction = MemoryLimitAction.WARN
+    track_python_memory: bool = False
+    page_retry_attempts: int = 0
+    ocr_calibrate: bool = False
+    ocr_calibration_pages: int = 3
+    ocr_calibration_target: float = 85.0
+    history_path: str = ""
 
 
 @dataclass(slots=True)
@@ -44,6 +77,17 @@ class ProgressEvent:
     eta_seconds: float
 
 
+@dataclass(slots=True)
+class PageAttempt:
+    """One try at converting a page; a retried page's first attempt used the configured settings."""
+
+    ocr_dpi: int
+    grayscale: bool
+    banded: bool
+    seconds: float = 0.0
+    error: str = ""
+
+
 @dataclass(slots=True)
 class PageResult:
     page_number: int
@@ -51,6 +95,49 @@ class PageResult:
     duration_seconds: float
     text_length: int
     error: str = ""
+    ocr_source: str = ""
+    ocr_threads: int = 0
+    ocr_batch_size: int = 0
+    ocr_dpi: int = 0
+    image_bytes: int = 0
+    page_area_sq_in: float = 0.0
+    classify_seconds: float = 0.0
+    render_seconds: float = 0.0
+    ocr_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    # Sampled once the page is done, for the whole process: with concurrent
+    # conversions or batched OCR the pages overlap and share these figures.
+    rss_bytes: int = 0
+    python_peak_bytes: int = 0
+    attempts: list[PageAttempt] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PageOutput:
+    result: PageResult
+    text: str
+    markdown_block: str
+    text_block: str
+
+
+@dataclass(slots=True)
+class CalibrationCandidate:
+    ocr_dpi: int
+    ocr_preprocess_grayscale: bool
+    ocr_preprocess_autocontrast: bool
+    ocr_preprocess_threshold: bool
+    confidence: float = 0.0
+    seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class CalibrationResult:
+    sample_pages: list[int]
+    target_confidence: float
+    chosen: CalibrationCandidate | None
+    met_target: bool
+    seconds: float
+    candidates: list[CalibrationCandidate] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -66,5 +153,37 @@ class ConversionResult:
     ocr_pages: int
     cancelled: bool
     duration_seconds: float
+    ocr_backend: str = ""
+    blank_pages: int = 0
+    retried_pages: int = 0
+    preset: str = ""
+    # Merged from shards: duration_seconds is the merge alone, page timings
+    # come from the shard workers.
+    assembled: bool = False
+    page_index_path: Path | None = None
+    cpu_seconds: float = 0.0
+    # Memory is sampled for the whole process, so concurrent conversions
+    # count towards each other's peaks.
+    process_peak_rss_bytes: int = 0
+    process_python_peak_bytes: int = 0
+    peak_image_bytes: int = 0
+    resource_warnings: list[str] = field(default_factory=list)
+    calibration: CalibrationResult | None = None
+    predicted_seconds: float = 0.0
     errors: list[str] = field(default_factory=list)
     pages: list[PageResult] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SessionStats:
+    documents_converted: int = 0
+    documents_failed: int = 0
+    documents_cancelled: int = 0
+    pages_processed: int = 0
+    extracted_pages: int = 0
+    ocr_pages: int = 0
+    blank_pages: int = 0
+    page_errors: int = 0
+    tesseract_probes: int = 0
+    conversion_seconds: float = 0.0
+    uptime_seconds: float = 0.0
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from abc import ABC, abstractmethod
+from threading import Event
+from typing import TYPE_CHECKING
+
+from roop_pdfmd.core.tesseract import (
+    OcrCancelledError,
+    run_tesseract,
+    run_tesseract_batch,
+    run_tesseract_piped,
+    tesseract_confidence,
+)
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+class OcrBackend(ABC):
+    """Turns a preprocessed page image into text."""
+
+    name: str = ""
+    requires_tesseract_binary: bool = True
+    # Offered to end users; test-only engines set this to False.
+    public: bool = True
+
+    @abstractmethod
+    def image_to_string(
+        self,
+        image: Image.Image,
+        tesseract_cmd: str,
+        lang: str = "eng",
+        cancel_event: Event | None = None,
+        env: dict[str, str] | None = None,
+        psm: int | None = None,
+    ) -> str:
+        raise NotImplementedError
+
+    def images_to_strings(
+        self,
+        images: list[Image.Image],
+        tesseract_cmd: str,
+        lang: str = "eng",
+        cancel_event: Event | None = None,
+        env: dict[str, str] | None = None,
+        psm: int | None = None,
+    ) -> list[str]:
+        """OCR a batch of images; engines with per-run startup cost override this.
+
+        ``psm`` is Tesseract's page segmentation mode; None keeps the engine default.
+        """
+        return [
+            self.image_to_string(
+                image, tesseract_cmd, lang=lang, cancel_event=cancel_event, env=env, psm=psm
+            )
+            for image in images
+        ]
+
+    def image_confidence(
+        self,
+        image: Image.Image,
+        tesseract_cmd: str,
+        lang: str = "eng",
+        cancel_event: Event | None = None,
+        env: dict[str, str] | None = None,
+        psm: int | None = None,
+    ) -> float:
+        """Mean word confidence (0-100) of recognising ``image``; used for calibration."""
+        raise NotImplementedError(f"OCR engine {self.name!r} does not report confidence")
+
+    def close(self) -> None:
+        """Release engine resources held between pages; nothing to do for most engines."""
+
+
+class _TesseractCliBackend(OcrBackend):
+    """Runs the Tesseract executable; batches share one process via a list file."""
+
+    def images_to_strings(
+        self,
+        images: list[Image.Image],
+        tesseract_cmd: str,
+        lang: str = "eng",
+        cancel_event: Event | None = None,
+        env: dict[str, str] | None = None,
+        psm: int | None = None,
+    ) -> list[str]:
+        if len(images) == 1:
+            return [self.image_to_string(images[0], tesseract_cmd, lang, cancel_event, env, psm)]
+        return run_tesseract_batch(
+            images, tesseract_cmd, lang=lang, cancel_event=cancel_event, env=env, psm=psm
+        )
+
+    def image_confidence(
+        self,
+        image: Image.Image,
+        tesseract_cmd: str,
+        lang: str = "eng",
+        cancel_event: Event | None = None,
+        env: dict[str, str] | None = None,
+        psm: int | None = None,
+    ) -> float:
+        return tesseract_confidence(
+            image, tesseract_cmd, lang=lang, cancel_event=cancel_event, env=env, psm=psm
+        )
+
+
+class PytesseractBackend(_TesseractCliBackend):
+    """pytesseract's flow: temp image file in, temp text file out."""
+
+    name = "pytesseract"
+
+    def image_to_string(
+        self,
+        image: Image.Image,
+        tesseract_cmd: str,
+        lang: str = "eng",
+        cancel_event: Event | None = None,
+        env: dict[str, str] | None = None,
+        psm: int | None = None,
+    ) -> str:
+        return run_tesseract(
+            image, tesseract_cmd, lang=lang, cancel_event=cancel_event, env=env, psm=psm
+        )
+
+
+class TesseractPipeBackend(_TesseractCliBackend):
+    """Tesseract CLI fed over stdin/stdout, with no temp files."""
+
+    name = "tesseract-pipe"
+
+    def image_to_string(
+        self,
+        image: Image.Image,
+        tesseract_cmd: str,
+        lang: str = "eng",
+        cancel_event: Event | None = None,
+        env: dict[str, str] | None = None,
+        psm: int | None = None,
+    ) -> str:
+        return run_tesseract_piped(
+            image, tesseract_cmd, lang=lang, cancel_event=cancel_event, env=env, psm=psm
+        )
+
+
+class TesserocrBackend(OcrBackend):
+    """In-process Tesseract through the optional ``tesserocr`` binding.
+
+    Language data is loaded once per thread instead of once per page, and the
+    engines are ended by :meth:`close`. Cancellation is checked before and
+    after recognition; a page already inside the engine runs to the end.
+
+    OpenMP reads ``OMP_THREAD_LIMIT`` once, when the engine library loads, so
+    the per-call ``env`` of the CPU budget cannot apply here. Unless the
+    process already sets it, the limit is set to one thread per page (the
+    throughput policy) before ``tesserocr`` is first imported.
+    """
+
+    name = "tesserocr"
+    requires_tesseract_binary = False
+
+    def __init__(self) -> None:
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+        import tesserocr
+
+        self._tesserocr = tesserocr
+        self._local = threading.local()
+        self._apis_lock = threading.Lock()
+        self._apis: list = []
+
+    def image_to_string(
+        self,
+        image: Image.Image,
+        tesseract_cmd: str,
+        lang: str = "eng",
+        cancel_event: Event | None = None,
+        env: dict[str, str] | None = None,
+        psm: int | None = None,
+    ) -> str:
+        api = self._api(lang, psm)
+        _check_cancelled(cancel_event)
+        api.SetImage(image)
+        text = api.GetUTF8Text()
+        _check_cancelled(cancel_event)
+        return text
+
+    def image_confidence(
+        self,
+        image: Image.Image,
+        tesseract_cmd: str,
+        lang: str = "eng",
+        cancel_event: Event | None = None,
+        env: dict[str, str] | None = None,
+        psm: int | None = None,
+    ) -> float:
+        api = self._api(lang, psm)
+        _check_cancelled(cancel_event)
+        api.SetImage(image)
+        confidence = float(api.MeanTextConf())
+        _check_cancelled(cancel_event)
+        return confidence
+
+    def close(self) -> None:
+        with self._apis_lock:
+            apis, self._apis = self._apis, []
+        for api in apis:
+            api.End()
+
+    def _api(self, lang: str, psm: int | None):
+        api = getattr(self._local, "api", None)
+        if api is None or getattr(self._local, "lang", None) != lang:
+            new_api = self._tesserocr.PyTessBaseAPI(lang=lang)
+            with self._apis_lock:
+                if api in self._apis:
+                    self._apis.remove(api)
+                    api.End()
+                self._apis.append(new_api)
+            api = self._local.api = new_api
+            self._local.lang = lang
+        if psm is not None:
+            api.SetPageSegMode(psm)
+        return api
+
+
+class StubOcrBackend(OcrBackend):
+    """Deterministic fake OCR for tests; needs no Tesseract at all."""
+
+    name = "stub"
+    requires_tesseract_binary = False
+    public = False
+
+    def image_to_string(
+        self,
+        image: Image.Image,
+        tesseract_cmd: str,
+        lang: str = "eng",
+        cancel_event: Event | None = None,
+        env: dict[str, str] | None = None,
+        psm: int | None = None,
+    ) -> str:
+        digest = hashlib.sha1(image.tobytes()).hexdigest()[:12]
+        return f"stub ocr {image.width}x{image.height} {image.mode} {digest}\n"
+
+    def image_confidence(
+        self,
+        image: Image.Image,
+        tesseract_cmd: str,
+        lang: str = "eng",
+        cancel_event: Event | None = None,
+        env: dict[str, str] | None = None,
+        psm: int | None = None,
+    ) -> float:
+        return 90.0
+
+
+_BACKENDS: dict[str, type[OcrBackend]] = {
+    backend.name: backend
+    for backend in (PytesseractBackend, TesseractPipeBackend, TesserocrBackend, StubOcrBackend)
+}
+
+DEFAULT_OCR_BACKEND = PytesseractBackend.name
+
+
+def available_ocr_backends(include_internal: bool = False) -> list[str]:
+    """Usable backends; the test-only stub is left out unless ``include_internal``."""
+    names = []
+    for name, backend in _BACKENDS.items():
+        if backend is TesserocrBackend and not _tesserocr_installed():
+            continue
+        if not backend.public and not include_internal:
+            continue
+        names.append(name)
+    return names
+
+
+def create_ocr_backend(name: str) -> OcrBackend:
+    backend = _BACKENDS.get(name or DEFAULT_OCR_BACKEND)
+    if backend is None:
+        raise ValueError(f"Unknown OCR backend: {name}")
+    try:
+        return backend()
+    except ImportError as exc:
+        raise ValueError(f"OCR backend '{name}' is not available: {exc}") from exc
+
+
+def _check_cancelled(cancel_event: Event | None) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise OcrCancelledError("OCR run cancelled")
+
+
+def _tesserocr_installed() -> bool:
+    try:
+        import tesserocr  # noqa: F401
+    except ImportError:
+        return False
+    return True
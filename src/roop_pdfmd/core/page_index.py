@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from pathlib import Path
+from typing import BinaryIO, Literal, Sequence
+
+# Sidecar layout (little endian):
+#   header: magic, version, reserved, page count, .md size, .txt size
+#   record: page number, .md offset, .md length, .txt offset, .txt length
+# Records are fixed size and sorted by page number, so page N of a complete
+# conversion is record N - 1 and can be read with a single seek.
+_MAGIC = b"RPIX"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIQQ")
+_RECORD = struct.Struct("<IQQQQ")
+
+PageSpan = tuple[int, int]
+OutputKind = Literal["markdown", "text"]
+
+
+class PageIndexError(Exception):
+    """Raised when a page index is missing, malformed or out of date."""
+
+
+def join_page_blocks(blocks: Sequence[str]) -> tuple[str, list[PageSpan]]:
+    """Join page blocks into output file content plus each block's byte span."""
+    content = "\n".join(blocks).strip() + "\n"
+    content_size = len(content.encode("utf-8"))
+
+    spans: list[PageSpan] = []
+    offset = 0
+    for block in blocks:
+        size = len(block.encode("utf-8"))
+        # The trailing strip can only shorten the last block.
+        spans.append((offset, max(min(size, content_size - offset), 0)))
+        offset += size + 1
+    return content, spans
+
+
+def page_index_path_for(markdown_path: Path) -> Path:
+    return markdown_path.with_name(f"{markdown_path.stem}.pages.idx")
+
+
+def write_page_index(
+    path: Path,
+    page_numbers: Sequence[int],
+    markdown_spans: Sequence[PageSpan],
+    text_spans: Sequence[PageSpan],
+    markdown_size: int,
+    text_size: int,
+) -> None:
+    records = sorted(zip(page_numbers, markdown_spans, text_spans))
+    buffer = bytearray(_HEADER.pack(_MAGIC, _VERSION, 0, len(records), markdown_size, text_size))
+    for page_number, (md_offset, md_length), (txt_offset, txt_length) in records:
+        buffer += _RECORD.pack(page_number, md_offset, md_length, txt_offset, txt_length)
+    path.write_bytes(bytes(buffer))
+
+
+class PageIndexReader:
+    """Random access to single pages of a conversion's ``.md``/``.txt`` output.
+
+    ``index_path`` is the ``<stem>.pages.idx`` sidecar; the outputs default to
+    ``<stem>.md`` and ``<stem>.txt`` next to it. With ``use_mmap`` the output
+    files are memory-mapped instead of read with seeks.
+    """
+
+    def __init__(
+        self,
+        index_path: str | Path,
+        markdown_path: str | Path | None = None,
+        text_path: str | Path | None = None,
+        use_mmap: bool = False,
+    ) -> None:
+        self._index_path = Path(index_path)
+        stem = self._index_path.name.removesuffix(".pages.idx")
+        self._paths: dict[str, Path] = {
+            "markdown": Path(markdown_path or self._index_path.with_name(f"{stem}.md")),
+            "text": Path(text_path or self._index_path.with_name(f"{stem}.txt")),
+        }
+        self._use_mmap = use_mmap
+        self._files: dict[str, BinaryIO] = {}
+        self._maps: dict[str, mmap.mmap] = {}
+
+        try:
+            self._index = self._index_path.open("rb")
+        except OSError as exc:
+            raise PageIndexError(f"Page index not found: {self._index_path}") from exc
+
+        header = self._index.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            self.close()
+            raise PageIndexError(f"Truncated page index: {self._index_path}")
+        magic, version, _, count, markdown_size, text_size = _HEADER.unpack(header)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise PageIndexError(f"Unsupported page index: {self._index_path}")
+        self._count = count
+        self._sizes = {"markdown": markdown_size, "text": text_size}
+
+    @classmethod
+    def for_output(cls, markdown_path: str | Path, use_mmap: bool = False) -> PageIndexReader:
+        markdown_path = Path(markdown_path)
+        return cls(
+            page_index_path_for(markdown_path), markdown_path=markdown_path, use_mmap=use_mmap
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def page_numbers(self) -> list[int]:
+        return [self._record(position)[0] for position in range(self._count)]
+
+    def span(self, page_number: int, kind: OutputKind = "markdown") -> PageSpan:
+        record = self._find(page_number)
+        if kind == "markdown":
+            return record[1], record[2]
+        return record[3], record[4]
+
+    def read_page(self, page_number: int, kind: OutputKind = "markdown") -> str:
+        offset, length = self.span(page_number, kind)
+        return self._read(kind, offset, length)
+
+    def read_pages(self, first: int, last: int, kind: OutputKind = "markdown") -> str:
+        """Read pages ``first`` to ``last`` inclusive as one slice of the output."""
+        if last < first:
+            raise PageIndexError(f"Invalid page range: {first}-{last}")
+        start, _ = self.span(first, kind)
+        end_offset, end_length = self.span(last, kind)
+        return self._read(kind, start, end_offset + end_length - start)
+
+    def close(self) -> None:
+        for mapped in self._maps.values():
+            mapped.close()
+        for handle in self._files.values():
+            handle.close()
+        self._maps.clear()
+        self._files.clear()
+        index = getattr(self, "_index", None)
+        if index is not None:
+            index.close()
+
+    def __enter__(self) -> PageIndexReader:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _record(self, position: int) -> tuple[int, int, int, int, int]:
+        self._index.seek(_HEADER.size + position * _RECORD.size)
+        return _RECORD.unpack(self._index.read(_RECORD.size))
+
+    def _find(self, page_number: int) -> tuple[int, int, int, int, int]:
+        # Direct hit for complete conversions, binary search otherwise.
+        if 1 <= page_number <= self._count:
+            record = self._record(page_number - 1)
+            if record[0] == page_number:
+                return record
+
+        low, high = 0, self._count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            record = self._record(middle)
+            if record[0] == page_number:
+                return record
+            if record[0] < page_number:
+                low = middle + 1
+            else:
+                high = middle - 1
+        raise PageIndexError(f"Page {page_number} is not in the index")
+
+    def _read(self, kind: str, offset: int, length: int) -> str:
+        if self._use_mmap:
+            mapped = self._map(kind)
+            data = mapped[offset : offset + length]
+        else:
+            handle = self._file(kind)
+            handle.seek(offset)
+            data = handle.read(length)
+        return data.decode("utf-8")
+
+    def _file(self, kind: str) -> BinaryIO:
+        handle = self._files.get(kind)
+        if handle is None:
+            path = self._paths[kind]
+            try:
+                handle = path.open("rb")
+            except OSError as exc:
+                raise PageIndexError(f"Output file not found: {path}") from exc
+            size = handle.seek(0, 2)
+            if size != self._sizes[kind]:
+                handle.close()
+                raise PageIndexError(f"Page index is out of date for {path}")
+            self._files[kind] = handle
+        return handle
+
+    def _map(self, kind: str) -> mmap.mmap:
+        mapped = self._maps.get(kind)
+        if mapped is None:
+            handle = self._file(kind)
+            if self._sizes[kind] == 0:
+                raise PageIndexError(f"Output file is empty: {self._paths[kind]}")
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[kind] = mapped
+        return mapped
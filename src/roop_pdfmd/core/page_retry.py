@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+import fitz
+from PIL import Image
+
+from roop_pdfmd.core.models import AppSettings
+
+
+# Below this Tesseract output is rarely worth having.
+_MIN_RETRY_DPI = 100
+# Device rows rendered per band; a Letter page at 300 DPI is 3300 rows.
+_BAND_ROWS = 512
+
+
+@dataclass(slots=True, frozen=True)
+class RetryStep:
+    settings: AppSettings
+    banded: bool
+
+
+def retry_steps(settings: AppSettings, attempts: int) -> list[RetryStep]:
+    """Up to ``attempts`` progressively cheaper ways to OCR a page that failed.
+
+    Every step OCRs a grayscale render (not the embedded scan, which may be
+    what was too large) at 2/3, 1/2, 2/5, ... of the configured DPI; from the
+    second step on the page is rendered in bands. Steps stop once nothing is
+    left to give up.
+    """
+    steps: list[RetryStep] = []
+    for attempt in range(1, max(attempts, 0) + 1):
+        dpi = max(_MIN_RETRY_DPI, settings.ocr_dpi * 2 // (attempt + 2))
+        banded = attempt >= 2
+        if steps and steps[-1].banded and dpi >= steps[-1].settings.ocr_dpi:
+            break
+        steps.append(
+            RetryStep(
+                settings=replace(
+                    settings,
+                    ocr_dpi=dpi,
+                    ocr_preprocess_grayscale=True,
+                    ocr_use_embedded_images=False,
+                    ocr_batch_size=1,
+                ),
+                banded=banded,
+            )
+        )
+    return steps
+
+
+def render_banded(page: fitz.Page, dpi: int) -> Image.Image:
+    """Render ``page`` in 8-bit grayscale, a horizontal band at a time.
+
+    Peak memory is the grayscale page plus one band, instead of a full RGB
+    pixmap and its copy.
+    """
+    matrix = fitz.Matrix(dpi / 72.0, dpi / 72.0)
+    full = (page.rect * matrix).irect
+    image = Image.new("L", (full.width, full.height), 255)
+    band_height = _BAND_ROWS * 72.0 / dpi
+    top = page.rect.y0
+    while top < page.rect.y1:
+        clip = fitz.Rect(page.rect.x0, top, page.rect.x1, min(top + band_height, page.rect.y1))
+        pix = page.get_pixmap(matrix=matrix, clip=clip, colorspace=fitz.csGRAY, alpha=False)
+        band = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+        image.paste(band, (pix.x - full.x0, pix.y - full.y0))
+        top += band_height
+    return image
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from enum import Enum
+from typing import Any
+
+from roop_pdfmd.core.models import AppSettings, OcrThreadPolicy
+
+
+class Preset(str, Enum):
+    FAST = "fast"
+    BALANCED = "balanced"
+    ACCURATE = "accurate"
+
+
+_DEFAULTS = AppSettings()
+
+# Each preset sets every one of these together; "balanced" is the defaults.
+PRESET_FIELDS = (
+    "ocr_dpi",
+    "ocr_preprocess_grayscale",
+    "ocr_preprocess_autocontrast",
+    "ocr_preprocess_threshold",
+    "ocr_use_embedded_images",
+    "ocr_psm",
+    "ocr_min_text_chars",
+    "ocr_image_text_max_chars",
+    "skip_blank_pages",
+    "ocr_thread_policy",
+    "ocr_batch_size",
+    "page_retry_attempts",
+)
+
+PRESETS: dict[Preset, dict[str, Any]] = {
+    # Trusts text layers more, skips blank pages and batches OCR; Tesseract
+    # reads each page as one block instead of analysing its layout.
+    Preset.FAST: {
+        "ocr_dpi": 200,
+        "ocr_preprocess_grayscale": True,
+        "ocr_preprocess_autocontrast": False,
+        "ocr_preprocess_threshold": False,
+        "ocr_use_embedded_images": True,
+        "ocr_psm": 6,
+        "ocr_min_text_chars": 10,
+        "ocr_image_text_max_chars": 20,
+        "skip_blank_pages": True,
+        "ocr_thread_policy": OcrThreadPolicy.THROUGHPUT,
+        "ocr_batch_size": 8,
+        "page_retry_attempts": 0,
+    },
+    Preset.BALANCED: {name: getattr(_DEFAULTS, name) for name in PRESET_FIELDS},
+    # Higher DPI and a stricter text-layer check (scans with a thin or bad
+    # OCR layer get OCRed again). No thresholding: Tesseract binarises
+    # adaptively itself and a global threshold mostly loses faint strokes.
+    Preset.ACCURATE: {
+        "ocr_dpi": 400,
+        "ocr_preprocess_grayscale": True,
+        "ocr_preprocess_autocontrast": True,
+        "ocr_preprocess_threshold": False,
+        "ocr_use_embedded_images": True,
+        "ocr_psm": 3,
+        "ocr_min_text_chars": 25,
+        "ocr_image_text_max_chars": 150,
+        "skip_blank_pages": False,
+        "ocr_thread_policy": OcrThreadPolicy.THROUGHPUT,
+        "ocr_batch_size": 1,
+        "page_retry_attempts": 2,
+    },
+}
+
+
+def apply_preset(settings: AppSettings, preset: Preset | str) -> AppSettings:
+    """``settings`` with every preset-controlled field set from ``preset``."""
+    try:
+        preset = Preset(preset)
+    except ValueError:
+        names = ", ".join(item.value for item in Preset)
+        raise ValueError(f"Unknown preset: {preset} (expected one of {names})") from None
+    return replace(settings, **PRESETS[preset])
+
+
+def matching_preset(settings: AppSettings) -> str:
+    """Name of the preset ``settings`` correspond to, or "" for custom settings."""
+    for preset, values in PRESETS.items():
+        if all(getattr(settings, name) == value for name, value in values.items()):
+            return preset.value
+    return ""
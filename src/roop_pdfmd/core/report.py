@@ -0,0 +1,283 @@
+"""Corpus-wide performance report aggregated from ``.meta.json`` files.
+
+Metadata files are read one at a time and folded into fixed-size
+aggregates, so memory use does not grow with the number of files: page
+durations go into logarithmic buckets (percentiles within 1%) and only the
+slowest few documents are kept.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from roop_pdfmd.core.models import PageMode
+from roop_pdfmd.utils.logging_utils import get_logger
+
+
+METADATA_SUFFIX = ".meta.json"
+PERCENTILES = (50, 90, 95, 99)
+
+# Adjacent buckets differ by 2%; a percentile is reported as the geometric
+# middle of its bucket, clamped to the smallest/largest duration seen.
+_BUCKET_RATIO = 1.02
+_MIN_SECONDS = 1e-4
+
+
+class ReportError(Exception):
+    """Raised when a report cannot be built."""
+
+
+@dataclass(slots=True)
+class DocumentSummary:
+    metadata_path: str
+    input_pdf: str
+    pages: int
+    ocr_pages: int
+    error_pages: int
+    duration_seconds: float
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+
+class DurationHistogram:
+    """Approximate percentiles of page durations in constant memory."""
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.total_seconds = 0.0
+        self.min_seconds = math.inf
+        self.max_seconds = 0.0
+
+    def add(self, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        index = _bucket(seconds)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.min_seconds = min(self.min_seconds, seconds)
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """Nearest-rank ``percent`` percentile; 0.0 without samples."""
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(percent / 100 * self.count), 1)
+        if rank >= self.count:
+            return self.max_seconds
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                middle = _MIN_SECONDS * _BUCKET_RATIO ** (index - 0.5) if index else 0.0
+                return min(max(middle, self.min_seconds), self.max_seconds)
+        return self.max_seconds
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "pages": self.count,
+            "mean": self.total_seconds / self.count if self.count else 0.0,
+            **{f"p{percent}": self.percentile(percent) for percent in PERCENTILES},
+            "max": self.max_seconds,
+        }
+
+
+@dataclass(slots=True)
+class CorpusReport:
+    documents: int = 0
+    unreadable_files: int = 0
+    cancelled_documents: int = 0
+    assembled_documents: int = 0
+    documents_with_errors: int = 0
+    pages: int = 0
+    extracted_pages: int = 0
+    ocr_pages: int = 0
+    blank_pages: int = 0
+    error_pages: int = 0
+    retried_pages: int = 0
+    duration_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    page_seconds: dict[str, dict[str, float]] = field(default_factory=dict)
+    slowest_documents: list[DocumentSummary] = field(default_factory=list)
+
+    @property
+    def pages_per_second(self) -> float:
+        """Pages per second of conversion time, summed over documents.
+
+        Documents merged from shards count their summed page times, since
+        their recorded duration covers the merge only.
+        """
+        return self.pages / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+    @property
+    def ocr_ratio(self) -> float:
+        return self.ocr_pages / self.pages if self.pages else 0.0
+
+    @property
+    def page_error_rate(self) -> float:
+        return self.error_pages / self.pages if self.pages else 0.0
+
+    @property
+    def document_error_rate(self) -> float:
+        return self.documents_with_errors / self.documents if self.documents else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload.update(
+            pages_per_second=self.pages_per_second,
+            ocr_ratio=self.ocr_ratio,
+            page_error_rate=self.page_error_rate,
+            document_error_rate=self.document_error_rate,
+        )
+        for summary, document in zip(payload["slowest_documents"], self.slowest_documents):
+            summary["pages_per_second"] = document.pages_per_second
+        return payload
+
+    def format_table(self) -> str:
+        lines = [
+            f"Documents         {self.documents}"
+            f" ({self.cancelled_documents} cancelled, {self.assembled_documents} merged"
+            f" from shards, {self.unreadable_files} unreadable)",
+            f"Pages             {self.pages} ({self.extracted_pages} text-layer, "
+            f"{self.ocr_pages} OCR, {self.blank_pages} blank)",
+            f"OCR ratio         {self.ocr_ratio:.1%}",
+            f"Conversion time   {self.duration_seconds:.1f}s ({self.cpu_seconds:.1f}s CPU)",
+            f"Pages/sec         {self.pages_per_second:.2f}",
+            f"Page errors       {self.error_pages} ({self.page_error_rate:.2%}),"
+            f" {self.retried_pages} page(s) retried",
+            f"Error documents   {self.documents_with_errors} ({self.document_error_rate:.2%})",
+            "",
+            f"{'page seconds':<14}{'pages':>9}{'mean':>9}"
+            + "".join(f"{f'p{percent}':>9}" for percent in PERCENTILES)
+            + f"{'max':>9}",
+        ]
+        for label, stats in self.page_seconds.items():
+            lines.append(
+                f"{label:<14}{stats['pages']:>9}{stats['mean']:>9.3f}"
+                + "".join(f"{stats[f'p{percent}']:>9.3f}" for percent in PERCENTILES)
+                + f"{stats['max']:>9.3f}"
+            )
+        if self.slowest_documents:
+            lines += ["", f"{'seconds':>10}{'pages':>8}{'pages/sec':>11}  document"]
+            lines += [
+                f"{document.duration_seconds:>10.1f}{document.pages:>8}"
+                f"{document.pages_per_second:>11.2f}  {document.input_pdf}"
+                for document in self.slowest_documents
+            ]
+        return "\n".join(lines)
+
+
+class CorpusReportBuilder:
+    """Folds metadata records into a :class:`CorpusReport` one at a time."""
+
+    def __init__(self, slowest: int = 10) -> None:
+        self._report = CorpusReport()
+        self._slowest = max(slowest, 0)
+        self._slow: list[tuple[float, str, int, DocumentSummary]] = []
+        self._histograms = {"all": DurationHistogram()} | {
+            mode.value: DurationHistogram() for mode in PageMode
+        }
+
+    def add_file(self, metadata_path: str | Path) -> None:
+        try:
+            with open(metadata_path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+            self.add(payload, str(metadata_path))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            self._report.unreadable_files += 1
+            get_logger("report").warning("Skipping metadata %s: %s", metadata_path, exc)
+
+    def add(self, payload: dict[str, Any], metadata_path: str = "") -> None:
+        # Parse the whole record before counting it, so a malformed one is
+        # skipped entirely rather than half-counted.
+        pages = payload.get("pages", [])
+        durations = [(str(page["mode"]), float(page["duration_seconds"])) for page in pages]
+        assembled = bool(payload.get("assembled"))
+        if assembled:
+            duration_seconds = sum(seconds for _, seconds in durations)
+        else:
+            duration_seconds = float(payload.get("duration_seconds", 0.0))
+        summary = DocumentSummary(
+            metadata_path=metadata_path,
+            input_pdf=str(payload.get("input_pdf", "")),
+            pages=int(payload.get("processed_pages", len(pages))),
+            ocr_pages=int(payload.get("ocr_pages", 0)),
+            error_pages=sum(bool(page.get("error")) for page in pages),
+            duration_seconds=duration_seconds,
+        )
+        extracted_pages = int(payload.get("extracted_pages", 0))
+        blank_pages = int(payload.get("blank_pages", 0))
+        retried_pages = int(payload.get("retried_pages", 0))
+        cpu_seconds = float(payload.get("cpu_seconds", 0.0))
+
+        report = self._report
+        report.documents += 1
+        report.cancelled_documents += bool(payload.get("cancelled"))
+        report.assembled_documents += assembled
+        report.documents_with_errors += bool(payload.get("errors"))
+        report.pages += summary.pages
+        report.extracted_pages += extracted_pages
+        report.ocr_pages += summary.ocr_pages
+        report.blank_pages += blank_pages
+        report.error_pages += summary.error_pages
+        report.retried_pages += retried_pages
+        report.duration_seconds += summary.duration_seconds
+        report.cpu_seconds += cpu_seconds
+
+        for mode, seconds in durations:
+            self._histograms["all"].add(seconds)
+            self._histograms.setdefault(mode, DurationHistogram()).add(seconds)
+
+        if self._slowest:
+            item = (summary.duration_seconds, metadata_path, report.documents, summary)
+            if len(self._slow) < self._slowest:
+                heapq.heappush(self._slow, item)
+            elif item > self._slow[0]:
+                heapq.heapreplace(self._slow, item)
+
+    def report(self) -> CorpusReport:
+        report = self._report
+        report.page_seconds = {
+            label: histogram.to_dict()
+            for label, histogram in self._histograms.items()
+            if histogram.count
+        }
+        report.slowest_documents = [summary for *_, summary in sorted(self._slow, reverse=True)]
+        return report
+
+
+def iter_metadata_files(paths: Iterable[str | Path]) -> Iterator[Path]:
+    """``.meta.json`` files given directly or found below the given folders, in path order."""
+    for raw in paths:
+        path = Path(raw).expanduser()
+        if not path.is_dir():
+            if path.is_file():
+                yield path
+                continue
+            raise ReportError(f"Not a file or folder: {path}")
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(METADATA_SUFFIX):
+                    yield Path(root) / name
+
+
+def build_report(paths: Iterable[str | Path], slowest: int = 10) -> CorpusReport:
+    builder = CorpusReportBuilder(slowest=slowest)
+    for metadata_path in iter_metadata_files(paths):
+        builder.add_file(metadata_path)
+    return builder.report()
+
+
+def _bucket(seconds: float) -> int:
+    if seconds <= _MIN_SECONDS:
+        return 0
+    return 1 + int(math.log(seconds / _MIN_SECONDS, _BUCKET_RATIO))
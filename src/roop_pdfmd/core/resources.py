@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, replace
+
+from roop_pdfmd.core.models import AppSettings, MemoryLimitAction
+
+
+_MIN_DEGRADED_DPI = 150
+# Pages converted after a degradation before memory is judged again; RSS
+# rarely drops right away because freed memory stays with the allocator.
+_DEGRADE_COOLDOWN_PAGES = 5
+_MB = 1024 * 1024
+
+# tracemalloc is process-wide; concurrent conversions share one tracing session.
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+
+# CPU time of the child processes (Tesseract) each thread has waited for.
+_child_cpu = threading.local()
+
+
+@dataclass(slots=True)
+class ResourceSample:
+    """Process-wide memory, shared by every conversion running in the process."""
+
+    rss_bytes: int = 0
+    python_peak_bytes: int = 0
+
+
+def thread_cpu_seconds() -> float:
+    """CPU time of the calling thread plus the child processes it has waited for.
+
+    Differences of this clock only count the work of the thread that reads
+    it, so conversions running side by side don't charge each other.
+    """
+    return time.thread_time() + getattr(_child_cpu, "seconds", 0.0)
+
+
+def add_child_cpu_seconds(seconds: float) -> None:
+    """Charge the CPU time of a reaped child process to the calling thread."""
+    _child_cpu.seconds = getattr(_child_cpu, "seconds", 0.0) + seconds
+
+
+def memory_usage() -> tuple[int, int]:
+    """Current and peak resident set size in bytes; 0 where the platform can't tell."""
+    if sys.platform == "win32":
+        return _windows_memory_usage()
+
+    peak = 0
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes.
+        peak = peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        pass
+
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            rss = int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        rss = peak
+    return rss, max(peak, rss)
+
+
+def _windows_memory_usage() -> tuple[int, int]:  # pragma: no cover - Windows only
+    import ctypes
+    from ctypes import wintypes
+
+    class _Counters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = _Counters()
+    counters.cb = ctypes.sizeof(counters)
+    try:
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(
+            process, ctypes.byref(counters), counters.cb
+        ):
+            return 0, 0
+    except (AttributeError, OSError):
+        return 0, 0
+    return int(counters.WorkingSetSize), int(counters.PeakWorkingSetSize)
+
+
+class ResourceMonitor:
+    """Samples process memory between pages.
+
+    With ``track_python_memory`` tracemalloc reports the peak of Python
+    allocations since the previous sample. Tracing slows Python code down
+    noticeably, so it is opt-in and stopped again once the last monitor that
+    started it stops. Concurrent monitors share the process-wide peak.
+    """
+
+    def __init__(self, track_python_memory: bool = False) -> None:
+        self._track_python_memory = track_python_memory
+        self._started_tracing = False
+
+    def start(self) -> None:
+        global _tracing_users
+
+        if not self._track_python_memory or self._started_tracing:
+            return
+        with _tracing_lock:
+            if _tracing_users == 0 and tracemalloc.is_tracing():
+                # Someone else traces; leave their session alone.
+                return
+            if _tracing_users == 0:
+                tracemalloc.start()
+            _tracing_users += 1
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        global _tracing_users
+
+        if not self._started_tracing:
+            return
+        with _tracing_lock:
+            _tracing_users -= 1
+            if _tracing_users == 0:
+                tracemalloc.stop()
+            self._started_tracing = False
+
+    def sample(self) -> ResourceSample:
+        rss, _ = memory_usage()
+        python_peak = 0
+        if self._track_python_memory and tracemalloc.is_tracing():
+            python_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+        return ResourceSample(rss_bytes=rss, python_peak_bytes=python_peak)
+
+
+class MemoryGuard:
+    """Soft memory ceiling, checked before each page.
+
+    Above the limit it warns once per excursion, or with
+    :attr:`MemoryLimitAction.DEGRADE` switches to cheaper OCR settings
+    (lower DPI, no batching) until there is nothing left to give up.
+    """
+
+    def __init__(self, soft_limit_mb: int, action: MemoryLimitAction | str) -> None:
+        self._limit_bytes = max(soft_limit_mb, 0) * _MB
+        self._action = MemoryLimitAction(action)
+        self._over = False
+        self._cooldown = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._limit_bytes > 0
+
+    def check(self, settings: AppSettings) -> tuple[AppSettings, str]:
+        """Return the settings to use for the next page and a warning, if any."""
+        if not self.enabled:
+            return settings, ""
+        if self._cooldown:
+            self._cooldown -= 1
+            return settings, ""
+
+        rss, _ = memory_usage()
+        if rss > self._limit_bytes:
+            gc.collect()
+            rss, _ = memory_usage()
+        if rss <= self._limit_bytes:
+            self._over = False
+            return settings, ""
+
+        usage = (
+            f"Memory use {rss // _MB} MB is above the soft limit of "
+            f"{self._limit_bytes // _MB} MB"
+        )
+        if self._action == MemoryLimitAction.DEGRADE:
+            degraded = degraded_settings(settings)
+            if degraded is not None:
+                self._over = True
+                self._cooldown = _DEGRADE_COOLDOWN_PAGES
+                return degraded, (
+                    f"{usage}; continuing with OCR at {degraded.ocr_dpi} DPI, "
+                    f"{degraded.ocr_batch_size} page(s) per batch"
+                )
+        if self._over:
+            return settings, ""
+        self._over = True
+        return settings, usage
+
+
+def degraded_settings(settings: AppSettings) -> AppSettings | None:
+    """Cheaper OCR settings for memory pressure, or None when nothing is left to trade."""
+    changes: dict[str, int] = {}
+    dpi = max(_MIN_DEGRADED_DPI, settings.ocr_dpi * 2 // 3)
+    if dpi < settings.ocr_dpi:
+        changes["ocr_dpi"] = dpi
+    if settings.ocr_batch_size > 1:
+        changes["ocr_batch_size"] = 1
+    return replace(settings, **changes) if changes else None
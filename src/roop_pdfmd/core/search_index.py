@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Iterator
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    markdown_path TEXT NOT NULL DEFAULT '',
+    page_count INTEGER NOT NULL DEFAULT 0,
+    indexed_at REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS page_texts (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id),
+    page_number INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS page_texts_document ON page_texts(document_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS page_search USING fts5(
+    text,
+    content = 'page_texts',
+    content_rowid = 'id',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS page_texts_insert AFTER INSERT ON page_texts BEGIN
+    INSERT INTO page_search (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS page_texts_delete AFTER DELETE ON page_texts BEGIN
+    INSERT INTO page_search (page_search, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+# Pages are written in short transactions so several converters can share
+# one corpus index without holding the write lock for a whole document.
+_FLUSH_PAGES = 64
+
+
+class SearchIndexError(Exception):
+    """Raised for unusable index files or malformed queries."""
+
+
+@dataclass(slots=True)
+class SearchHit:
+    document: str
+    page_number: int
+    snippet: str
+    score: float
+    markdown_path: str = ""
+
+
+class SearchIndex:
+    """SQLite FTS5 index of converted page text, keyed by document and page.
+
+    One file can serve a single output directory or a whole corpus. Safe to
+    share between threads; separate processes coordinate through SQLite's own
+    locking.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30.0) -> None:
+        self._path = Path(path).expanduser().resolve()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        try:
+            self._conn = sqlite3.connect(
+                self._path, timeout=timeout, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as exc:
+            raise SearchIndexError(f"Unable to open search index {self._path}: {exc}") from exc
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def writer(self, document: str | Path, markdown_path: str | Path = "") -> DocumentIndexWriter:
+        """Start (re)indexing ``document``; its previously indexed pages are dropped."""
+        document = str(document)
+        with self._lock, self._transaction():
+            self._conn.execute(
+                "INSERT INTO documents (path, markdown_path) VALUES (?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET markdown_path = excluded.markdown_path",
+                (document, str(markdown_path)),
+            )
+            (document_id,) = self._conn.execute(
+                "SELECT id FROM documents WHERE path = ?", (document,)
+            ).fetchone()
+            self._conn.execute("DELETE FROM page_texts WHERE document_id = ?", (document_id,))
+        return DocumentIndexWriter(self, document_id)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        document: str | Path | None = None,
+        raw: bool = False,
+    ) -> list[SearchHit]:
+        """Best matches first. Plain queries match all terms; ``raw`` passes FTS5 syntax."""
+        match = query if raw else _plain_query(query)
+        if not match:
+            return []
+
+        sql = (
+            "SELECT documents.path, page_texts.page_number, "
+            "snippet(page_search, 0, '[', ']', '…', 12), bm25(page_search), "
+            "documents.markdown_path "
+            "FROM page_search "
+            "JOIN page_texts ON page_texts.id = page_search.rowid "
+            "JOIN documents ON documents.id = page_texts.document_id "
+            "WHERE page_search MATCH ?"
+        )
+        params: list[object] = [match]
+        if document is not None:
+            sql += " AND documents.path = ?"
+            params.append(str(document))
+        sql += " ORDER BY bm25(page_search) LIMIT ?"
+        params.append(max(limit, 1))
+
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as exc:
+            raise SearchIndexError(f"Invalid search query {query!r}: {exc}") from exc
+        return [
+            SearchHit(
+                document=path,
+                page_number=int(page_number),
+                snippet=snippet,
+                score=-score,
+                markdown_path=markdown_path,
+            )
+            for path, page_number, snippet, score, markdown_path in rows
+        ]
+
+    def documents(self) -> list[tuple[str, int]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, page_count FROM documents ORDER BY path"
+            ).fetchall()
+        return [(path, int(page_count)) for path, page_count in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> SearchIndex:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _write_pages(self, document_id: int, rows: list[tuple[str, int, int]]) -> None:
+        with self._lock, self._transaction():
+            self._conn.executemany(
+                "INSERT INTO page_texts (text, document_id, page_number) VALUES (?, ?, ?)", rows
+            )
+
+    def _finish(self, document_id: int, page_count: int) -> None:
+        with self._lock, self._transaction():
+            self._conn.execute(
+                "UPDATE documents SET page_count = ?, indexed_at = ? WHERE id = ?",
+                (page_count, time.time(), document_id),
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+
+class DocumentIndexWriter:
+    """Buffers one document's pages and writes them to the index in batches."""
+
+    def __init__(self, index: SearchIndex, document_id: int) -> None:
+        self._index = index
+        self._document_id = document_id
+        self._pending: list[tuple[str, int, int]] = []
+        self._page_count = 0
+
+    def add_page(self, page_number: int, text: str) -> None:
+        self._pending.append((text, self._document_id, page_number))
+        self._page_count += 1
+        if len(self._pending) >= _FLUSH_PAGES:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._index._write_pages(self._document_id, self._pending)
+            self._pending = []
+
+    def finish(self) -> None:
+        self.flush()
+        self._index._finish(self._document_id, self._page_count)
+
+
+def _plain_query(query: str) -> str:
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"' for term in terms)
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from threading import Event, Lock
+from typing import Iterable, Iterator
+
+from roop_pdfmd.core.converter import (
+    ConversionError,
+    Converter,
+    PageCallback,
+    ProgressCallback,
+    resolve_tesseract,
+)
+from roop_pdfmd.core.cpu_budget import CpuBudget, default_cpu_budget
+from roop_pdfmd.core.models import AppSettings, ConversionResult, SessionStats
+from roop_pdfmd.core.ocr_backends import OcrBackend, create_ocr_backend
+from roop_pdfmd.utils.logging_utils import get_logger
+
+
+ConversionJob = tuple[str | Path, str | Path]
+
+
+class ConverterSession:
+    """Long-lived context for converting many documents.
+
+    The Tesseract binary is located and its version probed once per configured
+    path, and OCR backends are created once per name and shared, instead of
+    per document. All conversions share one :class:`Converter` with their own
+    cancellation token each, so ``convert`` may be called from several
+    threads at once; ``submit`` and ``convert_many`` run documents on the
+    session's own worker threads.
+    """
+
+    def __init__(
+        self,
+        settings: AppSettings | None = None,
+        max_workers: int = 1,
+        prescan_pages: int = 3,
+        cpu_budget: CpuBudget | None = None,
+    ) -> None:
+        self._settings = settings or AppSettings()
+        self._max_workers = max(max_workers, 1)
+        self._cpu_budget = cpu_budget or default_cpu_budget
+        self._logger = get_logger("session")
+        self._lock = Lock()
+        self._tesseract_cmds: dict[str, str] = {}
+        self._backends: dict[str, OcrBackend] = {}
+        self._converter = Converter(
+            prescan_pages=prescan_pages,
+            cpu_budget=self._cpu_budget,
+            tesseract_resolver=self._resolve_tesseract,
+            ocr_backend_factory=self._ocr_backend,
+        )
+        self._active: set[Event] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+        self._started_at = time.perf_counter()
+        self._stats = SessionStats()
+
+    @property
+    def settings(self) -> AppSettings:
+        return self._settings
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def converter(self) -> Converter:
+        """The shared converter, for page-range, assembly and calibration runs."""
+        return self._converter
+
+    def convert(
+        self,
+        input_pdf: str | Path,
+        output_dir: str | Path,
+        settings: AppSettings | None = None,
+        progress_callback: ProgressCallback | None = None,
+        page_callback: PageCallback | None = None,
+        output_name: str = "",
+    ) -> ConversionResult:
+        cancel_event = self._checkout()
+        started = time.perf_counter()
+        try:
+            result = self._converter.convert(
+                input_pdf,
+                output_dir,
+                settings or self._settings,
+                progress_callback=progress_callback,
+                page_callback=page_callback,
+                cancel_event=cancel_event,
+                output_name=output_name,
+            )
+        except Exception:
+            self._record(None, time.perf_counter() - started)
+            raise
+        finally:
+            with self._lock:
+                self._active.discard(cancel_event)
+
+        self._record(result, time.perf_counter() - started)
+        return result
+
+    def submit(
+        self,
+        input_pdf: str | Path,
+        output_dir: str | Path,
+        settings: AppSettings | None = None,
+    ) -> Future[ConversionResult]:
+        """Queue a conversion on the session's worker threads."""
+        with self._lock:
+            if self._closed:
+                raise ConversionError("Converter session is closed.")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="roop-pdfmd-session",
+                )
+            executor = self._executor
+        return executor.submit(self.convert, input_pdf, output_dir, settings)
+
+    def convert_many(
+        self,
+        jobs: Iterable[ConversionJob],
+        settings: AppSettings | None = None,
+    ) -> Iterator[ConversionResult | ConversionError]:
+        """Convert ``(input_pdf, output_dir)`` pairs, yielding results in input order.
+
+        A document that fails yields a :class:`ConversionError` instead of
+        stopping the batch; unexpected errors are wrapped in one. Closing the
+        generator early cancels the documents that have not started yet.
+        """
+        jobs = list(jobs)
+        futures = [self.submit(input_pdf, output_dir, settings) for input_pdf, output_dir in jobs]
+        try:
+            for (input_pdf, _), future in zip(jobs, futures):
+                try:
+                    yield future.result()
+                except ConversionError as exc:
+                    yield exc
+                except Exception as exc:
+                    error = ConversionError(f"Conversion of {input_pdf} failed: {exc}")
+                    error.__cause__ = exc
+                    yield error
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def stats(self) -> SessionStats:
+        with self._lock:
+            return replace(self._stats, uptime_seconds=time.perf_counter() - self._started_at)
+
+    def cancel_all(self) -> None:
+        with self._lock:
+            active = list(self._active)
+        for cancel_event in active:
+            cancel_event.set()
+
+    def close(self) -> None:
+        """Cancel running conversions, stop the worker threads and release OCR engines."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            executor = self._executor
+        self.cancel_all()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            backends, self._backends = list(self._backends.values()), {}
+        for backend in backends:
+            backend.close()
+        self._logger.info("Converter session closed | %s", self.stats())
+
+    def __enter__(self) -> ConverterSession:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _checkout(self) -> Event:
+        # Registered before the conversion starts so close() can't miss it.
+        cancel_event = Event()
+        with self._lock:
+            if self._closed:
+                raise ConversionError("Converter session is closed.")
+            self._active.add(cancel_event)
+        return cancel_event
+
+    def _resolve_tesseract(self, tesseract_path: str) -> str:
+        key = tesseract_path.strip()
+        with self._lock:
+            cached = self._tesseract_cmds.get(key)
+        if cached:
+            return cached
+
+        # Probing runs outside the lock; a concurrent first probe is harmless.
+        tesseract_cmd = resolve_tesseract(key)
+        with self._lock:
+            self._stats.tesseract_probes += 1
+            return self._tesseract_cmds.setdefault(key, tesseract_cmd)
+
+    def _ocr_backend(self, name: str) -> OcrBackend:
+        with self._lock:
+            backend = self._backends.get(name)
+            if backend is None:
+                backend = create_ocr_backend(name)
+                self._backends[name] = backend
+            return backend
+
+    def _record(self, result: ConversionResult | None, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats
+            stats.conversion_seconds += seconds
+            if result is None:
+                stats.documents_failed += 1
+                return
+            if result.cancelled:
+                stats.documents_cancelled += 1
+            else:
+                stats.documents_converted += 1
+            stats.pages_processed += result.processed_pages
+            stats.extracted_pages += result.extracted_pages
+            stats.ocr_pages += result.ocr_pages
+            stats.blank_pages += result.blank_pages
+            stats.page_errors += len(result.errors)
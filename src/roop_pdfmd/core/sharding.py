@@ -0,0 +1,613 @@
+"""Sharded conversion through a job queue kept in a shared directory.
+
+A document is published as page-range shards; any number of worker processes,
+on any host that mounts the queue directory, claim shards by creating lease
+files and write each shard's raw page text next to them. Once every shard is
+done the merge step post-processes the text in page order and writes the same
+``.md``/``.txt``/``.meta.json`` files a single-process conversion would.
+
+Queue layout::
+
+    <queue>/<job id>/job.json          input, output dir, settings, shard ranges
+    <queue>/<job id>/NNNNN.lease       current claim (worker, expiry)
+    <queue>/<job id>/NNNNN.jsonl       finished shard, one JSON object per page
+    <queue>/<job id>/NNNNN.failures    one JSON line per failed attempt
+
+Claims rely on exclusive file creation, which local filesystems and NFSv3+
+provide. Lease expiry compares wall-clock times, so hosts need roughly
+synchronised clocks.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import shutil
+import socket
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+from threading import Event, Thread
+from typing import Iterator
+
+import fitz
+
+from roop_pdfmd.core.calibration import apply_candidate
+from roop_pdfmd.core.converter import ConversionError, ProgressCallback
+from roop_pdfmd.core.models import (
+    AppSettings,
+    CalibrationCandidate,
+    CalibrationResult,
+    ConversionResult,
+    MemoryLimitAction,
+    OcrThreadPolicy,
+    PageAttempt,
+    PageMode,
+    PageResult,
+)
+from roop_pdfmd.core.session import ConverterSession
+from roop_pdfmd.utils.logging_utils import get_logger
+
+
+DEFAULT_SHARD_PAGES = 200
+DEFAULT_LEASE_SECONDS = 600.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+_JOB_FILE = "job.json"
+_UNREADABLE_LEASE_GRACE = 60.0
+
+
+class ShardError(Exception):
+    """Raised for unknown jobs, malformed queue files and incomplete merges."""
+
+
+@dataclass(slots=True)
+class ShardJob:
+    job_id: str
+    input_pdf: Path
+    output_dir: Path
+    settings: AppSettings
+    total_pages: int
+    shards: list[tuple[int, int]]
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    created_at: float = 0.0
+    calibration: CalibrationResult | None = None
+
+
+@dataclass(slots=True)
+class ShardStatus:
+    job_id: str
+    total_shards: int
+    done: int
+    leased: int
+    pending: int
+    failed: int
+
+    @property
+    def complete(self) -> bool:
+        return self.done == self.total_shards
+
+
+class ShardLease:
+    """A claimed shard. Kept alive by :meth:`renew` until completed or failed."""
+
+    def __init__(
+        self,
+        queue: ShardQueue,
+        job: ShardJob,
+        index: int,
+        worker_id: str,
+        token: str,
+        lease_seconds: float,
+    ) -> None:
+        self.queue = queue
+        self.job = job
+        self.index = index
+        self.worker_id = worker_id
+        self.token = token
+        self.lease_seconds = lease_seconds
+
+    @property
+    def first_page(self) -> int:
+        return self.job.shards[self.index][0]
+
+    @property
+    def last_page(self) -> int:
+        return self.job.shards[self.index][1]
+
+    def renew(self) -> bool:
+        """Push the expiry forward; False if the lease expired and was taken over."""
+        return self.queue._renew(self)
+
+    def complete(self, pages: list[tuple[PageResult, str]]) -> None:
+        self.queue._complete(self, pages)
+
+    def fail(self, error: str) -> None:
+        self.queue._fail(self, error)
+
+
+class ShardQueue:
+    """Shard jobs in a shared queue directory.
+
+    Calibration and merging go through ``session`` (a private one is created
+    on first use), so Tesseract is resolved and OCR backends are built once
+    per queue object rather than per call.
+    """
+
+    def __init__(self, root: str | Path, session: ConverterSession | None = None) -> None:
+        self.root = Path(root).expanduser().resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._logger = get_logger("sharding")
+        self._session = session
+
+    @property
+    def session(self) -> ConverterSession:
+        if self._session is None:
+            self._session = ConverterSession()
+        return self._session
+
+    def publish(
+        self,
+        input_pdf: str | Path,
+        output_dir: str | Path,
+        settings: AppSettings,
+        shard_pages: int = DEFAULT_SHARD_PAGES,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> ShardJob:
+        """Split ``input_pdf`` into shards of ``shard_pages`` pages and queue them.
+
+        Workers open ``input_pdf`` by its absolute path, so it has to be
+        reachable under the same path on every worker host. With
+        ``ocr_calibrate`` the calibration pass runs here, once, and every
+        shard uses the configuration it picked.
+        """
+        input_pdf = Path(input_pdf).expanduser().resolve()
+        output_dir = Path(output_dir).expanduser().resolve()
+        if not input_pdf.is_file():
+            raise ConversionError(f"Input PDF not found: {input_pdf}")
+        try:
+            with fitz.open(input_pdf) as doc:
+                total_pages = doc.page_count
+        except Exception as exc:  # pragma: no cover - backend-specific
+            raise ConversionError(f"Unable to open PDF: {exc}") from exc
+        if total_pages <= 0:
+            raise ConversionError("PDF contains zero pages.")
+
+        calibration = None
+        if settings.ocr_calibrate:
+            calibration = self.session.converter.calibrate(input_pdf, settings)
+            if calibration is not None and calibration.chosen is not None:
+                settings = apply_candidate(settings, calibration.chosen)
+            settings = replace(settings, ocr_calibrate=False)
+
+        shard_pages = max(shard_pages, 1)
+        job = ShardJob(
+            job_id=f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}",
+            input_pdf=input_pdf,
+            output_dir=output_dir,
+            settings=settings,
+            total_pages=total_pages,
+            shards=[
+                (first, min(first + shard_pages - 1, total_pages))
+                for first in range(1, total_pages + 1, shard_pages)
+            ],
+            max_attempts=max(max_attempts, 1),
+            created_at=time.time(),
+            calibration=calibration,
+        )
+
+        # Written under a temporary name so workers never see a partial job.
+        staging = self.root / f".{job.job_id}.tmp"
+        staging.mkdir()
+        payload = asdict(job)
+        payload["input_pdf"] = str(job.input_pdf)
+        payload["output_dir"] = str(job.output_dir)
+        (staging / _JOB_FILE).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        staging.rename(self.root / job.job_id)
+
+        self._logger.info(
+            "Published %s | input=%s pages=%s shards=%s",
+            job.job_id,
+            input_pdf,
+            total_pages,
+            len(job.shards),
+        )
+        return job
+
+    def jobs(self) -> list[ShardJob]:
+        return [self.job(path.name) for path in sorted(self._job_dirs())]
+
+    def job(self, job_id: str) -> ShardJob:
+        job_file = self.root / job_id / _JOB_FILE
+        try:
+            data = json.loads(job_file.read_text(encoding="utf-8"))
+        except FileNotFoundError as exc:
+            raise ShardError(f"Unknown shard job: {job_id}") from exc
+        except (OSError, ValueError) as exc:
+            raise ShardError(f"Unreadable shard job {job_id}: {exc}") from exc
+        return ShardJob(
+            job_id=data["job_id"],
+            input_pdf=Path(data["input_pdf"]),
+            output_dir=Path(data["output_dir"]),
+            settings=_settings_from_dict(data["settings"]),
+            total_pages=int(data["total_pages"]),
+            shards=[(int(first), int(last)) for first, last in data["shards"]],
+            max_attempts=int(data.get("max_attempts", DEFAULT_MAX_ATTEMPTS)),
+            created_at=float(data.get("created_at", 0.0)),
+            calibration=_calibration_from_dict(data.get("calibration")),
+        )
+
+    def status(self, job_id: str) -> ShardStatus:
+        job = self.job(job_id)
+        counts = {"done": 0, "leased": 0, "pending": 0, "failed": 0}
+        now = time.time()
+        for index in range(len(job.shards)):
+            counts[self._shard_state(job, index, now)] += 1
+        return ShardStatus(job_id=job_id, total_shards=len(job.shards), **counts)
+
+    def claim(
+        self,
+        worker_id: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        job_id: str | None = None,
+    ) -> ShardLease | None:
+        """Claim the next open shard, oldest job first, taking over expired leases."""
+        jobs = [self.job(job_id)] if job_id else self.jobs()
+        now = time.time()
+        for job in jobs:
+            for index in range(len(job.shards)):
+                if self._shard_state(job, index, now) != "pending":
+                    continue
+                lease = self._try_lease(job, index, worker_id, lease_seconds)
+                if lease is not None:
+                    return lease
+        return None
+
+    def reset_failed(self, job_id: str) -> int:
+        """Make shards that used up their attempts claimable again."""
+        job = self.job(job_id)
+        reset = 0
+        for index in range(len(job.shards)):
+            failures = self._path(job, index, ".failures")
+            if failures.exists() and not self._path(job, index, ".jsonl").exists():
+                failures.unlink()
+                reset += 1
+        return reset
+
+    def merge(
+        self,
+        job_id: str,
+        progress_callback: ProgressCallback | None = None,
+        remove: bool = False,
+    ) -> ConversionResult:
+        """Write the job's final outputs; every shard must be done."""
+        job = self.job(job_id)
+        missing = [
+            f"{first}-{last}"
+            for index, (first, last) in enumerate(job.shards)
+            if not self._path(job, index, ".jsonl").exists()
+        ]
+        if missing:
+            raise ShardError(
+                f"Shard job {job_id} is incomplete; pending pages: {', '.join(missing)}"
+            )
+
+        result = self.session.converter.assemble(
+            job.input_pdf,
+            job.output_dir,
+            job.settings,
+            job.total_pages,
+            self._iter_shard_pages(job),
+            progress_callback=progress_callback,
+            calibration=job.calibration,
+        )
+        self._logger.info("Merged %s into %s", job_id, result.markdown_path)
+        if remove:
+            shutil.rmtree(self.root / job_id, ignore_errors=True)
+        return result
+
+    def _iter_shard_pages(self, job: ShardJob) -> Iterator[tuple[PageResult, str]]:
+        for index in range(len(job.shards)):
+            path = self._path(job, index, ".jsonl")
+            with path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    record = json.loads(line)
+                    text = record.pop("text")
+                    record["mode"] = PageMode(record["mode"])
+                    record["attempts"] = [
+                        PageAttempt(**attempt) for attempt in record.get("attempts", [])
+                    ]
+                    yield PageResult(**record), text
+
+    def _job_dirs(self) -> Iterator[Path]:
+        for path in self.root.iterdir():
+            if path.is_dir() and not path.name.startswith(".") and (path / _JOB_FILE).exists():
+                yield path
+
+    def _path(self, job: ShardJob, index: int, suffix: str) -> Path:
+        return self.root / job.job_id / f"{index:05d}{suffix}"
+
+    def _shard_state(self, job: ShardJob, index: int, now: float) -> str:
+        if self._path(job, index, ".jsonl").exists():
+            return "done"
+        if self._failure_count(job, index) >= job.max_attempts:
+            return "failed"
+        lease = _read_json(self._path(job, index, ".lease"))
+        if lease is not None and lease.get("expires_at", 0) > now:
+            return "leased"
+        return "pending"
+
+    def _failure_count(self, job: ShardJob, index: int) -> int:
+        try:
+            with self._path(job, index, ".failures").open("r", encoding="utf-8") as handle:
+                return sum(1 for line in handle if line.strip())
+        except FileNotFoundError:
+            return 0
+
+    def _try_lease(
+        self,
+        job: ShardJob,
+        index: int,
+        worker_id: str,
+        lease_seconds: float,
+    ) -> ShardLease | None:
+        lease_path = self._path(job, index, ".lease")
+        if lease_path.exists() and not self._break_expired(lease_path):
+            return None
+
+        token = uuid.uuid4().hex
+        payload = _lease_payload(worker_id, token, lease_seconds)
+        try:
+            fd = os.open(lease_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return None
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+
+        self._logger.info(
+            "Worker %s claimed %s shard %s (pages %s-%s)",
+            worker_id,
+            job.job_id,
+            index,
+            *job.shards[index],
+        )
+        return ShardLease(self, job, index, worker_id, token, lease_seconds)
+
+    def _break_expired(self, lease_path: Path) -> bool:
+        """Remove an expired lease; only one of several racing workers succeeds."""
+        lease = _read_json(lease_path)
+        if lease is None:
+            # Unreadable: just created and not yet written, gone, or left
+            # empty by a worker that died while claiming.
+            try:
+                age = time.time() - lease_path.stat().st_mtime
+            except FileNotFoundError:
+                return True
+            if age < _UNREADABLE_LEASE_GRACE:
+                return False
+            lease = {}
+        elif lease.get("expires_at", 0) > time.time():
+            return False
+
+        stale = lease_path.with_name(f"{lease_path.name}.{uuid.uuid4().hex}.stale")
+        try:
+            os.rename(lease_path, stale)
+        except FileNotFoundError:
+            return False
+        taken = _read_json(stale)
+        if taken is not None and taken.get("token") != lease.get("token"):
+            # Another worker replaced the lease in between; hand it back.
+            try:
+                os.link(stale, lease_path)
+            except OSError:
+                pass
+            stale.unlink(missing_ok=True)
+            return False
+        stale.unlink(missing_ok=True)
+        self._logger.warning(
+            "Lease %s of worker %s expired; shard is open again",
+            lease_path.name,
+            lease.get("worker"),
+        )
+        return True
+
+    def _renew(self, lease: ShardLease) -> bool:
+        lease_path = self._path(lease.job, lease.index, ".lease")
+        current = _read_json(lease_path)
+        if current is None or current.get("token") != lease.token:
+            return False
+        tmp_path = lease_path.with_name(f"{lease_path.name}.{lease.token}.tmp")
+        tmp_path.write_text(
+            json.dumps(_lease_payload(lease.worker_id, lease.token, lease.lease_seconds)),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, lease_path)
+        return True
+
+    def _complete(self, lease: ShardLease, pages: list[tuple[PageResult, str]]) -> None:
+        target = self._path(lease.job, lease.index, ".jsonl")
+        tmp_path = target.with_name(f"{target.name}.{lease.token}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            for result, text in pages:
+                record = {**asdict(result), "mode": result.mode.value, "text": text}
+                handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        # Shards are deterministic, so a late duplicate may safely overwrite.
+        os.replace(tmp_path, target)
+        self._release(lease)
+
+    def _fail(self, lease: ShardLease, error: str) -> None:
+        failures = self._path(lease.job, lease.index, ".failures")
+        record = {"worker": lease.worker_id, "error": error, "at": time.time()}
+        with failures.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+        self._release(lease)
+
+    def _release(self, lease: ShardLease) -> None:
+        lease_path = self._path(lease.job, lease.index, ".lease")
+        current = _read_json(lease_path)
+        if current is not None and current.get("token") == lease.token:
+            lease_path.unlink(missing_ok=True)
+
+
+def run_shard_worker(
+    queue_dir: str | Path,
+    worker_id: str | None = None,
+    job_id: str | None = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    poll_seconds: float = 5.0,
+    exit_when_idle: bool = True,
+    max_shards: int | None = None,
+    stop_event: Event | None = None,
+) -> int:
+    """Claim and convert shards until the queue is empty; returns the number converted.
+
+    With ``exit_when_idle`` off the worker keeps polling for newly published
+    jobs until ``stop_event`` is set.
+    """
+    session = ConverterSession()
+    try:
+        return _work_shards(
+            ShardQueue(queue_dir, session=session),
+            worker_id or f"{socket.gethostname()}-{os.getpid()}",
+            job_id,
+            lease_seconds,
+            poll_seconds,
+            exit_when_idle,
+            max_shards,
+            stop_event or Event(),
+        )
+    finally:
+        session.close()
+
+
+def _work_shards(
+    queue: ShardQueue,
+    worker_id: str,
+    job_id: str | None,
+    lease_seconds: float,
+    poll_seconds: float,
+    exit_when_idle: bool,
+    max_shards: int | None,
+    stop_event: Event,
+) -> int:
+    # One session per worker: Tesseract is probed and the OCR backend built
+    # once, not once per shard.
+    converter = queue.session.converter
+    logger = get_logger("sharding")
+    converted = 0
+
+    while not stop_event.is_set() and (max_shards is None or converted < max_shards):
+        lease = queue.claim(worker_id, lease_seconds, job_id=job_id)
+        if lease is None:
+            if exit_when_idle:
+                break
+            stop_event.wait(poll_seconds)
+            continue
+
+        keeper = _LeaseKeeper(lease)
+        keeper.start()
+        try:
+            pages = [
+                (output.result, output.text)
+                for output in converter.iter_page_range(
+                    lease.job.input_pdf, lease.job.settings, lease.first_page, lease.last_page
+                )
+            ]
+        except Exception as exc:
+            keeper.stop()
+            logger.exception("Shard %s of %s failed", lease.index, lease.job.job_id)
+            lease.fail(str(exc))
+            continue
+        keeper.stop()
+        lease.complete(pages)
+        converted += 1
+
+    return converted
+
+
+def run_shard_workers(queue_dir: str | Path, processes: int, **worker_options: object) -> int:
+    """Run ``processes`` local workers in separate processes; returns shards converted."""
+    if processes <= 1:
+        return run_shard_worker(queue_dir, **worker_options)  # type: ignore[arg-type]
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+        futures = [
+            pool.submit(
+                run_shard_worker,
+                str(queue_dir),
+                f"{socket.gethostname()}-{os.getpid()}-{number}",
+                **worker_options,
+            )
+            for number in range(processes)
+        ]
+        return sum(future.result() for future in futures)
+
+
+class _LeaseKeeper(Thread):
+    """Renews a lease in the background while its shard is being converted."""
+
+    def __init__(self, lease: ShardLease) -> None:
+        super().__init__(name=f"lease-{lease.index}", daemon=True)
+        self._lease = lease
+        self._stopped = Event()
+
+    def run(self) -> None:
+        interval = max(self._lease.lease_seconds / 3, 0.05)
+        while not self._stopped.wait(interval):
+            if not self._lease.renew():
+                get_logger("sharding").warning(
+                    "Lost lease on shard %s of %s", self._lease.index, self._lease.job.job_id
+                )
+                return
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def _lease_payload(worker_id: str, token: str, lease_seconds: float) -> dict[str, object]:
+    now = time.time()
+    return {
+        "worker": worker_id,
+        "host": socket.gethostname(),
+        "pid": os.getpid(),
+        "token": token,
+        "renewed_at": now,
+        "expires_at": now + lease_seconds,
+    }
+
+
+def _read_json(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _calibration_from_dict(data: dict | None) -> CalibrationResult | None:
+    if not data:
+        return None
+    candidates = [CalibrationCandidate(**candidate) for candidate in data["candidates"]]
+    chosen = CalibrationCandidate(**data["chosen"]) if data.get("chosen") else None
+    return CalibrationResult(
+        sample_pages=list(data["sample_pages"]),
+        target_confidence=float(data["target_confidence"]),
+        chosen=chosen,
+        met_target=bool(data["met_target"]),
+        seconds=float(data["seconds"]),
+        candidates=candidates,
+    )
+
+
+def _settings_from_dict(data: dict) -> AppSettings:
+    known = {field.name for field in fields(AppSettings)}
+    values = {key: value for key, value in data.items() if key in known}
+    if "ocr_thread_policy" in values:
+        values["ocr_thread_policy"] = OcrThreadPolicy(values["ocr_thread_policy"])
+    if "memory_limit_action" in values:
+        values["memory_limit_action"] = MemoryLimitAction(values["memory_limit_action"])
+    return AppSettings(**values)
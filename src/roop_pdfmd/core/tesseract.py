@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+import tempfile
+from threading import Event
+from typing import TYPE_CHECKING
+
+from roop_pdfmd.core.resources import add_child_cpu_seconds
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+_POLL_INTERVAL_SECONDS = 0.05
+_PAGE_SEPARATOR = "\f"
+
+
+class OcrCancelledError(Exception):
+    """Raised when an in-flight Tesseract run is aborted by cancellation."""
+
+
+class OcrBatchError(Exception):
+    """Raised when a batched Tesseract run cannot be split back into pages."""
+
+
+def tesseract_version(tesseract_cmd: str, timeout: float = 30.0) -> str:
+    """Return the first line of ``tesseract --version``; raises if it cannot run."""
+    completed = subprocess.run(
+        [tesseract_cmd, "--version"],
+        timeout=timeout,
+        check=True,
+        **_pytesseract().subprocess_args(),
+    )
+    output = (completed.stdout or completed.stderr).decode("utf-8", "replace")
+    return output.splitlines()[0].strip() if output.strip() else ""
+
+
+def run_tesseract(
+    image: Image.Image,
+    tesseract_cmd: str,
+    lang: str = "eng",
+    cancel_event: Event | None = None,
+    env: dict[str, str] | None = None,
+    psm: int | None = None,
+) -> str:
+    """OCR ``image`` like ``pytesseract.image_to_string``, but killable.
+
+    The Tesseract process is owned here so that setting ``cancel_event`` kills
+    it instead of waiting for the page to finish, and so that ``env`` applies
+    to this invocation only.
+    """
+    tess = _pytesseract()
+    with tess.save(image) as (temp_name, input_filename):
+        cmd_args = [tesseract_cmd, input_filename, temp_name, "-l", lang, *_psm_args(psm), "txt"]
+        returncode, _, error_string = _run(cmd_args, env, cancel_event)
+        if returncode:
+            raise tess.TesseractError(returncode, tess.get_errors(error_string))
+
+        with open(f"{temp_name}.txt", "rb") as output_file:
+            return output_file.read().decode("utf-8")
+
+
+def run_tesseract_piped(
+    image: Image.Image,
+    tesseract_cmd: str,
+    lang: str = "eng",
+    cancel_event: Event | None = None,
+    env: dict[str, str] | None = None,
+    psm: int | None = None,
+) -> str:
+    """OCR ``image`` through ``tesseract stdin stdout`` with no temporary files.
+
+    The image is sent as uncompressed PNM, which Tesseract decodes without any
+    inflate work, and the text is read straight from the process's stdout.
+    """
+    cmd_args = [tesseract_cmd, "stdin", "stdout", "-l", lang, *_psm_args(psm)]
+    returncode, output, error_string = _run(cmd_args, env, cancel_event, _encode_pnm(image))
+    if returncode:
+        tess = _pytesseract()
+        raise tess.TesseractError(returncode, tess.get_errors(error_string))
+    return output.decode("utf-8")
+
+
+def tesseract_confidence(
+    image: Image.Image,
+    tesseract_cmd: str,
+    lang: str = "eng",
+    cancel_event: Event | None = None,
+    env: dict[str, str] | None = None,
+    psm: int | None = None,
+) -> float:
+    """Mean word confidence (0-100) Tesseract reports for ``image``, weighted by word length."""
+    cmd_args = [tesseract_cmd, "stdin", "stdout", "-l", lang, *_psm_args(psm), "tsv"]
+    returncode, output, error_string = _run(cmd_args, env, cancel_event, _encode_pnm(image))
+    if returncode:
+        tess = _pytesseract()
+        raise tess.TesseractError(returncode, tess.get_errors(error_string))
+    return mean_tsv_confidence(output.decode("utf-8", "replace"))
+
+
+def mean_tsv_confidence(tsv: str) -> float:
+    total = 0.0
+    weight = 0
+    for line in tsv.splitlines()[1:]:
+        columns = line.split("\t")
+        if len(columns) < 12 or not columns[11].strip():
+            continue
+        try:
+            confidence = float(columns[10])
+        except ValueError:
+            continue
+        if confidence < 0:
+            continue
+        size = len(columns[11].strip())
+        total += confidence * size
+        weight += size
+    return total / weight if weight else 0.0
+
+
+def run_tesseract_batch(
+    images: list[Image.Image],
+    tesseract_cmd: str,
+    lang: str = "eng",
+    cancel_event: Event | None = None,
+    env: dict[str, str] | None = None,
+    psm: int | None = None,
+) -> list[str]:
+    """OCR several images with one Tesseract process; returns one text per image.
+
+    The images are written as PNM files and passed through a list file, so the
+    engine and language data are initialised once for the whole batch. Tesseract
+    ends every page with a form feed, which is used to split the output back up.
+    """
+    with tempfile.TemporaryDirectory(prefix="roop_pdfmd_ocr_") as temp_dir:
+        list_path = os.path.join(temp_dir, "pages.lst")
+        image_paths = []
+        for idx, image in enumerate(images):
+            image_path = os.path.join(temp_dir, f"page_{idx:04d}.pnm")
+            with open(image_path, "wb") as image_file:
+                image_file.write(_encode_pnm(image))
+            image_paths.append(image_path)
+        with open(list_path, "w", encoding="utf-8") as list_file:
+            list_file.write("\n".join(image_paths) + "\n")
+
+        output_base = os.path.join(temp_dir, "output")
+        cmd_args = [tesseract_cmd, list_path, output_base, "-l", lang, *_psm_args(psm), "txt"]
+        returncode, _, error_string = _run(cmd_args, env, cancel_event)
+        if returncode:
+            tess = _pytesseract()
+            raise tess.TesseractError(returncode, tess.get_errors(error_string))
+
+        with open(f"{output_base}.txt", "rb") as output_file:
+            output = output_file.read().decode("utf-8")
+
+    pages = output.split(_PAGE_SEPARATOR)
+    if pages and not pages[-1].strip():
+        pages.pop()
+    if len(pages) != len(images):
+        raise OcrBatchError(
+            f"Tesseract returned {len(pages)} pages for a batch of {len(images)} images"
+        )
+    # Match the per-image output, which keeps the trailing separator.
+    return [page + _PAGE_SEPARATOR for page in pages]
+
+
+def _psm_args(psm: int | None) -> list[str]:
+    return [] if psm is None else ["--psm", str(psm)]
+
+
+def _pytesseract():
+    # Imported on first OCR run; pytesseract is not needed for text-layer pages.
+    from pytesseract import pytesseract
+
+    return pytesseract
+
+
+def _encode_pnm(image: Image.Image) -> bytes:
+    if image.mode not in ("1", "L", "RGB"):
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PPM")
+    return buffer.getvalue()
+
+
+def _run(
+    cmd_args: list[str],
+    env: dict[str, str] | None,
+    cancel_event: Event | None,
+    input_bytes: bytes | None = None,
+) -> tuple[int, bytes, bytes]:
+    """Run Tesseract to completion; returns its exit code, stdout and stderr.
+
+    The standard streams are temporary files rather than pipes, so nothing
+    has to be drained while the process runs and it can be reaped directly
+    with ``wait4``, which reports the CPU time of this one process. That time
+    is charged to the calling thread.
+    """
+    tess = _pytesseract()
+    popen_kwargs = tess.subprocess_args()
+    if env is not None:
+        popen_kwargs["env"] = env
+    with (
+        tempfile.TemporaryFile() as stdin,
+        tempfile.TemporaryFile() as stdout,
+        tempfile.TemporaryFile() as stderr,
+    ):
+        if input_bytes is not None:
+            stdin.write(input_bytes)
+            stdin.seek(0)
+        popen_kwargs.update(stdin=stdin, stdout=stdout, stderr=stderr)
+        try:
+            proc = subprocess.Popen(cmd_args, **popen_kwargs)
+        except FileNotFoundError as exc:
+            raise tess.TesseractNotFoundError() from exc
+
+        try:
+            returncode = _wait(proc, cancel_event)
+        except BaseException:
+            if proc.returncode is None:
+                proc.kill()
+                _wait(proc, None)
+            raise
+        stdout.seek(0)
+        stderr.seek(0)
+        return returncode, stdout.read(), stderr.read()
+
+
+def _wait(proc: subprocess.Popen, cancel_event: Event | None) -> int:
+    """Reap ``proc``, killing it if ``cancel_event`` is set first."""
+    if not hasattr(os, "wait4"):  # pragma: no cover - Windows; CPU time is not accounted
+        while True:
+            try:
+                return proc.wait(None if cancel_event is None else _POLL_INTERVAL_SECONDS)
+            except subprocess.TimeoutExpired:
+                if cancel_event.is_set():
+                    proc.kill()
+                    proc.wait()
+                    raise OcrCancelledError("Tesseract run cancelled") from None
+
+    flags = 0 if cancel_event is None else os.WNOHANG
+    while True:
+        pid, status, usage = os.wait4(proc.pid, flags)
+        if pid:
+            add_child_cpu_seconds(usage.ru_utime + usage.ru_stime)
+            # Reaped here, so Popen must not wait for the process again.
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            return proc.returncode
+        if cancel_event.wait(_POLL_INTERVAL_SECONDS):
+            proc.kill()
+            _wait(proc, None)
+            raise OcrCancelledError("Tesseract run cancelled")
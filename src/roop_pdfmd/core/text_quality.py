@@ -5,7 +5,8 @@ import unicodedata
 
 import fitz
 
-from roop_pdfmd.core.models import TextQuality
+from roop_pdfmd.core.image_index import DocumentImageIndex
+from roop_pdfmd.core.models import AppSettings, TextQuality
 
 
 _TOKEN_RE = re.compile(r"[A-Za-z0-9']+")
@@ -61,18 +62,25 @@ def build_text_quality(
     )
 
 
-def detect_page_text_quality(page: fitz.Page) -> TextQuality:
+def detect_page_text_quality(
+    page: fitz.Page,
+    image_index: DocumentImageIndex | None = None,
+) -> TextQuality:
     raw_text = page.get_text("text") or ""
     text_block_count, bbox_coverage = _text_block_stats(page)
-    image_area_ratio = _image_area_ratio(page)
+    if image_index is None:
+        image_index = DocumentImageIndex(page.parent)
+    image_area_ratio = image_index.image_area_ratio(page)
     return build_text_quality(raw_text, text_block_count, bbox_coverage, image_area_ratio)
 
 
 def should_use_ocr(
     quality: TextQuality,
     repeated_short_signature: bool = False,
+    min_text_chars: int = 10,
+    image_text_max_chars: int = 35,
 ) -> bool:
-    if quality.non_whitespace_len <= 10:
+    if quality.non_whitespace_len <= min_text_chars:
         return True
     if quality.looks_garbage:
         return True
@@ -84,7 +92,7 @@ def should_use_ocr(
         and quality.unique_token_count >= 3
     )
 
-    if quality.non_whitespace_len < 35 and quality.image_area_ratio >= 0.35:
+    if quality.non_whitespace_len < image_text_max_chars and quality.image_area_ratio >= 0.35:
         return True
 
     if repeated_short_signature and quality.non_whitespace_len < 80 and quality.image_area_ratio >= 0.2:
@@ -93,6 +101,22 @@ def should_use_ocr(
     return not has_structured_text
 
 
+def page_needs_ocr(
+    quality: TextQuality,
+    settings: AppSettings,
+    repeated_short_signature: bool = False,
+) -> bool:
+    """Whether a page is OCRed under ``settings`` rather than taken from its text layer."""
+    if not settings.ocr_only_if_no_text_layer:
+        return True
+    return should_use_ocr(
+        quality,
+        repeated_short_signature=repeated_short_signature,
+        min_text_chars=settings.ocr_min_text_chars,
+        image_text_max_chars=settings.ocr_image_text_max_chars,
+    )
+
+
 def text_signature(raw_text: str) -> str:
     tokens = _TOKEN_RE.findall((raw_text or "").lower())
     if not tokens:
@@ -123,24 +147,6 @@ def _text_block_stats(page: fitz.Page) -> tuple[int, float]:
     return text_block_count, min(total_text_bbox_area / page_area, 1.0)
 
 
-def _image_area_ratio(page: fitz.Page) -> float:
-    page_area = max(float(page.rect.width * page.rect.height), 1.0)
-    total_area = 0.0
-
-    for image_info in page.get_images(full=True):
-        if not image_info:
-            continue
-        xref = image_info[0]
-        try:
-            rects = page.get_image_rects(xref)
-        except Exception:
-            rects = []
-        for rect in rects:
-            total_area += max(float(rect.width * rect.height), 0.0)
-
-    return min(total_area / page_area, 1.0)
-
-
 def _is_lone_char_token(token: str) -> bool:
     trimmed = token.strip(".,;:!?\"'()[]{}")
     return len(trimmed) == 1 and trimmed.isalnum()
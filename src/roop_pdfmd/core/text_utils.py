@@ -1,11 +1,252 @@
 from __future__ import annotations
 
 import re
+import unicodedata
+from collections import Counter
+from typing import Generic, Iterable, Iterator, TypeVar
 
+from roop_pdfmd.core.models import AppSettings
+
+
+T = TypeVar("T")
 
 _HYPHEN_BREAK_RE = re.compile(r"(\w)-\n(\w)")
+_TRAILING_HYPHEN_RE = re.compile(r"\w-$")
+_INNER_SPACE_RE = re.compile(r"[ \t\u00a0\u2000-\u200a\u202f\u3000]+")
+_LEADING_WORD_CHAR_RE = re.compile(r"\w")
+_DIGITS_RE = re.compile(r"\d+")
+# Edge keys (lower case, digits folded to "#") of page-number lines: "#",
+# "- # -", "page #", "p. #", "page # of #", "# / #".
+_PAGE_NUMBER_KEY_RE = re.compile(r"[\W_]*(?:page|p\.)? ?# ?(?:(?:of|/) ?#)?[\W_]*")
+# Pages (this one included) a line other than a page number must start or end
+# before it counts as a running header/footer; two is common for real
+# content ("Chapter 3", "Table 2", a date) on neighbouring pages.
+_MIN_EDGE_REPEATS = 3
+
+_CHAR_REPLACEMENTS = {
+    "\ufb00": "ff",
+    "\ufb01": "fi",
+    "\ufb02": "fl",
+    "\ufb03": "ffi",
+    "\ufb04": "ffl",
+    "\ufb05": "st",
+    "\ufb06": "st",
+    "\u2010": "-",  # hyphen
+    "\u2011": "-",  # non-breaking hyphen
+    "\u00ad": "",  # soft hyphen
+    "\u200b": "",  # zero-width space
+    "\ufeff": "",  # byte order mark
+}
+_CHAR_REPLACEMENTS_RE = re.compile("[" + "".join(_CHAR_REPLACEMENTS) + "]")
 
 
 def dehyphenate_text(text: str) -> str:
     """Join simple line-break hyphenations while preserving other text structure."""
     return _HYPHEN_BREAK_RE.sub(r"\1\2", text)
+
+
+def normalize_text(text: str) -> str:
+    """Expand typographic ligatures, drop invisible characters and compose to NFC."""
+    if text.isascii():
+        return text
+    text = _CHAR_REPLACEMENTS_RE.sub(lambda match: _CHAR_REPLACEMENTS[match.group()], text)
+    return unicodedata.normalize("NFC", text)
+
+
+class TextPipeline(Generic[T]):
+    """Page text post-processing in one streaming pass.
+
+    Pages are pushed in order and released one page later, which is enough
+    lookahead to join a word hyphenated across a page break and to spot
+    running headers/footers that repeat on neighbouring pages. Each page is
+    split into lines once and every enabled step works on that line list:
+
+    - ``normalize_unicode``: ligatures (U+FB01 -> ``fi``), soft hyphens and
+      zero-width characters, NFC composition
+    - ``strip_headers_footers``: drops the first/last ``edge_lines`` lines of
+      a page when the same line (digits ignored) is at the edge of at least
+      three pages counting this one, the earlier ones and the next one; page
+      numbers ("12", "Page 3 of 9") only need to repeat on one neighbour.
+      With one page of lookahead, the first page keeps a running header
+      that is not a page number
+    - ``dehyphenate``: joins ``hyphen-``/``ated`` line breaks within a page and
+      moves the continuation of a word split across pages onto the first page
+    - ``collapse_whitespace``: single spaces inside lines, no trailing spaces,
+      at most one blank line in a row
+
+    With every step disabled pages are released immediately, unchanged.
+    """
+
+    def __init__(
+        self,
+        dehyphenate: bool = False,
+        normalize_unicode: bool = False,
+        collapse_whitespace: bool = False,
+        strip_headers_footers: bool = False,
+        edge_lines: int = 2,
+    ) -> None:
+        self.dehyphenate = dehyphenate
+        self.normalize_unicode = normalize_unicode
+        self.collapse_whitespace = collapse_whitespace
+        self.strip_headers_footers = strip_headers_footers
+        self._edge_lines = max(edge_lines, 1)
+        self._held: tuple[T, list[str], set[str]] | None = None
+        self._seen_edges: Counter[str] = Counter()
+
+    @classmethod
+    def from_settings(cls, settings: AppSettings) -> TextPipeline:
+        return cls(
+            dehyphenate=settings.dehyphenate,
+            normalize_unicode=settings.normalize_unicode,
+            collapse_whitespace=settings.collapse_whitespace,
+            strip_headers_footers=settings.strip_headers_footers,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.dehyphenate
+            or self.normalize_unicode
+            or self.collapse_whitespace
+            or self.strip_headers_footers
+        )
+
+    @property
+    def _needs_lookahead(self) -> bool:
+        return self.dehyphenate or self.strip_headers_footers
+
+    def push(self, item: T, text: str) -> list[tuple[T, str]]:
+        """Add the next page; returns the pages (with their items) ready for output."""
+        if not self.enabled:
+            return [(item, text)]
+
+        if self.normalize_unicode:
+            text = normalize_text(text)
+        lines = text.split("\n")
+        page = (item, lines, self._edge_keys(lines))
+
+        if not self._needs_lookahead:
+            return [self._finish_page(page, None)]
+
+        ready = []
+        if self._held is not None:
+            ready.append(self._finish_page(self._held, page))
+        self._held = page
+        return ready
+
+    def finish(self) -> list[tuple[T, str]]:
+        """Release the page still held for lookahead."""
+        held, self._held = self._held, None
+        return [self._finish_page(held, None)] if held is not None else []
+
+    def process(self, pages: Iterable[str]) -> Iterator[str]:
+        for text in pages:
+            for _, processed in self.push(None, text):  # type: ignore[arg-type]
+                yield processed
+        for _, processed in self.finish():
+            yield processed
+
+    def _finish_page(
+        self,
+        page: tuple[T, list[str], set[str]],
+        next_page: tuple[T, list[str], set[str]] | None,
+    ) -> tuple[T, str]:
+        item, lines, edge_keys = page
+
+        if self.strip_headers_footers:
+            repeated = set()
+            for key in edge_keys:
+                others = self._seen_edges[key] + (next_page is not None and key in next_page[2])
+                needed = 1 if _PAGE_NUMBER_KEY_RE.fullmatch(key) else _MIN_EDGE_REPEATS - 1
+                if others >= needed:
+                    repeated.add(key)
+            if repeated:
+                lines = self._strip_edges(lines, repeated)
+            self._seen_edges.update(edge_keys)
+
+        if self.dehyphenate:
+            lines = _join_hyphenated_lines(lines)
+            if next_page is not None:
+                self._join_across_pages(lines, next_page[1], edge_keys)
+
+        if self.collapse_whitespace:
+            lines = _collapse_lines(lines)
+        return item, "\n".join(lines)
+
+    def _edge_keys(self, lines: list[str]) -> set[str]:
+        if not self.strip_headers_footers:
+            return set()
+        content = [line for line in lines if line.strip()]
+        edges = content[: self._edge_lines] + content[-self._edge_lines :]
+        return {_edge_key(line) for line in edges}
+
+    def _strip_edges(self, lines: list[str], repeated: set[str]) -> list[str]:
+        content_idx = [idx for idx, line in enumerate(lines) if line.strip()]
+        edge_idx = set(content_idx[: self._edge_lines] + content_idx[-self._edge_lines :])
+        return [
+            line
+            for idx, line in enumerate(lines)
+            if idx not in edge_idx or _edge_key(line) not in repeated
+        ]
+
+    def _join_across_pages(
+        self,
+        lines: list[str],
+        next_lines: list[str],
+        edge_keys: set[str],
+    ) -> None:
+        last = _last_content_index(lines)
+        if last is None or not _TRAILING_HYPHEN_RE.search(lines[last].rstrip()):
+            return
+
+        # Skip what looks like the next page's running header.
+        skip = self._seen_edges.keys() | edge_keys if self.strip_headers_footers else set()
+        for idx, line in enumerate(next_lines):
+            stripped = line.lstrip()
+            if not stripped or _edge_key(line) in skip:
+                continue
+            if not stripped[0].islower():
+                return
+            word, _, rest = stripped.partition(" ")
+            lines[last] = lines[last].rstrip()[:-1] + word
+            next_lines[idx] = rest
+            return
+
+
+def _join_hyphenated_lines(lines: list[str]) -> list[str]:
+    joined: list[str] = []
+    for line in lines:
+        if (
+            joined
+            and joined[-1].endswith("-")
+            and _LEADING_WORD_CHAR_RE.match(line)
+            and _TRAILING_HYPHEN_RE.search(joined[-1])
+        ):
+            joined[-1] = joined[-1][:-1] + line
+        else:
+            joined.append(line)
+    return joined
+
+
+def _collapse_lines(lines: list[str]) -> list[str]:
+    collapsed: list[str] = []
+    for line in lines:
+        if "  " in line or "\t" in line or not line.isascii():
+            line = _INNER_SPACE_RE.sub(" ", line)
+        line = line.strip()
+        if line or (collapsed and collapsed[-1]):
+            collapsed.append(line)
+    while collapsed and not collapsed[-1]:
+        collapsed.pop()
+    return collapsed
+
+
+def _last_content_index(lines: list[str]) -> int | None:
+    for idx in range(len(lines) - 1, -1, -1):
+        if lines[idx].strip():
+            return idx
+    return None
+
+
+def _edge_key(line: str) -> str:
+    return _DIGITS_RE.sub("#", " ".join(line.lower().split()))
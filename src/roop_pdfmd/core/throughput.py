@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import heapq
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable
+
+from roop_pdfmd.core.models import PageMode, PageResult
+
+
+STAGES = ("classify", "render", "ocr")
+
+_RECENT_PAGES = 20
+
+
+@dataclass(slots=True)
+class SlowPage:
+    page_number: int
+    seconds: float
+    mode: PageMode
+
+
+@dataclass(slots=True)
+class ThroughputSnapshot:
+    total_pages: int
+    pages_done: int
+    ocr_pages: int
+    extract_pages: int
+    error_pages: int
+    elapsed_seconds: float
+    pages_per_second: float
+    recent_pages_per_second: float
+    remaining_seconds: float
+    blank_pages: int = 0
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    slowest_pages: list[SlowPage] = field(default_factory=list)
+
+    @property
+    def projected_total_seconds(self) -> float:
+        return self.elapsed_seconds + self.remaining_seconds
+
+
+class ThroughputTracker:
+    """Running conversion statistics built from per-page results.
+
+    The remaining-time estimate uses the rate over the last few pages, so it
+    reacts when a document turns from text pages to scans. Not thread-safe;
+    feed it from the thread that receives the page callbacks.
+    """
+
+    def __init__(
+        self,
+        total_pages: int = 0,
+        slowest: int = 5,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.total_pages = total_pages
+        self._slowest = max(slowest, 1)
+        self._clock = clock
+        self._started_at = clock()
+        self._counts = dict.fromkeys(PageMode, 0)
+        self._errors = 0
+        self._done = 0
+        self._stage_seconds = dict.fromkeys(STAGES, 0.0)
+        self._slow: list[tuple[float, int, PageMode]] = []
+        self._recent: deque[float] = deque(maxlen=_RECENT_PAGES)
+
+    def add(self, page: PageResult) -> None:
+        self._done += 1
+        self._recent.append(self._clock())
+        if page.error:
+            self._errors += 1
+        self._counts[page.mode] = self._counts.get(page.mode, 0) + 1
+
+        self._stage_seconds["classify"] += page.classify_seconds
+        self._stage_seconds["render"] += page.render_seconds
+        self._stage_seconds["ocr"] += page.ocr_seconds
+
+        item = (page.duration_seconds, page.page_number, page.mode)
+        if len(self._slow) < self._slowest:
+            heapq.heappush(self._slow, item)
+        elif item > self._slow[0]:
+            heapq.heapreplace(self._slow, item)
+
+    def snapshot(self) -> ThroughputSnapshot:
+        elapsed = self._clock() - self._started_at
+        rate = self._done / elapsed if elapsed > 0 else 0.0
+        recent_rate = rate
+        if len(self._recent) >= 2 and self._recent[-1] > self._recent[0]:
+            recent_rate = (len(self._recent) - 1) / (self._recent[-1] - self._recent[0])
+        remaining_pages = max(self.total_pages - self._done, 0)
+        return ThroughputSnapshot(
+            total_pages=self.total_pages,
+            pages_done=self._done,
+            ocr_pages=self._counts[PageMode.OCR],
+            extract_pages=self._counts[PageMode.EXTRACT],
+            blank_pages=self._counts[PageMode.BLANK],
+            error_pages=self._errors,
+            elapsed_seconds=elapsed,
+            pages_per_second=rate,
+            recent_pages_per_second=recent_rate,
+            remaining_seconds=remaining_pages / recent_rate if recent_rate > 0 else 0.0,
+            stage_seconds=dict(self._stage_seconds),
+            slowest_pages=[
+                SlowPage(page_number=number, seconds=seconds, mode=mode)
+                for seconds, number, mode in sorted(self._slow, reverse=True)
+            ],
+        )
@@ -0,0 +1,107 @@
+"""Child-process side of GUI conversions; kept free of Qt imports."""
+from __future__ import annotations
+
+import logging
+import threading
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+from roop_pdfmd.core.models import AppSettings, PageResult, ProgressEvent
+from roop_pdfmd.utils.paths import resolve_output_relative_path
+
+
+# Messages sent to the GUI process, all tuples tagged by their first item:
+#   ("estimate", seconds)
+#   ("progress", current_page, total_pages, mode, elapsed_seconds, eta_seconds)
+#   ("page", PageResult, markdown_block, text_block)
+#   ("log", level, logger_name, message)
+#   ("finished", ConversionResult) / ("failed", error_message)
+
+
+class _Sender:
+    """Serialises sends from the conversion thread and the OCR/logging threads."""
+
+    def __init__(self, conn: Connection) -> None:
+        self._conn = conn
+        self._lock = threading.Lock()
+
+    def send(self, message: tuple[Any, ...]) -> None:
+        with self._lock:
+            try:
+                self._conn.send(message)
+            except (BrokenPipeError, OSError):
+                # The GUI went away; nothing is left to report to.
+                pass
+
+
+class _PipeLogHandler(logging.Handler):
+    """Forwards log records so the GUI process alone writes the rotating log file."""
+
+    def __init__(self, sender: _Sender) -> None:
+        super().__init__()
+        self._sender = sender
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = record.getMessage()
+            if record.exc_info:
+                message += "\n" + logging.Formatter().formatException(record.exc_info)
+            self._sender.send(("log", record.levelno, record.name, message))
+        except Exception:  # pragma: no cover - logging must never raise
+            self.handleError(record)
+
+
+def run_conversion(
+    conn: Connection,
+    cancel_event: Any,
+    input_pdf: str,
+    output_dir: str,
+    settings: AppSettings,
+) -> None:
+    """Process entry point: convert one PDF and stream events over ``conn``."""
+    from roop_pdfmd.core.converter import ConversionError, Converter
+
+    sender = _Sender(conn)
+    logger = logging.getLogger("roop_pdfmd")
+    logger.setLevel(logging.INFO)
+    logger.addHandler(_PipeLogHandler(sender))
+
+    converter = Converter()
+
+    def on_progress(event: ProgressEvent) -> None:
+        sender.send(
+            (
+                "progress",
+                event.current_page,
+                event.total_pages,
+                event.mode.value,
+                event.elapsed_seconds,
+                event.eta_seconds,
+            )
+        )
+
+    def on_page(page_result: PageResult, markdown_block: str, text_block: str) -> None:
+        sender.send(("page", page_result, markdown_block, text_block))
+
+    try:
+        history_path = resolve_output_relative_path(settings.history_path, Path(output_dir))
+        if history_path is not None and history_path.exists():
+            predicted = converter.estimate(input_pdf, settings, history_path)
+            if predicted > 0:
+                sender.send(("estimate", predicted))
+        result = converter.convert(
+            input_pdf,
+            output_dir,
+            settings,
+            progress_callback=on_progress,
+            page_callback=on_page,
+            cancel_event=cancel_event,
+        )
+        sender.send(("finished", result))
+    except ConversionError as exc:
+        sender.send(("failed", str(exc)))
+    except Exception as exc:  # pragma: no cover - defensive
+        sender.send(("failed", f"Unexpected error: {exc}"))
+    finally:
+        conn.close()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from PySide6.QtWidgets import QFormLayout, QGroupBox, QHBoxLayout, QLabel, QProgressBar, QWidget
+
+from roop_pdfmd.core.throughput import STAGES, ThroughputSnapshot
+
+
+_STAGE_LABELS = {"classify": "Text layer", "render": "Render", "ocr": "OCR"}
+# Projected totals above this are highlighted so long documents can be deferred.
+_LONG_RUN_SECONDS = 15 * 60
+
+
+class ThroughputDashboard(QGroupBox):
+    """Live pages/sec, OCR/EXTRACT split, stage time split and slowest pages."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__("Throughput", parent)
+
+        self.rate_value = QLabel("-", self)
+        self.split_value = QLabel("-", self)
+        self.projected_value = QLabel("-", self)
+        self.slowest_value = QLabel("-", self)
+        self.slowest_value.setWordWrap(True)
+
+        stages_row = QHBoxLayout()
+        self.stage_bars: dict[str, QProgressBar] = {}
+        for stage in STAGES:
+            bar = QProgressBar(self)
+            bar.setRange(0, 100)
+            bar.setValue(0)
+            bar.setFormat(f"{_STAGE_LABELS[stage]} %p%")
+            self.stage_bars[stage] = bar
+            stages_row.addWidget(bar)
+
+        layout = QFormLayout(self)
+        layout.addRow("Pages/sec", self.rate_value)
+        layout.addRow("OCR / EXTRACT", self.split_value)
+        layout.addRow("Projected total", self.projected_value)
+        layout.addRow("Time by stage", stages_row)
+        layout.addRow("Slowest pages", self.slowest_value)
+
+    def reset(self) -> None:
+        for label in (self.rate_value, self.split_value, self.projected_value, self.slowest_value):
+            label.setText("-")
+            label.setStyleSheet("")
+        for bar in self.stage_bars.values():
+            bar.setValue(0)
+
+    def update_snapshot(self, snapshot: ThroughputSnapshot) -> None:
+        self.rate_value.setText(
+            f"{snapshot.recent_pages_per_second:.2f} now, "
+            f"{snapshot.pages_per_second:.2f} average"
+        )
+
+        done = max(snapshot.pages_done, 1)
+        split = (
+            f"{snapshot.ocr_pages} OCR ({snapshot.ocr_pages * 100 // done}%) / "
+            f"{snapshot.extract_pages} EXTRACT"
+        )
+        if snapshot.blank_pages:
+            split += f", {snapshot.blank_pages} blank"
+        if snapshot.error_pages:
+            split += f", {snapshot.error_pages} failed"
+        self.split_value.setText(split)
+
+        projected = snapshot.projected_total_seconds
+        self.projected_value.setText(
+            f"{_fmt_duration(projected)} ({_fmt_duration(snapshot.remaining_seconds)} left)"
+        )
+        self.projected_value.setStyleSheet(
+            "color: #b00020; font-weight: bold;" if projected >= _LONG_RUN_SECONDS else ""
+        )
+
+        stage_total = sum(snapshot.stage_seconds.values())
+        for stage, bar in self.stage_bars.items():
+            seconds = snapshot.stage_seconds.get(stage, 0.0)
+            bar.setValue(round(seconds * 100 / stage_total) if stage_total > 0 else 0)
+
+        self.slowest_value.setText(
+            ", ".join(
+                f"p{page.page_number} {page.seconds:.1f}s {page.mode.value}"
+                for page in snapshot.slowest_pages
+            )
+            or "-"
+        )
+
+
+def _fmt_duration(seconds: float) -> str:
+    total_seconds = max(int(seconds), 0)
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
@@ -23,7 +23,9 @@ from PySide6.QtWidgets import (
 )
 
 from roop_pdfmd.core.models import AppSettings, ConversionResult
+from roop_pdfmd.core.throughput import ThroughputSnapshot
 from roop_pdfmd.gui.about_dialog import show_about_dialog
+from roop_pdfmd.gui.dashboard import ThroughputDashboard
 from roop_pdfmd.gui.settings_dialog import SettingsDialog
 from roop_pdfmd.gui.settings_store import load_app_settings, save_app_settings
 from roop_pdfmd.gui.worker import ConversionWorker
@@ -119,6 +121,11 @@ class MainWindow(QMainWindow):
         progress_layout.addWidget(self.progress_bar)
         progress_layout.addLayout(summary)
 
+        self.dashboard = ThroughputDashboard(root)
+        status_row = QHBoxLayout()
+        status_row.addWidget(progress_group, 1)
+        status_row.addWidget(self.dashboard, 2)
+
         self.preview_tabs = QTabWidget(root)
         self.markdown_preview = QPlainTextEdit(root)
         self.markdown_preview.setReadOnly(True)
@@ -129,7 +136,7 @@ class MainWindow(QMainWindow):
 
         main_layout.addWidget(io_group)
         main_layout.addLayout(controls_row)
-        main_layout.addWidget(progress_group)
+        main_layout.addLayout(status_row)
         main_layout.addWidget(self.preview_tabs)
 
         self.setCentralWidget(root)
@@ -181,6 +188,8 @@ class MainWindow(QMainWindow):
 
         self._thread.started.connect(self._worker.run)
         self._worker.progress.connect(self._on_progress)
+        self._worker.stats.connect(self._on_stats)
+        self._worker.estimate.connect(self._on_estimate)
         self._worker.preview_chunk.connect(self._on_preview_chunk)
         self._worker.finished.connect(self._on_finished)
         self._worker.failed.connect(self._on_failed)
@@ -212,6 +221,16 @@ class MainWindow(QMainWindow):
         self.elapsed_value.setText(self._fmt_duration(elapsed_seconds))
         self.eta_value.setText(self._fmt_duration(eta_seconds))
 
+    def _on_estimate(self, seconds: float) -> None:
+        self.eta_value.setText(self._fmt_duration(seconds))
+        self.statusBar().showMessage(
+            f"Conversion started, expected to take {self._fmt_duration(seconds)}"
+        )
+
+    def _on_stats(self, snapshot: object) -> None:
+        if isinstance(snapshot, ThroughputSnapshot):
+            self.dashboard.update_snapshot(snapshot)
+
     def _on_preview_chunk(self, markdown_chunk: str, plain_text_chunk: str) -> None:
         self._append_preview_text(self.markdown_preview, markdown_chunk)
         self._append_preview_text(self.text_preview, plain_text_chunk)
@@ -279,6 +298,7 @@ class MainWindow(QMainWindow):
         self.mode_value.setText("-")
         self.elapsed_value.setText("00:00")
         self.eta_value.setText("--:--")
+        self.dashboard.reset()
         self.markdown_preview.clear()
         self.text_preview.clear()
 
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from PySide6.QtWidgets import (
     QCheckBox,
+    QComboBox,
     QDialog,
     QDialogButtonBox,
+    QDoubleSpinBox,
     QFileDialog,
     QFormLayout,
     QHBoxLayout,
@@ -14,16 +16,32 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.core.models import AppSettings, MemoryLimitAction, OcrThreadPolicy
+from roop_pdfmd.core.ocr_backends import available_ocr_backends
+from roop_pdfmd.core.presets import Preset, apply_preset, matching_preset
 from roop_pdfmd.utils.paths import detect_tesseract_binary
 
 
+_PSM_CHOICES = (
+    (3, "Automatic layout (default)"),
+    (4, "Single column"),
+    (6, "Single block of text"),
+    (11, "Sparse text"),
+)
+
+
 class SettingsDialog(QDialog):
     def __init__(self, current_settings: AppSettings, parent=None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.setModal(True)
 
+        self.preset_combo = QComboBox(self)
+        self.preset_combo.addItem("Custom", "")
+        self.preset_combo.addItem("Fast", Preset.FAST.value)
+        self.preset_combo.addItem("Balanced", Preset.BALANCED.value)
+        self.preset_combo.addItem("Accurate", Preset.ACCURATE.value)
+
         self.ocr_dpi_spin = QSpinBox(self)
         self.ocr_dpi_spin.setRange(72, 600)
         self.ocr_dpi_spin.setValue(current_settings.ocr_dpi)
@@ -45,9 +63,41 @@ class SettingsDialog(QDialog):
         self.dehyphenate_checkbox = QCheckBox("De-hyphenate line-breaks", self)
         self.dehyphenate_checkbox.setChecked(current_settings.dehyphenate)
 
+        self.normalize_unicode_checkbox = QCheckBox("Normalise ligatures and Unicode", self)
+        self.normalize_unicode_checkbox.setChecked(current_settings.normalize_unicode)
+
+        self.collapse_whitespace_checkbox = QCheckBox("Collapse repeated whitespace", self)
+        self.collapse_whitespace_checkbox.setChecked(current_settings.collapse_whitespace)
+
+        self.strip_headers_footers_checkbox = QCheckBox(
+            "Strip repeated page headers/footers",
+            self,
+        )
+        self.strip_headers_footers_checkbox.setChecked(current_settings.strip_headers_footers)
+
         self.ocr_only_checkbox = QCheckBox("OCR only if no text layer", self)
         self.ocr_only_checkbox.setChecked(current_settings.ocr_only_if_no_text_layer)
 
+        self.ocr_min_text_chars_spin = QSpinBox(self)
+        self.ocr_min_text_chars_spin.setRange(0, 500)
+        self.ocr_min_text_chars_spin.setSuffix(" characters")
+        self.ocr_min_text_chars_spin.setValue(current_settings.ocr_min_text_chars)
+
+        self.ocr_image_text_max_chars_spin = QSpinBox(self)
+        self.ocr_image_text_max_chars_spin.setRange(0, 2000)
+        self.ocr_image_text_max_chars_spin.setSuffix(" characters")
+        self.ocr_image_text_max_chars_spin.setValue(current_settings.ocr_image_text_max_chars)
+
+        self.ocr_psm_combo = QComboBox(self)
+        for psm, label in _PSM_CHOICES:
+            self.ocr_psm_combo.addItem(label, psm)
+        if self.ocr_psm_combo.findData(current_settings.ocr_psm) < 0:
+            self.ocr_psm_combo.addItem(f"Mode {current_settings.ocr_psm}", current_settings.ocr_psm)
+        self.ocr_psm_combo.setCurrentIndex(self.ocr_psm_combo.findData(current_settings.ocr_psm))
+
+        self.skip_blank_pages_checkbox = QCheckBox("Skip OCR on blank pages", self)
+        self.skip_blank_pages_checkbox.setChecked(current_settings.skip_blank_pages)
+
         self.ocr_preprocess_grayscale_checkbox = QCheckBox(
             "OCR preprocess: grayscale",
             self,
@@ -72,14 +122,136 @@ class SettingsDialog(QDialog):
             current_settings.ocr_preprocess_threshold
         )
 
+        self.ocr_use_embedded_images_checkbox = QCheckBox(
+            "OCR scanned pages from embedded image",
+            self,
+        )
+        self.ocr_use_embedded_images_checkbox.setChecked(
+            current_settings.ocr_use_embedded_images
+        )
+
+        self.write_page_index_checkbox = QCheckBox("Write page offset index", self)
+        self.write_page_index_checkbox.setChecked(current_settings.write_page_index)
+
+        self.search_index_input = QLineEdit(self)
+        self.search_index_input.setPlaceholderText("Off (e.g. search.sqlite3 or an absolute path)")
+        self.search_index_input.setText(current_settings.search_index_path)
+
+        self.history_input = QLineEdit(self)
+        self.history_input.setPlaceholderText("Off (e.g. an absolute path shared by all runs)")
+        self.history_input.setText(current_settings.history_path)
+
+        self.ocr_thread_policy_combo = QComboBox(self)
+        self.ocr_thread_policy_combo.addItem(
+            "Throughput-first (1 thread per OCR)", OcrThreadPolicy.THROUGHPUT.value
+        )
+        self.ocr_thread_policy_combo.addItem(
+            "Latency-first (share all CPUs)", OcrThreadPolicy.LATENCY.value
+        )
+        self.ocr_thread_policy_combo.setCurrentIndex(
+            max(
+                self.ocr_thread_policy_combo.findData(
+                    OcrThreadPolicy(current_settings.ocr_thread_policy).value
+                ),
+                0,
+            )
+        )
+
+        self.ocr_backend_combo = QComboBox(self)
+        for backend_name in available_ocr_backends():
+            self.ocr_backend_combo.addItem(backend_name, backend_name)
+        self.ocr_backend_combo.setCurrentIndex(
+            max(self.ocr_backend_combo.findData(current_settings.ocr_backend), 0)
+        )
+
+        self.ocr_batch_size_spin = QSpinBox(self)
+        self.ocr_batch_size_spin.setRange(1, 64)
+        self.ocr_batch_size_spin.setValue(current_settings.ocr_batch_size)
+
+        self.ocr_batch_megapixels_spin = QSpinBox(self)
+        self.ocr_batch_megapixels_spin.setRange(10, 2000)
+        self.ocr_batch_megapixels_spin.setSuffix(" MP")
+        self.ocr_batch_megapixels_spin.setValue(current_settings.ocr_batch_max_megapixels)
+
+        self.memory_limit_spin = QSpinBox(self)
+        self.memory_limit_spin.setRange(0, 262144)
+        self.memory_limit_spin.setSingleStep(256)
+        self.memory_limit_spin.setSuffix(" MB")
+        self.memory_limit_spin.setSpecialValueText("Off")
+        self.memory_limit_spin.setValue(current_settings.memory_soft_limit_mb)
+
+        self.memory_action_combo = QComboBox(self)
+        self.memory_action_combo.addItem("Warn", MemoryLimitAction.WARN.value)
+        self.memory_action_combo.addItem(
+            "Lower OCR DPI and batching", MemoryLimitAction.DEGRADE.value
+        )
+        self.memory_action_combo.setCurrentIndex(
+            max(
+                self.memory_action_combo.findData(
+                    MemoryLimitAction(current_settings.memory_limit_action).value
+                ),
+                0,
+            )
+        )
+
+        self.page_retry_spin = QSpinBox(self)
+        self.page_retry_spin.setRange(0, 5)
+        self.page_retry_spin.setSpecialValueText("Off")
+        self.page_retry_spin.setValue(current_settings.page_retry_attempts)
+
+        self.track_python_memory_checkbox = QCheckBox(
+            "Track Python memory per page (slower)",
+            self,
+        )
+        self.track_python_memory_checkbox.setChecked(current_settings.track_python_memory)
+
+        self.ocr_calibrate_checkbox = QCheckBox(
+            "Calibrate DPI/preprocessing per document (sampled pages)",
+            self,
+        )
+        self.ocr_calibrate_checkbox.setChecked(current_settings.ocr_calibrate)
+
+        self.ocr_calibration_pages_spin = QSpinBox(self)
+        self.ocr_calibration_pages_spin.setRange(1, 20)
+        self.ocr_calibration_pages_spin.setValue(current_settings.ocr_calibration_pages)
+
+        self.ocr_calibration_target_spin = QDoubleSpinBox(self)
+        self.ocr_calibration_target_spin.setRange(0.0, 100.0)
+        self.ocr_calibration_target_spin.setDecimals(1)
+        self.ocr_calibration_target_spin.setSuffix(" %")
+        self.ocr_calibration_target_spin.setValue(current_settings.ocr_calibration_target)
+
         form_layout = QFormLayout()
+        form_layout.addRow("Preset", self.preset_combo)
         form_layout.addRow("OCR DPI", self.ocr_dpi_spin)
         form_layout.addRow("Tesseract path", path_row)
+        form_layout.addRow("OCR engine", self.ocr_backend_combo)
+        form_layout.addRow("OCR CPU policy", self.ocr_thread_policy_combo)
+        form_layout.addRow("Page layout", self.ocr_psm_combo)
+        form_layout.addRow("OCR pages with text layer up to", self.ocr_min_text_chars_spin)
+        form_layout.addRow("OCR image pages with text under", self.ocr_image_text_max_chars_spin)
+        form_layout.addRow("Search index", self.search_index_input)
+        form_layout.addRow("Run history", self.history_input)
+        form_layout.addRow("OCR pages per batch", self.ocr_batch_size_spin)
+        form_layout.addRow("OCR batch memory cap", self.ocr_batch_megapixels_spin)
+        form_layout.addRow("Calibration sample pages", self.ocr_calibration_pages_spin)
+        form_layout.addRow("Calibration confidence target", self.ocr_calibration_target_spin)
+        form_layout.addRow("Soft memory limit", self.memory_limit_spin)
+        form_layout.addRow("Above memory limit", self.memory_action_combo)
+        form_layout.addRow("Retries for failed pages", self.page_retry_spin)
         form_layout.addRow("", self.dehyphenate_checkbox)
+        form_layout.addRow("", self.normalize_unicode_checkbox)
+        form_layout.addRow("", self.collapse_whitespace_checkbox)
+        form_layout.addRow("", self.strip_headers_footers_checkbox)
         form_layout.addRow("", self.ocr_only_checkbox)
+        form_layout.addRow("", self.skip_blank_pages_checkbox)
         form_layout.addRow("", self.ocr_preprocess_grayscale_checkbox)
         form_layout.addRow("", self.ocr_preprocess_autocontrast_checkbox)
         form_layout.addRow("", self.ocr_preprocess_threshold_checkbox)
+        form_layout.addRow("", self.ocr_use_embedded_images_checkbox)
+        form_layout.addRow("", self.ocr_calibrate_checkbox)
+        form_layout.addRow("", self.write_page_index_checkbox)
+        form_layout.addRow("", self.track_python_memory_checkbox)
 
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel,
@@ -93,17 +265,87 @@ class SettingsDialog(QDialog):
         root.addWidget(buttons)
         self.setLayout(root)
 
+        self._sync_preset()
+        self.preset_combo.currentIndexChanged.connect(self._apply_preset)
+        for spin in (
+            self.ocr_dpi_spin,
+            self.ocr_min_text_chars_spin,
+            self.ocr_image_text_max_chars_spin,
+            self.ocr_batch_size_spin,
+            self.page_retry_spin,
+        ):
+            spin.valueChanged.connect(self._sync_preset)
+        for checkbox in (
+            self.skip_blank_pages_checkbox,
+            self.ocr_preprocess_grayscale_checkbox,
+            self.ocr_preprocess_autocontrast_checkbox,
+            self.ocr_preprocess_threshold_checkbox,
+            self.ocr_use_embedded_images_checkbox,
+        ):
+            checkbox.toggled.connect(self._sync_preset)
+        for combo in (self.ocr_thread_policy_combo, self.ocr_psm_combo):
+            combo.currentIndexChanged.connect(self._sync_preset)
+
     def get_settings(self) -> AppSettings:
         return AppSettings(
             ocr_dpi=self.ocr_dpi_spin.value(),
             tesseract_path=self.tesseract_path_input.text().strip(),
             dehyphenate=self.dehyphenate_checkbox.isChecked(),
+            normalize_unicode=self.normalize_unicode_checkbox.isChecked(),
+            collapse_whitespace=self.collapse_whitespace_checkbox.isChecked(),
+            strip_headers_footers=self.strip_headers_footers_checkbox.isChecked(),
             ocr_only_if_no_text_layer=self.ocr_only_checkbox.isChecked(),
+            ocr_min_text_chars=self.ocr_min_text_chars_spin.value(),
+            ocr_image_text_max_chars=self.ocr_image_text_max_chars_spin.value(),
+            skip_blank_pages=self.skip_blank_pages_checkbox.isChecked(),
             ocr_preprocess_grayscale=self.ocr_preprocess_grayscale_checkbox.isChecked(),
             ocr_preprocess_autocontrast=self.ocr_preprocess_autocontrast_checkbox.isChecked(),
             ocr_preprocess_threshold=self.ocr_preprocess_threshold_checkbox.isChecked(),
+            ocr_use_embedded_images=self.ocr_use_embedded_images_checkbox.isChecked(),
+            ocr_psm=self.ocr_psm_combo.currentData(),
+            ocr_thread_policy=OcrThreadPolicy(self.ocr_thread_policy_combo.currentData()),
+            ocr_backend=self.ocr_backend_combo.currentData(),
+            ocr_batch_size=self.ocr_batch_size_spin.value(),
+            ocr_batch_max_megapixels=self.ocr_batch_megapixels_spin.value(),
+            write_page_index=self.write_page_index_checkbox.isChecked(),
+            search_index_path=self.search_index_input.text().strip(),
+            history_path=self.history_input.text().strip(),
+            memory_soft_limit_mb=self.memory_limit_spin.value(),
+            memory_limit_action=MemoryLimitAction(self.memory_action_combo.currentData()),
+            track_python_memory=self.track_python_memory_checkbox.isChecked(),
+            page_retry_attempts=self.page_retry_spin.value(),
+            ocr_calibrate=self.ocr_calibrate_checkbox.isChecked(),
+            ocr_calibration_pages=self.ocr_calibration_pages_spin.value(),
+            ocr_calibration_target=self.ocr_calibration_target_spin.value(),
         )
 
+    def _apply_preset(self) -> None:
+        preset = self.preset_combo.currentData()
+        if not preset:
+            return
+        settings = apply_preset(self.get_settings(), preset)
+        self.ocr_dpi_spin.setValue(settings.ocr_dpi)
+        self.ocr_preprocess_grayscale_checkbox.setChecked(settings.ocr_preprocess_grayscale)
+        self.ocr_preprocess_autocontrast_checkbox.setChecked(settings.ocr_preprocess_autocontrast)
+        self.ocr_preprocess_threshold_checkbox.setChecked(settings.ocr_preprocess_threshold)
+        self.ocr_use_embedded_images_checkbox.setChecked(settings.ocr_use_embedded_images)
+        self.ocr_psm_combo.setCurrentIndex(self.ocr_psm_combo.findData(settings.ocr_psm))
+        self.ocr_min_text_chars_spin.setValue(settings.ocr_min_text_chars)
+        self.ocr_image_text_max_chars_spin.setValue(settings.ocr_image_text_max_chars)
+        self.skip_blank_pages_checkbox.setChecked(settings.skip_blank_pages)
+        self.ocr_thread_policy_combo.setCurrentIndex(
+            self.ocr_thread_policy_combo.findData(OcrThreadPolicy(settings.ocr_thread_policy).value)
+        )
+        self.ocr_batch_size_spin.setValue(settings.ocr_batch_size)
+        self.page_retry_spin.setValue(settings.page_retry_attempts)
+
+    def _sync_preset(self) -> None:
+        """Show the preset the current values match, or Custom once one is edited."""
+        index = self.preset_combo.findData(matching_preset(self.get_settings()))
+        self.preset_combo.blockSignals(True)
+        self.preset_combo.setCurrentIndex(max(index, 0))
+        self.preset_combo.blockSignals(False)
+
     def _browse_tesseract(self) -> None:
         file_path, _ = QFileDialog.getOpenFileName(self, "Select Tesseract binary")
         if file_path:
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from PySide6.QtCore import QSettings
 
-from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.core.models import AppSettings, MemoryLimitAction, OcrThreadPolicy
+from roop_pdfmd.core.ocr_backends import DEFAULT_OCR_BACKEND, available_ocr_backends
 
 
 _ORG = "Roop"
@@ -17,15 +18,39 @@ def _as_bool(value: object, default: bool) -> bool:
     return default
 
 
+def _as_thread_policy(value: object) -> OcrThreadPolicy:
+    try:
+        return OcrThreadPolicy(str(value))
+    except ValueError:
+        return OcrThreadPolicy.THROUGHPUT
+
+
+def _as_memory_action(value: object) -> MemoryLimitAction:
+    try:
+        return MemoryLimitAction(str(value))
+    except ValueError:
+        return MemoryLimitAction.WARN
+
+
+def _as_ocr_backend(value: object) -> str:
+    # Test-only or uninstalled engines are never loaded into the app.
+    name = str(value or DEFAULT_OCR_BACKEND)
+    return name if name in available_ocr_backends() else DEFAULT_OCR_BACKEND
+
+
 def load_app_settings() -> AppSettings:
     settings = QSettings(_ORG, _APP)
 
     ocr_dpi = int(settings.value("ocr_dpi", 300))
     tesseract_path = str(settings.value("tesseract_path", "") or "")
     dehyphenate = _as_bool(settings.value("dehyphenate", False), False)
+    normalize_unicode = _as_bool(settings.value("normalize_unicode", False), False)
+    collapse_whitespace = _as_bool(settings.value("collapse_whitespace", False), False)
+    strip_headers_footers = _as_bool(settings.value("strip_headers_footers", False), False)
     ocr_only_if_no_text_layer = _as_bool(
         settings.value("ocr_only_if_no_text_layer", True), True
     )
+    skip_blank_pages = _as_bool(settings.value("skip_blank_pages", False), False)
     ocr_preprocess_grayscale = _as_bool(
         settings.value("ocr_preprocess_grayscale", True), True
     )
@@ -35,15 +60,61 @@ def load_app_settings() -> AppSettings:
     ocr_preprocess_threshold = _as_bool(
         settings.value("ocr_preprocess_threshold", False), False
     )
+    ocr_use_embedded_images = _as_bool(
+        settings.value("ocr_use_embedded_images", True), True
+    )
+    ocr_psm = int(settings.value("ocr_psm", 3))
+    ocr_min_text_chars = int(settings.value("ocr_min_text_chars", 10))
+    ocr_image_text_max_chars = int(settings.value("ocr_image_text_max_chars", 35))
+    ocr_thread_policy = _as_thread_policy(
+        settings.value("ocr_thread_policy", OcrThreadPolicy.THROUGHPUT.value)
+    )
+    ocr_batch_size = int(settings.value("ocr_batch_size", 1))
+    ocr_batch_max_megapixels = int(settings.value("ocr_batch_max_megapixels", 100))
+    write_page_index = _as_bool(settings.value("write_page_index", True), True)
+    search_index_path = str(settings.value("search_index_path", "") or "")
+    history_path = str(settings.value("history_path", "") or "")
+    ocr_backend = _as_ocr_backend(settings.value("ocr_backend", DEFAULT_OCR_BACKEND))
+    memory_soft_limit_mb = int(settings.value("memory_soft_limit_mb", 0))
+    memory_limit_action = _as_memory_action(
+        settings.value("memory_limit_action", MemoryLimitAction.WARN.value)
+    )
+    track_python_memory = _as_bool(settings.value("track_python_memory", False), False)
+    page_retry_attempts = int(settings.value("page_retry_attempts", 0))
+    ocr_calibrate = _as_bool(settings.value("ocr_calibrate", False), False)
+    ocr_calibration_pages = int(settings.value("ocr_calibration_pages", 3))
+    ocr_calibration_target = float(settings.value("ocr_calibration_target", 85.0))
 
     return AppSettings(
         ocr_dpi=ocr_dpi,
         tesseract_path=tesseract_path,
         dehyphenate=dehyphenate,
+        normalize_unicode=normalize_unicode,
+        collapse_whitespace=collapse_whitespace,
+        strip_headers_footers=strip_headers_footers,
         ocr_only_if_no_text_layer=ocr_only_if_no_text_layer,
+        ocr_min_text_chars=ocr_min_text_chars,
+        ocr_image_text_max_chars=ocr_image_text_max_chars,
+        skip_blank_pages=skip_blank_pages,
         ocr_preprocess_grayscale=ocr_preprocess_grayscale,
         ocr_preprocess_autocontrast=ocr_preprocess_autocontrast,
         ocr_preprocess_threshold=ocr_preprocess_threshold,
+        ocr_use_embedded_images=ocr_use_embedded_images,
+        ocr_psm=ocr_psm,
+        ocr_thread_policy=ocr_thread_policy,
+        ocr_backend=ocr_backend,
+        ocr_batch_size=ocr_batch_size,
+        ocr_batch_max_megapixels=ocr_batch_max_megapixels,
+        write_page_index=write_page_index,
+        search_index_path=search_index_path,
+        history_path=history_path,
+        memory_soft_limit_mb=memory_soft_limit_mb,
+        memory_limit_action=memory_limit_action,
+        track_python_memory=track_python_memory,
+        page_retry_attempts=page_retry_attempts,
+        ocr_calibrate=ocr_calibrate,
+        ocr_calibration_pages=ocr_calibration_pages,
+        ocr_calibration_target=ocr_calibration_target,
     )
 
 
@@ -52,12 +123,38 @@ def save_app_settings(app_settings: AppSettings) -> None:
     settings.setValue("ocr_dpi", app_settings.ocr_dpi)
     settings.setValue("tesseract_path", app_settings.tesseract_path)
     settings.setValue("dehyphenate", app_settings.dehyphenate)
+    settings.setValue("normalize_unicode", app_settings.normalize_unicode)
+    settings.setValue("collapse_whitespace", app_settings.collapse_whitespace)
+    settings.setValue("strip_headers_footers", app_settings.strip_headers_footers)
     settings.setValue(
         "ocr_only_if_no_text_layer", app_settings.ocr_only_if_no_text_layer
     )
+    settings.setValue("skip_blank_pages", app_settings.skip_blank_pages)
     settings.setValue("ocr_preprocess_grayscale", app_settings.ocr_preprocess_grayscale)
     settings.setValue(
         "ocr_preprocess_autocontrast", app_settings.ocr_preprocess_autocontrast
     )
     settings.setValue("ocr_preprocess_threshold", app_settings.ocr_preprocess_threshold)
+    settings.setValue("ocr_use_embedded_images", app_settings.ocr_use_embedded_images)
+    settings.setValue("ocr_psm", app_settings.ocr_psm)
+    settings.setValue("ocr_min_text_chars", app_settings.ocr_min_text_chars)
+    settings.setValue("ocr_image_text_max_chars", app_settings.ocr_image_text_max_chars)
+    settings.setValue(
+        "ocr_thread_policy", OcrThreadPolicy(app_settings.ocr_thread_policy).value
+    )
+    settings.setValue("ocr_backend", app_settings.ocr_backend)
+    settings.setValue("ocr_batch_size", app_settings.ocr_batch_size)
+    settings.setValue("ocr_batch_max_megapixels", app_settings.ocr_batch_max_megapixels)
+    settings.setValue("write_page_index", app_settings.write_page_index)
+    settings.setValue("search_index_path", app_settings.search_index_path)
+    settings.setValue("history_path", app_settings.history_path)
+    settings.setValue("memory_soft_limit_mb", app_settings.memory_soft_limit_mb)
+    settings.setValue(
+        "memory_limit_action", MemoryLimitAction(app_settings.memory_limit_action).value
+    )
+    settings.setValue("track_python_memory", app_settings.track_python_memory)
+    settings.setValue("page_retry_attempts", app_settings.page_retry_attempts)
+    settings.setValue("ocr_calibrate", app_settings.ocr_calibrate)
+    settings.setValue("ocr_calibration_pages", app_settings.ocr_calibration_pages)
+    settings.setValue("ocr_calibration_target", app_settings.ocr_calibration_target)
     settings.sync()
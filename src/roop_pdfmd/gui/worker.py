@@ -1,14 +1,36 @@
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import time
+
 from PySide6.QtCore import QObject, Signal, Slot
 
-from roop_pdfmd.core.converter import ConversionError, Converter
-from roop_pdfmd.core.models import AppSettings, ConversionResult, PageResult, ProgressEvent
+from roop_pdfmd.core.models import AppSettings, ConversionResult, PageResult
+from roop_pdfmd.core.throughput import ThroughputTracker
+from roop_pdfmd.gui.conversion_process import run_conversion
+
+
+# Dashboard updates are coalesced so fast text pages don't flood the UI thread.
+_STATS_INTERVAL_SECONDS = 0.5
+_POLL_SECONDS = 0.1
+# After a cancel request the child may finish its current page and write the
+# partial outputs; past this it is killed.
+_CANCEL_GRACE_SECONDS = 5.0
 
 
 class ConversionWorker(QObject):
+    """Runs one conversion in a child process and relays its events as signals.
+
+    A crash or memory blow-up in the conversion only ends the child; the GUI
+    reports it through ``failed``. Meant to be moved to a ``QThread`` whose
+    ``started`` signal triggers :meth:`run`.
+    """
+
     progress = Signal(int, int, str, float, float)
     preview_chunk = Signal(str, str)
+    stats = Signal(object)
+    estimate = Signal(float)
     finished = Signal(object)
     failed = Signal(str)
 
@@ -23,36 +45,99 @@ class ConversionWorker(QObject):
         self._input_pdf = input_pdf
         self._output_dir = output_dir
         self._settings = settings
-        self._converter = Converter()
+        self._tracker = ThroughputTracker()
+        self._last_stats_at = 0.0
+        self._context = multiprocessing.get_context("spawn")
+        self._cancel_event = self._context.Event()
+        self._cancel_deadline: float | None = None
 
     @Slot()
     def run(self) -> None:
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=run_conversion,
+            args=(sender, self._cancel_event, self._input_pdf, self._output_dir, self._settings),
+            name="roop-pdfmd-conversion",
+            daemon=True,
+        )
         try:
-            result = self._converter.convert(
-                self._input_pdf,
-                self._output_dir,
-                self._settings,
-                progress_callback=self._on_progress,
-                page_callback=self._on_page,
-            )
-            self.finished.emit(result)
-        except ConversionError as exc:
-            self.failed.emit(str(exc))
+            process.start()
         except Exception as exc:  # pragma: no cover - defensive
-            self.failed.emit(f"Unexpected error: {exc}")
+            self.failed.emit(f"Unable to start the conversion process: {exc}")
+            return
+        finally:
+            # Only the child writes; closing our copy lets recv() see EOF if it dies.
+            sender.close()
+
+        try:
+            self._pump(receiver, process)
+        finally:
+            receiver.close()
+            process.join(timeout=_CANCEL_GRACE_SECONDS)
+            if process.is_alive():
+                process.kill()
+                process.join()
 
     @Slot()
     def cancel(self) -> None:
-        self._converter.cancel()
-
-    def _on_progress(self, event: ProgressEvent) -> None:
-        self.progress.emit(
-            event.current_page,
-            event.total_pages,
-            event.mode.value,
-            event.elapsed_seconds,
-            event.eta_seconds,
-        )
+        self._cancel_event.set()
+        if self._cancel_deadline is None:
+            self._cancel_deadline = time.monotonic() + _CANCEL_GRACE_SECONDS
+
+    def _pump(self, receiver, process) -> None:
+        while True:
+            try:
+                if not receiver.poll(_POLL_SECONDS):
+                    if self._cancel_deadline and time.monotonic() > self._cancel_deadline:
+                        process.kill()
+                    continue
+                message = receiver.recv()
+            except (EOFError, OSError):
+                process.join(timeout=_CANCEL_GRACE_SECONDS)
+                if self._cancel_event.is_set():
+                    self.failed.emit("Conversion cancelled; the conversion process was stopped.")
+                else:
+                    self.failed.emit(
+                        "Conversion process exited unexpectedly "
+                        f"(exit code {process.exitcode})."
+                    )
+                return
+
+            kind = message[0]
+            if kind == "progress":
+                self._on_progress(*message[1:])
+            elif kind == "page":
+                self._on_page(*message[1:])
+            elif kind == "estimate":
+                self.estimate.emit(message[1])
+            elif kind == "log":
+                _, level, name, text = message
+                logging.getLogger(name).log(level, text)
+            elif kind == "finished":
+                result: ConversionResult = message[1]
+                self.stats.emit(self._tracker.snapshot())
+                self.finished.emit(result)
+                return
+            elif kind == "failed":
+                self.failed.emit(message[1])
+                return
+
+    def _on_progress(
+        self,
+        current_page: int,
+        total_pages: int,
+        mode: str,
+        elapsed_seconds: float,
+        eta_seconds: float,
+    ) -> None:
+        self._tracker.total_pages = total_pages
+        now = time.monotonic()
+        if now - self._last_stats_at >= _STATS_INTERVAL_SECONDS:
+            self._last_stats_at = now
+            self.stats.emit(self._tracker.snapshot())
+
+        self.progress.emit(current_page, total_pages, mode, elapsed_seconds, eta_seconds)
 
-    def _on_page(self, _: PageResult, markdown_text: str, plain_text: str) -> None:
+    def _on_page(self, page_result: PageResult, markdown_text: str, plain_text: str) -> None:
+        self._tracker.add(page_result)
         self.preview_chunk.emit(markdown_text, plain_text)
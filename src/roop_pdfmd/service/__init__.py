@@ -0,0 +1 @@
+"""Headless conversion services for Roop PDF -> Markdown."""
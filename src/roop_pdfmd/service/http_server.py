@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from roop_pdfmd.core.converter import ConversionError
+from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.service.jobs import ConversionService, Job
+from roop_pdfmd.utils.logging_utils import get_logger
+
+
+_MAX_HEADER_LINES = 100
+_RESULT_FILES = {
+    "markdown": ("markdown_path", "text/markdown; charset=utf-8"),
+    "text": ("text_path", "text/plain; charset=utf-8"),
+    "metadata": ("metadata_path", "application/json"),
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class ConversionHttpServer:
+    """Minimal HTTP/1.1 front end for :class:`ConversionService`.
+
+    Routes:
+      ``POST /jobs``                  PDF upload (``application/pdf``) or JSON
+                                      ``{"path", "output_dir", "settings"}``;
+                                      ``output_dir`` must lie inside the
+                                      service's output folder
+      ``GET  /jobs``                  all jobs
+      ``GET  /jobs/<id>``             job status
+      ``GET  /jobs/<id>/events``      NDJSON stream of per-page progress
+      ``GET  /jobs/<id>/result[/markdown|/text|/metadata]``
+      ``GET  /metrics``               throughput metrics
+      ``GET  /health``
+    """
+
+    def __init__(
+        self,
+        service: ConversionService,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_upload_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self._service = service
+        self._host = host
+        self._port = port
+        self._max_upload_bytes = max_upload_bytes
+        self._logger = get_logger("service.http")
+        self._server: asyncio.AbstractServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._waiters: dict[str, asyncio.Event] = {}
+
+    @property
+    def port(self) -> int:
+        if self._server and self._server.sockets:
+            return self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._service.add_listener(self._on_job_changed)
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+        self._logger.info("Conversion service listening on http://%s:%s", self._host, self.port)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def _on_job_changed(self, job_id: str) -> None:
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake, job_id)
+
+    def _wake(self, job_id: str) -> None:
+        waiter = self._waiters.pop(job_id, None)
+        if waiter is not None:
+            waiter.set()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            method, target, headers = await self._read_head(reader)
+            body = await self._read_body(reader, headers)
+            await self._route(method, target, headers, body, writer)
+        except HttpError as exc:
+            await _send_json(writer, exc.status, {"error": str(exc)})
+        except ConversionError as exc:
+            await _send_json(writer, HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as exc:  # pragma: no cover - defensive
+            self._logger.exception("Request failed")
+            await _send_json(writer, HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)})
+        finally:
+            writer.close()
+
+    async def _read_head(self, reader: asyncio.StreamReader) -> tuple[str, str, dict[str, str]]:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        parts = request_line.split()
+        if len(parts) != 3:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+
+        headers: dict[str, str] = {}
+        for _ in range(_MAX_HEADER_LINES):
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return parts[0].upper(), parts[1], headers
+
+    async def _read_body(self, reader: asyncio.StreamReader, headers: dict[str, str]) -> bytes:
+        try:
+            length = int(headers.get("content-length", "0") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed Content-Length header")
+        if length > self._max_upload_bytes:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        if length == 0:
+            return b""
+        return await reader.readexactly(length)
+
+    async def _route(
+        self,
+        method: str,
+        target: str,
+        headers: dict[str, str],
+        body: bytes,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        url = urlsplit(target)
+        segments = [segment for segment in url.path.split("/") if segment]
+        query = parse_qs(url.query)
+
+        if segments == ["health"] and method == "GET":
+            await _send_json(writer, HTTPStatus.OK, {"status": "ok"})
+        elif segments == ["metrics"] and method == "GET":
+            await _send_json(writer, HTTPStatus.OK, self._service.metrics())
+        elif segments == ["jobs"] and method == "POST":
+            job = await asyncio.to_thread(self._submit, headers, body, query)
+            await _send_json(writer, HTTPStatus.ACCEPTED, job.to_dict())
+        elif segments == ["jobs"] and method == "GET":
+            await _send_json(
+                writer, HTTPStatus.OK, {"jobs": [job.to_dict() for job in self._service.jobs()]}
+            )
+        elif len(segments) >= 2 and segments[0] == "jobs" and method == "GET":
+            job = self._job(segments[1])
+            tail = segments[2:]
+            if not tail:
+                await _send_json(writer, HTTPStatus.OK, job.to_dict())
+            elif tail == ["events"]:
+                await self._stream_events(job, writer)
+            elif tail[0] == "result" and len(tail) <= 2:
+                await self._send_result(job, tail[1] if len(tail) == 2 else "", writer)
+            else:
+                raise HttpError(HTTPStatus.NOT_FOUND, "Not found")
+        else:
+            raise HttpError(HTTPStatus.NOT_FOUND, "Not found")
+
+    def _submit(self, headers: dict[str, str], body: bytes, query: dict[str, list[str]]) -> Job:
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type == "application/json":
+            try:
+                payload = json.loads(body or b"{}")
+            except json.JSONDecodeError as exc:
+                raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {exc}") from exc
+            if not isinstance(payload, dict) or not payload.get("path"):
+                raise HttpError(HTTPStatus.BAD_REQUEST, "JSON body must contain 'path'")
+            return self._service.submit_path(
+                payload["path"],
+                output_dir=self._output_dir(payload.get("output_dir")),
+                settings_overrides=payload.get("settings"),
+            )
+
+        if content_type in ("application/pdf", "application/octet-stream"):
+            filename = query.get("filename", ["upload.pdf"])[0]
+            return self._service.submit_upload(body, filename=filename)
+
+        raise HttpError(
+            HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+            "Send a PDF as application/pdf or a JSON job description",
+        )
+
+    def _output_dir(self, raw: Any) -> Path | None:
+        """Resolve a client-supplied output directory, relative to the output root.
+
+        Clients may only write below the service's output folder; absolute
+        paths and ``..`` that lead outside it are rejected.
+        """
+        if not raw:
+            return None
+        root = self._service.output_root.resolve()
+        target = (root / str(raw)).resolve()
+        if not target.is_relative_to(root):
+            raise HttpError(
+                HTTPStatus.BAD_REQUEST, f"output_dir must be inside the output folder {root}"
+            )
+        return target
+
+    def _job(self, job_id: str) -> Job:
+        job = self._service.get(job_id)
+        if job is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown job: {job_id}")
+        return job
+
+    async def _stream_events(self, job: Job, writer: asyncio.StreamWriter) -> None:
+        writer.write(
+            _head(
+                HTTPStatus.OK,
+                {"Content-Type": "application/x-ndjson", "Transfer-Encoding": "chunked"},
+            )
+        )
+        sent = 0
+        while True:
+            # Register the waiter before reading so a wake-up between the read
+            # and the wait cannot be missed.
+            waiter = self._waiters.setdefault(job.job_id, asyncio.Event())
+            events, finished = self._service.events_since(job.job_id, sent)
+            for event in events:
+                _write_chunk(writer, json.dumps(event).encode("utf-8") + b"\n")
+            sent += len(events)
+            await writer.drain()
+            if finished and not events:
+                break
+            if not finished:
+                await waiter.wait()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _send_result(self, job: Job, kind: str, writer: asyncio.StreamWriter) -> None:
+        if not job.finished:
+            raise HttpError(HTTPStatus.CONFLICT, f"Job is {job.state.value}")
+        if job.result is None:
+            raise HttpError(HTTPStatus.CONFLICT, job.error or "Job has no result")
+        if not kind:
+            await _send_json(writer, HTTPStatus.OK, job.result)
+            return
+        if kind not in _RESULT_FILES:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown result kind: {kind}")
+
+        key, content_type = _RESULT_FILES[kind]
+        content = await asyncio.to_thread(Path(job.result[key]).read_bytes)
+        await _send(writer, HTTPStatus.OK, content, content_type)
+
+
+def run_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    work_dir: str | Path = "roop_pdfmd_service",
+    workers: int = 2,
+    settings: AppSettings | None = None,
+) -> int:
+    service = ConversionService(work_dir, workers=workers, settings=settings)
+    server = ConversionHttpServer(service, host=host, port=port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+    return 0
+
+
+def _head(status: HTTPStatus, headers: dict[str, str]) -> bytes:
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}", "Connection: close"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def _write_chunk(writer: asyncio.StreamWriter, data: bytes) -> None:
+    writer.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+
+
+async def _send(
+    writer: asyncio.StreamWriter,
+    status: HTTPStatus,
+    body: bytes,
+    content_type: str,
+) -> None:
+    writer.write(
+        _head(status, {"Content-Type": content_type, "Content-Length": str(len(body))}) + body
+    )
+    await writer.drain()
+
+
+async def _send_json(writer: asyncio.StreamWriter, status: HTTPStatus, payload: Any) -> None:
+    body = json.dumps(payload, indent=2).encode("utf-8")
+    await _send(writer, status, body, "application/json")
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields, replace
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable
+
+from roop_pdfmd.core.converter import ConversionError
+from roop_pdfmd.core.models import AppSettings, PageResult, ProgressEvent
+from roop_pdfmd.core.presets import apply_preset
+from roop_pdfmd.core.session import ConverterSession
+from roop_pdfmd.utils.logging_utils import get_logger
+from roop_pdfmd.utils.paths import ensure_dir
+
+
+JobListener = Callable[[str], None]
+
+_STOP = None
+
+
+class JobState(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class Job:
+    job_id: str
+    input_pdf: Path
+    output_dir: Path
+    settings: AppSettings
+    state: JobState = JobState.QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    total_pages: int = 0
+    processed_pages: int = 0
+    worker_pid: int | None = None
+    error: str = ""
+    result: dict[str, Any] | None = None
+    events: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (JobState.COMPLETED, JobState.FAILED)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "state": self.state.value,
+            "input_pdf": str(self.input_pdf),
+            "output_dir": str(self.output_dir),
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "total_pages": self.total_pages,
+            "processed_pages": self.processed_pages,
+            "worker_pid": self.worker_pid,
+            "error": self.error,
+            "result": self.result,
+        }
+
+
+class ConversionService:
+    """Job queue in front of a pool of warm converter processes.
+
+    Each worker process keeps a :class:`ConverterSession` for its lifetime, so
+    the Tesseract binary is resolved once per worker rather than per job.
+    Per-page progress flows back over a shared queue and is recorded as job
+    events for status polling and streaming.
+    """
+
+    def __init__(
+        self,
+        work_dir: str | Path,
+        workers: int = 2,
+        settings: AppSettings | None = None,
+    ) -> None:
+        self._work_dir = ensure_dir(Path(work_dir).expanduser().resolve())
+        self._workers = max(workers, 1)
+        self._settings = settings or AppSettings()
+        self._logger = get_logger("service")
+        self._lock = threading.Lock()
+        self._jobs: dict[str, Job] = {}
+        self._listeners: list[JobListener] = []
+        self._started_at = time.time()
+        self._pages_processed = 0
+
+        context = multiprocessing.get_context("spawn")
+        self._events = context.Queue()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self._events,),
+        )
+        self._event_thread = threading.Thread(
+            target=self._drain_events,
+            name="roop-pdfmd-service-events",
+            daemon=True,
+        )
+        self._event_thread.start()
+
+    @property
+    def work_dir(self) -> Path:
+        return self._work_dir
+
+    @property
+    def output_root(self) -> Path:
+        """Where job outputs go unless the caller picks an output directory."""
+        return self._work_dir / "outputs"
+
+    def add_listener(self, listener: JobListener) -> None:
+        self._listeners.append(listener)
+
+    def submit_path(
+        self,
+        input_pdf: str | Path,
+        output_dir: str | Path | None = None,
+        settings_overrides: dict[str, Any] | None = None,
+        output_name: str = "",
+    ) -> Job:
+        input_pdf = Path(input_pdf).expanduser().resolve()
+        if not input_pdf.is_file():
+            raise ConversionError(f"Input PDF not found: {input_pdf}")
+
+        settings = _apply_overrides(self._settings, settings_overrides or {})
+        job_id = uuid.uuid4().hex
+        target_dir = (
+            Path(output_dir).expanduser().resolve()
+            if output_dir
+            else self.output_root / job_id
+        )
+        return self._submit(job_id, input_pdf, target_dir, settings, output_name)
+
+    def submit_upload(
+        self,
+        data: bytes,
+        filename: str = "upload.pdf",
+        settings_overrides: dict[str, Any] | None = None,
+    ) -> Job:
+        if not data:
+            raise ConversionError("Uploaded PDF is empty.")
+
+        settings = _apply_overrides(self._settings, settings_overrides or {})
+        job_id = uuid.uuid4().hex
+        stem = Path(filename).stem or "upload"
+        upload_dir = ensure_dir(self._work_dir / "uploads" / job_id)
+        input_pdf = upload_dir / f"{stem}.pdf"
+        input_pdf.write_bytes(data)
+        return self._submit(job_id, input_pdf, self.output_root / job_id, settings)
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> list[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def forget(self, job_id: str) -> None:
+        """Drop a finished job so long-running callers don't accumulate them."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.finished:
+                del self._jobs[job_id]
+
+    def events_since(self, job_id: str, index: int) -> tuple[list[dict[str, Any]], bool]:
+        with self._lock:
+            job = self._jobs[job_id]
+            return list(job.events[index:]), job.finished
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            jobs = list(self._jobs.values())
+            pages_processed = self._pages_processed
+
+        uptime = max(time.time() - self._started_at, 1e-9)
+        counts = {state.value: 0 for state in JobState}
+        for job in jobs:
+            counts[job.state.value] += 1
+
+        finished = [job for job in jobs if job.finished and job.started_at and job.finished_at]
+        busy_seconds = sum(
+            job.finished_at - job.started_at for job in finished  # type: ignore[operator]
+        )
+        finished_pages = sum(job.processed_pages for job in finished)
+        return {
+            "workers": self._workers,
+            "uptime_seconds": uptime,
+            "jobs": counts,
+            "queue_depth": counts[JobState.QUEUED.value],
+            "pages_processed": pages_processed,
+            "pages_per_second": pages_processed / uptime,
+            "pages_per_busy_second": finished_pages / busy_seconds if busy_seconds > 0 else 0.0,
+        }
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._events.put(_STOP)
+        self._event_thread.join(timeout=5)
+        self._events.close()
+
+    def _submit(
+        self,
+        job_id: str,
+        input_pdf: Path,
+        output_dir: Path,
+        settings: AppSettings,
+        output_name: str = "",
+    ) -> Job:
+        job = Job(job_id=job_id, input_pdf=input_pdf, output_dir=output_dir, settings=settings)
+        with self._lock:
+            self._jobs[job_id] = job
+            job.events.append({"type": "queued", "job_id": job_id})
+
+        future = self._pool.submit(
+            _run_job, job_id, str(input_pdf), str(output_dir), settings, output_name
+        )
+        future.add_done_callback(lambda done: self._on_job_done(job_id, done))
+        self._logger.info("Queued job %s | input=%s", job_id, input_pdf)
+        self._notify(job_id)
+        return job
+
+    def _drain_events(self) -> None:
+        while True:
+            event = self._events.get()
+            if event is _STOP:
+                return
+            job_id = event["job_id"]
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job.finished:
+                    continue
+                self._apply_event(job, event)
+                job.events.append(event)
+            if event["type"] == "failed":
+                self._logger.error("Job %s failed: %s", job_id, event["error"])
+            self._notify(job_id)
+
+    def _apply_event(self, job: Job, event: dict[str, Any]) -> None:
+        event_type = event["type"]
+        if event_type == "started":
+            job.state = JobState.RUNNING
+            job.started_at = event["time"]
+            job.worker_pid = event["pid"]
+        elif event_type == "page":
+            job.total_pages = event["total_pages"]
+            job.processed_pages = event["current_page"]
+            self._pages_processed += 1
+        elif event_type == "completed":
+            result = event["result"]
+            job.state = JobState.COMPLETED
+            job.finished_at = event["time"]
+            job.result = result
+            job.total_pages = result["total_pages"]
+            job.processed_pages = result["processed_pages"]
+        elif event_type == "failed":
+            job.state = JobState.FAILED
+            job.finished_at = event["time"]
+            job.error = event["error"]
+
+    def _on_job_done(self, job_id: str, future: Future) -> None:
+        # Normal completion is reported through the event queue so it always
+        # follows the job's page events; this only catches jobs whose worker
+        # died or that never reached a worker.
+        exc = None if future.cancelled() else future.exception()
+        if exc is None and not future.cancelled():
+            return
+
+        error = str(exc) if exc else "Job cancelled"
+        with self._lock:
+            job = self._jobs[job_id]
+            if job.finished:
+                return
+            event = {"type": "failed", "job_id": job_id, "error": error, "time": time.time()}
+            self._apply_event(job, event)
+            job.events.append(event)
+        self._logger.error("Job %s failed: %s", job_id, error)
+        self._notify(job_id)
+
+    def _notify(self, job_id: str) -> None:
+        for listener in self._listeners:
+            listener(job_id)
+
+
+def _apply_overrides(settings: AppSettings, overrides: dict[str, Any]) -> AppSettings:
+    """Apply ``overrides``; a ``preset`` key goes first so explicit fields win over it."""
+    overrides = dict(overrides)
+    preset = overrides.pop("preset", None)
+    known = {item.name for item in fields(AppSettings)}
+    unknown = sorted(set(overrides) - known)
+    if unknown:
+        raise ConversionError(f"Unknown settings: {', '.join(unknown)}")
+    if preset is not None:
+        try:
+            settings = apply_preset(settings, preset)
+        except ValueError as exc:
+            raise ConversionError(str(exc)) from exc
+    return replace(settings, **overrides)
+
+
+_worker_session: ConverterSession | None = None
+_worker_events: Any = None
+
+
+def _init_worker(events: Any) -> None:
+    global _worker_session, _worker_events
+
+    _worker_events = events
+    _worker_session = ConverterSession()
+
+
+def _run_job(
+    job_id: str,
+    input_pdf: str,
+    output_dir: str,
+    settings: AppSettings,
+    output_name: str = "",
+) -> dict[str, Any]:
+    assert _worker_session is not None
+
+    _worker_events.put(
+        {"type": "started", "job_id": job_id, "pid": os.getpid(), "time": time.time()}
+    )
+    last_page: dict[str, Any] = {}
+
+    def _on_page(page_result: PageResult, _markdown: str, _text: str) -> None:
+        last_page.clear()
+        last_page.update(asdict(page_result), mode=page_result.mode.value)
+
+    def _on_progress(event: ProgressEvent) -> None:
+        _worker_events.put(
+            {
+                "type": "page",
+                "job_id": job_id,
+                "current_page": event.current_page,
+                "total_pages": event.total_pages,
+                "elapsed_seconds": event.elapsed_seconds,
+                "eta_seconds": event.eta_seconds,
+                "page": dict(last_page),
+            }
+        )
+
+    try:
+        result = _worker_session.convert(
+            input_pdf,
+            output_dir,
+            settings,
+            progress_callback=_on_progress,
+            page_callback=_on_page,
+            output_name=output_name,
+        )
+    except Exception as exc:
+        _worker_events.put(
+            {"type": "failed", "job_id": job_id, "error": str(exc), "time": time.time()}
+        )
+        raise
+
+    summary = {
+        "markdown_path": str(result.markdown_path),
+        "text_path": str(result.text_path),
+        "metadata_path": str(result.metadata_path),
+        "page_index_path": str(result.page_index_path) if result.page_index_path else None,
+        "total_pages": result.total_pages,
+        "processed_pages": result.processed_pages,
+        "extracted_pages": result.extracted_pages,
+        "ocr_pages": result.ocr_pages,
+        "blank_pages": result.blank_pages,
+        "cancelled": result.cancelled,
+        "duration_seconds": result.duration_seconds,
+        "cpu_seconds": result.cpu_seconds,
+        "process_peak_rss_bytes": result.process_peak_rss_bytes,
+        "resource_warnings": result.resource_warnings,
+        "errors": result.errors,
+    }
+    _worker_events.put(
+        {"type": "completed", "job_id": job_id, "result": summary, "time": time.time()}
+    )
+    return summary
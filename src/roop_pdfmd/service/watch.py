@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from roop_pdfmd.core.converter import ConversionError
+from roop_pdfmd.core.history import (
+    CostModel,
+    HistoryError,
+    RunHistory,
+    estimate_seconds,
+)
+from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.service.jobs import ConversionService, JobState
+from roop_pdfmd.utils.logging_utils import get_logger
+from roop_pdfmd.utils.paths import ensure_dir, resolve_output_relative_path
+
+
+JOURNAL_NAME = ".roop-watch.jsonl"
+PROCESSED_DIR = "processed"
+FAILED_DIR = "failed"
+
+
+@dataclass(slots=True, frozen=True)
+class WatchFolder:
+    input_dir: Path
+    output_dir: Path
+
+
+@dataclass(slots=True, frozen=True)
+class _Fingerprint:
+    size: int
+    mtime_ns: int
+
+
+@dataclass(slots=True)
+class _Candidate:
+    fingerprint: _Fingerprint
+    stable_since: float
+    expected_seconds: float | None = None
+
+
+@dataclass(slots=True)
+class _WatchedFile:
+    folder: WatchFolder
+    path: Path
+    relative: str
+    fingerprint: _Fingerprint
+    output_name: str = ""
+    job_id: str = ""
+
+
+class FolderWatcher:
+    """Polls inbox folders and converts new PDFs once they stop changing.
+
+    Polling (rather than OS change notifications) keeps this working on
+    network mounts. A file is picked up after its size and mtime have been
+    the same for ``settle_seconds`` across polls. Outputs mirror the inbox
+    tree under the folder's output directory, renamed like moved inputs when
+    an earlier file of the same name left outputs there; inputs then move to
+    the inbox's ``processed/`` or ``failed/`` subfolder. When more files are
+    ready than workers are free, the ones expected to finish soonest go first
+    (run history cost model, or its priors without ``history_path``).
+
+    Finished files are recorded in a journal in the output directory before
+    they are moved, so a file left in the inbox by a crash is moved aside on
+    restart instead of converted again.
+    """
+
+    def __init__(
+        self,
+        folders: list[WatchFolder],
+        settings: AppSettings | None = None,
+        workers: int = 2,
+        poll_seconds: float = 5.0,
+        settle_seconds: float = 10.0,
+        service: ConversionService | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not folders:
+            raise ConversionError("No folders to watch.")
+        self._folders = [
+            WatchFolder(
+                input_dir=Path(folder.input_dir).expanduser().resolve(),
+                output_dir=Path(folder.output_dir).expanduser().resolve(),
+            )
+            for folder in folders
+        ]
+        for folder in self._folders:
+            if not folder.input_dir.is_dir():
+                raise ConversionError(f"Watch folder not found: {folder.input_dir}")
+            ensure_dir(folder.output_dir)
+
+        self._workers = max(workers, 1)
+        self._poll_seconds = max(poll_seconds, 0.1)
+        self._settle_seconds = max(settle_seconds, 0.0)
+        self._clock = clock
+        self._logger = get_logger("watch")
+        self._settings = settings or AppSettings()
+        self._owns_service = service is None
+        self._service = service or ConversionService(
+            self._folders[0].output_dir, workers=self._workers, settings=self._settings
+        )
+        self._candidates: dict[Path, _Candidate] = {}
+        self._in_flight: dict[Path, _WatchedFile] = {}
+        self._journals = {folder: _load_journal(folder.output_dir) for folder in self._folders}
+        self.converted = 0
+        self.failed = 0
+
+    @property
+    def folders(self) -> list[WatchFolder]:
+        return list(self._folders)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._in_flight or self._candidates)
+
+    def poll(self) -> None:
+        """One scan of every folder: collect finished jobs, then submit settled files."""
+        self._collect_finished()
+        now = self._clock()
+        seen: set[Path] = set()
+        ready: list[_WatchedFile] = []
+        for folder in self._folders:
+            for path in _scan_pdfs(folder.input_dir):
+                seen.add(path)
+                if path not in self._in_flight:
+                    item = self._consider(folder, path, now)
+                    if item is not None:
+                        ready.append(item)
+        for path in set(self._candidates) - seen:
+            del self._candidates[path]
+
+        free = self._workers - len(self._in_flight)
+        if 0 < free < len(ready):
+            ready = self._shortest_first(ready)
+        for item in ready[: max(free, 0)]:
+            self._submit(item)
+
+    def run(self, stop_event: threading.Event | None = None) -> None:
+        stop_event = stop_event or threading.Event()
+        self._logger.info(
+            "Watching %s",
+            ", ".join(f"{folder.input_dir} -> {folder.output_dir}" for folder in self._folders),
+        )
+        try:
+            while not stop_event.is_set():
+                self.poll()
+                stop_event.wait(self._poll_seconds)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._owns_service:
+            # Waits for running conversions so their inputs are still moved aside.
+            self._service.close()
+            self._collect_finished()
+
+    def _consider(self, folder: WatchFolder, path: Path, now: float) -> _WatchedFile | None:
+        """Track ``path`` and return it once it has settled."""
+        fingerprint = _fingerprint(path)
+        if fingerprint is None:
+            return None
+        relative = path.relative_to(folder.input_dir).as_posix()
+        entry = self._journals[folder].get(relative)
+        if entry is not None and _Fingerprint(entry["size"], entry["mtime_ns"]) == fingerprint:
+            # Finished before a restart but never moved aside.
+            self._logger.info("Already converted, moving aside | input=%s", path)
+            self._move_aside(folder, path, relative, entry["status"] == "done", entry["error"])
+            return None
+
+        candidate = self._candidates.get(path)
+        if candidate is None or candidate.fingerprint != fingerprint:
+            self._candidates[path] = _Candidate(fingerprint=fingerprint, stable_since=now)
+            return None
+        if now - candidate.stable_since < self._settle_seconds or not _readable(path):
+            return None
+        return _WatchedFile(folder=folder, path=path, relative=relative, fingerprint=fingerprint)
+
+    def _submit(self, item: _WatchedFile) -> None:
+        del self._candidates[item.path]
+        output_dir = item.folder.output_dir / Path(item.relative).parent
+        try:
+            item.output_name = self._output_name(output_dir, Path(item.relative).stem)
+            job = self._service.submit_path(
+                item.path, output_dir, output_name=item.output_name
+            )
+        except ConversionError as exc:
+            self._finish(item, False, f"Could not queue: {exc}")
+            return
+        item.job_id = job.job_id
+        self._in_flight[item.path] = item
+
+    def _output_name(self, output_dir: Path, stem: str) -> str:
+        """``stem``, or a free variant of it when its outputs exist or are being written."""
+        taken = {
+            item.output_name
+            for item in self._in_flight.values()
+            if item.folder.output_dir / Path(item.relative).parent == output_dir
+        }
+        if stem not in taken and not (output_dir / f"{stem}.md").exists():
+            return stem
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        for attempt in range(1, 1000):
+            name = f"{stem}-{stamp}-{attempt}"
+            if name not in taken and not (output_dir / f"{name}.md").exists():
+                return name
+        raise ConversionError(f"No free output name for {stem} in {output_dir}")
+
+    def _shortest_first(self, ready: list[_WatchedFile]) -> list[_WatchedFile]:
+        models: dict[Path | None, CostModel] = {}
+
+        def expected_seconds(item: _WatchedFile) -> float:
+            candidate = self._candidates[item.path]
+            if candidate.expected_seconds is None:
+                candidate.expected_seconds = estimate(item)
+            return candidate.expected_seconds
+
+        def estimate(item: _WatchedFile) -> float:
+            history_path = resolve_output_relative_path(
+                self._settings.history_path, item.folder.output_dir
+            )
+            if history_path not in models:
+                models[history_path] = CostModel()
+                if history_path is not None:
+                    try:
+                        with RunHistory(history_path) as history:
+                            models[history_path] = history.model()
+                    except HistoryError as exc:
+                        self._logger.warning("Run history unavailable: %s", exc)
+            try:
+                return estimate_seconds(item.path, self._settings, models[history_path])
+            except HistoryError:
+                return float("inf")
+
+        return sorted(ready, key=expected_seconds)
+
+    def _collect_finished(self) -> None:
+        for path, item in list(self._in_flight.items()):
+            job = self._service.get(item.job_id)
+            if job is None or not job.finished:
+                continue
+            del self._in_flight[path]
+            self._finish(item, job.state == JobState.COMPLETED, job.error)
+            self._service.forget(item.job_id)
+
+    def _finish(self, item: _WatchedFile, succeeded: bool, error: str) -> None:
+        self._record(item, succeeded, error)
+        self._move_aside(item.folder, item.path, item.relative, succeeded, error)
+        if succeeded:
+            self.converted += 1
+            self._logger.info("Converted %s", item.path)
+        else:
+            self.failed += 1
+            self._logger.error("Failed to convert %s: %s", item.path, error)
+
+    def _record(self, item: _WatchedFile, succeeded: bool, error: str) -> None:
+        entry = {
+            "path": item.relative,
+            "size": item.fingerprint.size,
+            "mtime_ns": item.fingerprint.mtime_ns,
+            "status": "done" if succeeded else "failed",
+            "error": error,
+            "finished_at": time.time(),
+        }
+        try:
+            with (item.folder.output_dir / JOURNAL_NAME).open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(entry) + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+        except OSError as exc:
+            # Still moved aside; only a restart before the move would convert it again.
+            self._logger.error("Could not journal %s: %s", item.path, exc)
+        self._journals[item.folder][item.relative] = entry
+
+    def _move_aside(
+        self,
+        folder: WatchFolder,
+        path: Path,
+        relative: str,
+        succeeded: bool,
+        error: str,
+    ) -> None:
+        target_root = folder.input_dir / (PROCESSED_DIR if succeeded else FAILED_DIR)
+        try:
+            target = _free_path(target_root / relative)
+            ensure_dir(target.parent)
+            path.replace(target)
+        except (OSError, ConversionError) as exc:
+            self._logger.error("Could not move %s aside: %s", path, exc)
+            return
+        if succeeded:
+            return
+        error_path = target.with_name(f"{target.name}.error.txt")
+        try:
+            error_path.write_text(error + "\n", encoding="utf-8")
+        except OSError as exc:
+            self._logger.error("Could not write %s: %s", error_path, exc)
+
+
+def watch_folders_from_args(output_root: str | Path, inputs: list[str]) -> list[WatchFolder]:
+    """Map each input folder to ``<output_root>/<input folder name>``."""
+    output_root = Path(output_root).expanduser().resolve()
+    folders: list[WatchFolder] = []
+    names: set[str] = set()
+    for raw in inputs:
+        input_dir = Path(raw).expanduser().resolve()
+        if input_dir.name in names:
+            raise ConversionError(f"Two watch folders are named {input_dir.name!r}.")
+        names.add(input_dir.name)
+        folders.append(WatchFolder(input_dir=input_dir, output_dir=output_root / input_dir.name))
+    return folders
+
+
+def _scan_pdfs(input_dir: Path) -> list[Path]:
+    found: list[Path] = []
+    for root, dirs, files in os.walk(input_dir):
+        skip = {PROCESSED_DIR, FAILED_DIR} if Path(root) == input_dir else set()
+        dirs[:] = sorted(name for name in dirs if name not in skip and not name.startswith("."))
+        found.extend(
+            Path(root) / name
+            for name in sorted(files)
+            if name.lower().endswith(".pdf") and not name.startswith((".", "~"))
+        )
+    return found
+
+
+def _fingerprint(path: Path) -> _Fingerprint | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return _Fingerprint(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+def _readable(path: Path) -> bool:
+    # Scanners on Windows shares hold the file locked while writing it.
+    try:
+        with path.open("rb") as handle:
+            handle.read(1)
+        return path.stat().st_size > 0
+    except OSError:
+        return False
+
+
+def _free_path(path: Path) -> Path:
+    if not path.exists():
+        return path
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    for attempt in range(1, 1000):
+        candidate = path.with_name(f"{path.stem}-{stamp}-{attempt}{path.suffix}")
+        if not candidate.exists():
+            return candidate
+    raise ConversionError(f"No free name next to {path}")
+
+
+def _load_journal(output_dir: Path) -> dict[str, dict[str, Any]]:
+    """Latest entry per input path; the file is rewritten without superseded lines."""
+    journal_path = output_dir / JOURNAL_NAME
+    entries: dict[str, dict[str, Any]] = {}
+    try:
+        lines = journal_path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return entries
+    for line in lines:
+        try:
+            entry = json.loads(line)
+            entries[entry["path"]] = entry
+        except (ValueError, KeyError, TypeError):
+            # A torn last line after a crash.
+            continue
+    if len(entries) < len(lines):
+        temp_path = journal_path.with_suffix(".tmp")
+        temp_path.write_text(
+            "".join(json.dumps(entry) + "\n" for entry in entries.values()), encoding="utf-8"
+        )
+        temp_path.replace(journal_path)
+    return entries
@@ -30,6 +30,15 @@ def ensure_dir(path: Path) -> Path:
     return path
 
 
+def resolve_output_relative_path(setting: str, output_dir: Path) -> Path | None:
+    """Relative settings live inside the output directory; absolute ones are shared."""
+    setting = setting.strip()
+    if not setting:
+        return None
+    path = Path(setting).expanduser()
+    return path if path.is_absolute() else output_dir / path
+
+
 def get_logs_dir() -> Path:
     return ensure_dir(get_runtime_base_dir() / "logs")
 
@@ -0,0 +1,103 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.core.async_api import AsyncConversionPool
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.models import AppSettings
+
+
+def _make_text_pdf(path: Path, pages: int = 3) -> None:
+    doc = fitz.open()
+    for idx in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Text layer content for page number {idx + 1}.")
+    doc.save(path)
+    doc.close()
+
+
+def _make_blank_pdf(path: Path) -> None:
+    doc = fitz.open()
+    doc.new_page()
+    doc.save(path)
+    doc.close()
+
+
+def _make_slow_tesseract(path: Path) -> Path:
+    path.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, time\n"
+        "if '--version' in sys.argv:\n"
+        "    print('tesseract 5.3.0')\n"
+        "    sys.exit(0)\n"
+        "time.sleep(30)\n",
+        encoding="utf-8",
+    )
+    path.chmod(0o755)
+    return path
+
+
+def test_aconvert_matches_convert(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "doc.pdf"
+    _make_text_pdf(pdf_path)
+
+    sync_result = Converter().convert(pdf_path, tmp_path / "sync", AppSettings())
+    async_result = asyncio.run(Converter().aconvert(pdf_path, tmp_path / "async", AppSettings()))
+
+    assert async_result.processed_pages == sync_result.processed_pages == 3
+    assert async_result.markdown_path.read_text(encoding="utf-8") == (
+        sync_result.markdown_path.read_text(encoding="utf-8")
+    )
+
+
+def test_aiter_pages_yields_pages_in_order(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "doc.pdf"
+    _make_text_pdf(pdf_path)
+
+    async def _collect() -> list[int]:
+        return [
+            output.result.page_number
+            async for output in Converter().aiter_pages(pdf_path, AppSettings())
+        ]
+
+    assert asyncio.run(_collect()) == [1, 2, 3]
+    assert not (tmp_path / "doc.md").exists()
+
+
+def test_pool_runs_concurrent_conversions(tmp_path: Path) -> None:
+    pdf_paths = []
+    for idx in range(4):
+        pdf_path = tmp_path / f"doc{idx}.pdf"
+        _make_text_pdf(pdf_path, pages=2)
+        pdf_paths.append(pdf_path)
+
+    async def _run() -> list[int]:
+        async with AsyncConversionPool(max_concurrency=2) as pool:
+            results = await asyncio.gather(
+                *(pool.convert(path, tmp_path / "out", AppSettings()) for path in pdf_paths)
+            )
+        return [result.processed_pages for result in results]
+
+    assert asyncio.run(_run()) == [2, 2, 2, 2]
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="uses a POSIX script as Tesseract")
+def test_task_cancellation_aborts_in_flight_ocr(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "blank.pdf"
+    _make_blank_pdf(pdf_path)
+    settings = AppSettings(tesseract_path=str(_make_slow_tesseract(tmp_path / "tesseract")))
+
+    async def _run() -> float:
+        task = asyncio.create_task(Converter().aconvert(pdf_path, tmp_path / "out", settings))
+        await asyncio.sleep(1.0)
+        started = time.perf_counter()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return time.perf_counter() - started
+
+    assert asyncio.run(_run()) < 5.0
@@ -0,0 +1,110 @@
+import json
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.core.blank_page import is_blank_page, skip_as_blank
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.models import AppSettings, PageMode
+from roop_pdfmd.core.text_quality import detect_page_text_quality
+
+
+def _page(doc: fitz.Document, kind: str) -> fitz.Page:
+    page = doc.new_page()
+    if kind == "page-number":
+        page.insert_text((300, 800), "12", fontsize=10)
+    elif kind == "show-through":
+        page.draw_rect(page.rect, fill=(0.93, 0.92, 0.88), color=None)
+        for top in range(100, 700, 16):
+            page.draw_rect(fitz.Rect(72, top, 520, top + 6), fill=(0.8, 0.8, 0.78), color=None)
+        for idx in range(5):
+            page.draw_circle(fitz.Point(90 + 90 * idx, 150 * idx + 90), 0.6, fill=(0.3, 0.3, 0.3))
+    elif kind == "scanner-edge":
+        page.draw_rect(fitz.Rect(0, 0, 12, page.rect.height), fill=(0, 0, 0), color=None)
+    elif kind == "footnote":
+        page.insert_text((72, 400), "Tiny 6pt footnote on an otherwise empty page", fontsize=6)
+    elif kind == "figure":
+        page.draw_rect(fitz.Rect(72, 72, 300, 300), color=(0, 0, 0), fill=(0.5, 0.5, 0.5))
+    elif kind == "dark-photo":
+        page.draw_rect(page.rect, fill=(0.1, 0.1, 0.1), color=None)
+    return page
+
+
+@pytest.mark.parametrize(
+    ("kind", "blank"),
+    [
+        ("empty", True),
+        ("page-number", True),
+        ("show-through", True),
+        ("scanner-edge", True),
+        ("footnote", False),
+        ("figure", False),
+        ("dark-photo", False),
+    ],
+)
+def test_blank_page_classification(kind: str, blank: bool) -> None:
+    doc = fitz.open()
+    assert is_blank_page(_page(doc, kind)) is blank
+
+
+def test_blank_cutoff_follows_min_text_chars() -> None:
+    doc = fitz.open()
+    page = _page(doc, "page-number")
+    quality = detect_page_text_quality(page)
+
+    assert skip_as_blank(page, quality, AppSettings(skip_blank_pages=True))
+    assert not skip_as_blank(
+        page, quality, AppSettings(skip_blank_pages=True, ocr_min_text_chars=1)
+    )
+
+
+def _make_duplex_pdf(path: Path) -> Path:
+    doc = fitz.open()
+    for kind in ("text", "empty", "figure", "show-through"):
+        page = _page(doc, kind)
+        if kind == "text":
+            page.insert_textbox(
+                fitz.Rect(72, 72, 540, 720), " ".join(f"front{n} side" for n in range(60))
+            )
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_blank_pages_skip_ocr(tmp_path: Path) -> None:
+    pdf_path = _make_duplex_pdf(tmp_path / "duplex.pdf")
+    settings = AppSettings(ocr_backend="stub", ocr_dpi=72, skip_blank_pages=True)
+
+    result = Converter().convert(pdf_path, tmp_path / "out", settings)
+
+    assert [page.mode for page in result.pages] == [
+        PageMode.EXTRACT,
+        PageMode.BLANK,
+        PageMode.OCR,
+        PageMode.BLANK,
+    ]
+    assert (result.extracted_pages, result.ocr_pages, result.blank_pages) == (1, 1, 2)
+    assert result.pages[1].text_length == 0 and result.pages[1].ocr_dpi == 0
+    metadata = json.loads(result.metadata_path.read_text(encoding="utf-8"))
+    assert metadata["blank_pages"] == 2
+    assert metadata["pages"][3]["mode"] == "BLANK"
+
+
+def test_blank_separators_do_not_require_tesseract(tmp_path: Path) -> None:
+    doc = fitz.open()
+    for kind in ("empty", "text", "empty"):
+        page = _page(doc, kind)
+        if kind == "text":
+            page.insert_textbox(fitz.Rect(72, 72, 540, 720), "A page with a text layer. " * 20)
+    pdf_path = tmp_path / "separated.pdf"
+    doc.save(pdf_path)
+    doc.close()
+    converter = Converter(tesseract_resolver=lambda _: "")
+
+    ocr = converter.convert(pdf_path, tmp_path / "ocr", AppSettings())
+    skipped = converter.convert(pdf_path, tmp_path / "skip", AppSettings(skip_blank_pages=True))
+
+    assert len(ocr.errors) == 2
+    assert skipped.blank_pages == 2
+    assert not skipped.errors
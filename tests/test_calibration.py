@@ -0,0 +1,134 @@
+import json
+from pathlib import Path
+
+import fitz
+
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.models import AppSettings, CalibrationCandidate
+from roop_pdfmd.core.ocr_backends import StubOcrBackend
+from roop_pdfmd.core.sharding import ShardQueue, run_shard_worker
+from roop_pdfmd.core.tesseract import mean_tsv_confidence
+
+_PAGE_POINTS = 144
+
+
+class _ThresholdLovingBackend(StubOcrBackend):
+    """Confident only on binarised images rendered at ``good_dpi``."""
+
+    def __init__(self, good_dpi: int | None) -> None:
+        self._good_width = _PAGE_POINTS * good_dpi // 72 if good_dpi else None
+
+    def image_confidence(
+        self, image, tesseract_cmd, lang="eng", cancel_event=None, env=None, psm=None
+    ):
+        binarised = len(image.getcolors(256) or range(257)) <= 2
+        if binarised and image.width == self._good_width:
+            return 95.0
+        return 70.0 if binarised else 60.0
+
+
+def _make_scan_pdf(path: Path, pages: int = 4) -> Path:
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page(width=_PAGE_POINTS, height=_PAGE_POINTS)
+        page.draw_rect(fitz.Rect(10, 10, 70, 70), color=(0, 0, 0), fill=(0.4, 0.4, 0.4))
+        page.draw_circle(fitz.Point(100, 100), 20, color=(0.2, 0.2, 0.2), fill=(0.7, 0.7, 0.7))
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_calibration_applies_cheapest_config_meeting_target(tmp_path: Path) -> None:
+    pdf_path = _make_scan_pdf(tmp_path / "scan.pdf")
+    settings = AppSettings(ocr_backend="stub", ocr_calibrate=True, ocr_calibration_pages=2)
+    converter = Converter(ocr_backend_factory=lambda _: _ThresholdLovingBackend(good_dpi=200))
+
+    result = converter.convert(pdf_path, tmp_path / "out", settings)
+
+    calibration = result.calibration
+    assert calibration is not None
+    assert calibration.sample_pages == [1, 4]
+    assert calibration.met_target
+    assert (calibration.chosen.ocr_dpi, calibration.chosen.ocr_preprocess_threshold) == (200, True)
+    assert len(calibration.candidates) == 9
+    assert all(page.ocr_dpi == 200 for page in result.pages)
+
+    metadata = json.loads(result.metadata_path.read_text(encoding="utf-8"))
+    assert metadata["calibration"]["chosen"]["ocr_dpi"] == 200
+    assert metadata["calibration"]["seconds"] > 0
+
+
+def test_calibration_falls_back_to_most_confident_config(tmp_path: Path) -> None:
+    pdf_path = _make_scan_pdf(tmp_path / "scan.pdf", pages=2)
+    settings = AppSettings(
+        ocr_backend="stub",
+        ocr_dpi=250,
+        ocr_preprocess_threshold=True,
+        ocr_calibrate=True,
+        ocr_calibration_target=99.0,
+    )
+    converter = Converter(ocr_backend_factory=lambda _: _ThresholdLovingBackend(good_dpi=250))
+
+    calibration = converter.calibrate(pdf_path, settings)
+
+    # The configured DPI joins the grid as an extra candidate.
+    assert len(calibration.candidates) == 10
+    assert not calibration.met_target
+    assert calibration.chosen == CalibrationCandidate(
+        ocr_dpi=250,
+        ocr_preprocess_grayscale=True,
+        ocr_preprocess_autocontrast=True,
+        ocr_preprocess_threshold=True,
+        confidence=95.0,
+        seconds=calibration.chosen.seconds,
+    )
+
+
+def test_sharded_jobs_calibrate_once_at_publish(tmp_path: Path, monkeypatch) -> None:
+    pdf_path = _make_scan_pdf(tmp_path / "scan.pdf")
+    monkeypatch.setattr(
+        "roop_pdfmd.core.converter.create_ocr_backend",
+        lambda _: _ThresholdLovingBackend(good_dpi=150),
+    )
+    settings = AppSettings(ocr_backend="stub", ocr_calibrate=True)
+
+    queue = ShardQueue(tmp_path / "queue")
+    job = queue.publish(pdf_path, tmp_path / "out", settings, shard_pages=2)
+    assert not job.settings.ocr_calibrate
+    assert job.settings.ocr_dpi == 150
+    run_shard_worker(queue.root)
+
+    result = queue.merge(job.job_id)
+    assert result.calibration.chosen.ocr_dpi == 150
+    assert all(page.ocr_dpi == 150 for page in result.pages)
+
+
+def test_text_layer_documents_skip_calibration(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "text.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_textbox(fitz.Rect(72, 72, 540, 720), " ".join(f"word{idx}" for idx in range(80)))
+    doc.save(pdf_path)
+    doc.close()
+
+    result = Converter().convert(
+        pdf_path, tmp_path / "out", AppSettings(ocr_backend="stub", ocr_calibrate=True)
+    )
+
+    assert result.calibration.sample_pages == []
+    assert result.calibration.chosen is None
+
+
+def test_tsv_confidence_is_weighted_by_word_length() -> None:
+    tsv = "\n".join(
+        [
+            "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\t"
+            "left\ttop\twidth\theight\tconf\ttext",
+            "1\t1\t0\t0\t0\t0\t0\t0\t100\t100\t-1\t",
+            "5\t1\t1\t1\t1\t1\t0\t0\t10\t10\t90\tabcd",
+            "5\t1\t1\t1\t1\t2\t0\t0\t10\t10\t60\tab",
+            "5\t1\t1\t1\t1\t3\t0\t0\t10\t10\t95\t ",
+        ]
+    )
+    assert mean_tsv_confidence(tsv) == 80.0
+    assert mean_tsv_confidence("") == 0.0
@@ -1,10 +1,14 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import fitz
 import pytest
 
 from roop_pdfmd.core.converter import ConversionError, Converter
-from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.core.models import AppSettings, PageMode
+from roop_pdfmd.core.ocr_backends import StubOcrBackend
 
 
 def _make_text_pdf(path: Path) -> None:
@@ -75,3 +79,152 @@ def test_converter_page_callback_streams_per_page_chunks(tmp_path: Path) -> None
     assert "--- Page 1 ---" in chunks[0]
     assert "--- Page 2 ---" not in chunks[0]
     assert "--- Page 2 ---" in chunks[1]
+
+
+def test_iter_pages_accepts_in_memory_pdf_and_writes_nothing(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "two_pages.pdf"
+    _make_two_page_text_pdf(pdf_path)
+    data = pdf_path.read_bytes()
+
+    from_bytes = list(Converter().iter_pages(data, AppSettings()))
+    with pdf_path.open("rb") as handle:
+        from_file = list(Converter().iter_pages(handle, AppSettings()))
+
+    assert [output.result.page_number for output in from_bytes] == [1, 2]
+    assert "Second page text layer content." in from_bytes[1].text
+    assert from_bytes[0].markdown_block.startswith("--- Page 1 ---")
+    assert [output.text for output in from_file] == [output.text for output in from_bytes]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["two_pages.pdf"]
+
+
+def test_iter_pages_is_lazy(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "two_pages.pdf"
+    _make_two_page_text_pdf(pdf_path)
+
+    pages = Converter().iter_pages(pdf_path.read_bytes(), AppSettings())
+    first = next(pages)
+    pages.close()
+
+    assert first.result.page_number == 1
+
+
+def test_iter_pages_rejects_empty_input() -> None:
+    with pytest.raises(ConversionError):
+        Converter().iter_pages(b"", AppSettings())
+
+
+def test_converter_dehyphenates_words_split_across_pages(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "split.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "The first page ends in the middle of an experi-")
+    doc.new_page().insert_text((72, 72), "ment that continues on the second page.")
+    doc.save(pdf_path)
+    doc.close()
+
+    pages = list(Converter().iter_pages(pdf_path, AppSettings(dehyphenate=True)))
+
+    assert pages[0].result.mode == PageMode.EXTRACT
+    assert pages[0].text.rstrip().endswith("an experiment")
+    assert pages[1].text.startswith("that continues")
+    assert [page.result.page_number for page in pages] == [1, 2]
+
+
+def _make_mixed_pdf(path: Path, seed: int) -> Path:
+    doc = fitz.open()
+    for idx in range(2 + seed % 4):
+        page = doc.new_page()
+        if (idx + seed) % 3:
+            page.insert_text((72, 72), f"Document {seed} page {idx} has a hyphen-")
+            page.insert_text((72, 90), f"ated line and some text {seed * idx}.")
+        elif idx % 2:
+            page.draw_rect(fitz.Rect(72, 72, 72 + 20 * seed, 300), fill=(0.2, 0.2, 0.2))
+    doc.save(path)
+    doc.close()
+    return path
+
+
+class _NamedStubBackend(StubOcrBackend):
+    """Tags its text with the engine name and yields the GIL, so mixed-up runs show."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def image_to_string(
+        self, image, tesseract_cmd, lang="eng", cancel_event=None, env=None, psm=None
+    ):
+        time.sleep(0.002)
+        return f"{self.name}: " + super().image_to_string(image, tesseract_cmd, lang)
+
+
+def _outputs(result) -> tuple[bytes, bytes, list[tuple]]:
+    pages = [
+        (page.page_number, page.mode, page.text_length, page.ocr_dpi, page.ocr_batch_size)
+        for page in result.pages
+    ]
+    return result.markdown_path.read_bytes(), result.text_path.read_bytes(), pages
+
+
+def test_shared_converter_matches_sequential_runs_under_concurrency(tmp_path: Path) -> None:
+    jobs = []
+    for idx in range(24):
+        settings = AppSettings(
+            ocr_backend=f"engine-{idx % 4}",
+            ocr_dpi=72 + 24 * (idx % 3),
+            ocr_batch_size=1 + idx % 3,
+            dehyphenate=bool(idx % 2),
+            ocr_preprocess_threshold=bool(idx % 5 == 0),
+        )
+        jobs.append((_make_mixed_pdf(tmp_path / f"doc{idx}.pdf", idx), settings))
+
+    sequential = [
+        _outputs(
+            Converter(ocr_backend_factory=_NamedStubBackend).convert(
+                pdf, tmp_path / "seq" / pdf.stem, settings
+            )
+        )
+        for pdf, settings in jobs
+    ]
+
+    converter = Converter(ocr_backend_factory=_NamedStubBackend)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [
+            pool.submit(converter.convert, pdf, tmp_path / "par" / pdf.stem, settings)
+            for pdf, settings in jobs
+        ]
+        concurrent = [_outputs(future.result()) for future in futures]
+
+    assert concurrent == sequential
+
+
+def test_cancel_event_stops_only_its_own_conversion(tmp_path: Path) -> None:
+    converter = Converter()
+    settings = AppSettings(ocr_backend="stub", ocr_dpi=72)
+    cancelled_pdf = _make_mixed_pdf(tmp_path / "cancelled.pdf", 3)
+    finished_pdf = _make_mixed_pdf(tmp_path / "finished.pdf", 3)
+    cancel_event = threading.Event()
+
+    def cancel_after_first_page(*_args) -> None:
+        cancel_event.set()
+
+    def wait_for_cancel(*_args) -> None:
+        # Keeps the other conversion running while the first one is cancelled.
+        assert cancel_event.wait(timeout=10)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        cancelled = pool.submit(
+            converter.convert,
+            cancelled_pdf,
+            tmp_path / "a",
+            settings,
+            page_callback=cancel_after_first_page,
+            cancel_event=cancel_event,
+        )
+        finished = pool.submit(
+            converter.convert, finished_pdf, tmp_path / "b", settings, page_callback=wait_for_cancel
+        )
+        cancelled_result, finished_result = cancelled.result(), finished.result()
+
+    assert cancelled_result.cancelled and cancelled_result.processed_pages == 1
+    assert not finished_result.cancelled
+    assert finished_result.processed_pages == finished_result.total_pages
+    assert not converter.is_cancelled()
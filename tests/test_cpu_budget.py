@@ -0,0 +1,76 @@
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.cpu_budget import CpuBudget
+from roop_pdfmd.core.models import AppSettings, OcrThreadPolicy
+
+
+def test_throughput_policy_uses_one_thread_per_invocation() -> None:
+    budget = CpuBudget(cpu_count=8)
+
+    with budget.lease(OcrThreadPolicy.THROUGHPUT) as threads:
+        assert threads == 1
+
+
+def test_latency_policy_splits_cpus_between_active_leases() -> None:
+    budget = CpuBudget(cpu_count=8)
+
+    with budget.lease(OcrThreadPolicy.LATENCY) as first:
+        assert first == 8
+        with budget.lease("latency") as second:
+            # The first invocation still runs 8 threads; only the minimum is left.
+            assert budget.active == 2
+            assert second == 1
+            assert budget.leased == 9
+    assert budget.active == 0
+    assert budget.leased == 0
+    assert budget.threads_for(OcrThreadPolicy.LATENCY, 2) == 4
+    assert budget.threads_for(OcrThreadPolicy.LATENCY, 2, leased=6) == 2
+    assert budget.threads_for(OcrThreadPolicy.LATENCY, 16) == 1
+
+
+@pytest.mark.parametrize("count", [2, 4, 8, 12])
+def test_concurrent_latency_leases_fit_the_unleased_cpus(count: int) -> None:
+    budget = CpuBudget(cpu_count=8)
+
+    with ExitStack() as stack:
+        leases = [
+            stack.enter_context(budget.lease(OcrThreadPolicy.LATENCY)) for _ in range(count)
+        ]
+        # Splitting by active leases alone gave 8 + 4 + 2 + 2 = 16 threads for 4.
+        assert sum(leases) == 8 + count - 1
+        assert budget.leased == sum(leases)
+    assert budget.leased == 0
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="uses a POSIX script as Tesseract")
+def test_converter_passes_thread_limit_to_tesseract(tmp_path: Path) -> None:
+    fake = tmp_path / "tesseract"
+    fake.write_text(
+        f"#!{sys.executable}\n"
+        "import os, sys\n"
+        "if '--version' in sys.argv:\n"
+        "    print('tesseract 5.3.0')\n"
+        "    sys.exit(0)\n"
+        "with open(sys.argv[2] + '.txt', 'w') as out:\n"
+        "    out.write('threads=' + os.environ.get('OMP_THREAD_LIMIT', '-'))\n",
+        encoding="utf-8",
+    )
+    fake.chmod(0o755)
+    pdf_path = tmp_path / "blank.pdf"
+    doc = fitz.open()
+    doc.new_page()
+    doc.save(pdf_path)
+    doc.close()
+
+    converter = Converter(cpu_budget=CpuBudget(cpu_count=6))
+    settings = AppSettings(tesseract_path=str(fake), ocr_thread_policy=OcrThreadPolicy.LATENCY)
+    result = converter.convert(pdf_path, tmp_path / "out", settings)
+
+    assert result.pages[0].ocr_threads == 6
+    assert "threads=6" in result.markdown_path.read_text(encoding="utf-8")
@@ -0,0 +1,72 @@
+import fitz
+import pytest
+
+from roop_pdfmd.core.embedded_scan import extract_embedded_scan
+from roop_pdfmd.core.image_index import DocumentImageIndex
+
+
+def _marked_scan_png(width: int, height: int) -> bytes:
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, width, height), False)
+    pix.set_rect(pix.irect, (0, 0, 0))
+    pix.set_rect(fitz.IRect(0, 0, width // 4, height // 4), (255, 255, 255))
+    return pix.tobytes("png")
+
+
+def _scan_doc(rotation: int = 0, image_px: tuple[int, int] = (800, 400)) -> fitz.Document:
+    doc = fitz.open()
+    page = doc.new_page(width=200, height=100)
+    page.insert_image(page.rect, stream=_marked_scan_png(*image_px))
+    page.set_rotation(rotation)
+    return doc
+
+
+def _white_corners(pixel, width: int, height: int) -> list[str]:
+    corners = {
+        "tl": (2, 2),
+        "tr": (width - 3, 2),
+        "bl": (2, height - 3),
+        "br": (width - 3, height - 3),
+    }
+    return [name for name, xy in corners.items() if pixel(xy) > 128]
+
+
+@pytest.mark.parametrize("rotation", [0, 90, 180, 270])
+def test_embedded_scan_is_upright_at_native_resolution(rotation: int) -> None:
+    doc = _scan_doc(rotation)
+    page = doc[0]
+
+    image = extract_embedded_scan(page, DocumentImageIndex(doc))
+
+    assert image is not None
+    assert sorted(image.size) == [400, 800]
+    rendered = page.get_pixmap()
+    gray = image.convert("L")
+    assert _white_corners(gray.getpixel, *gray.size) == _white_corners(
+        lambda xy: rendered.pixel(*xy)[0], rendered.width, rendered.height
+    )
+    assert (image.width > image.height) == (rendered.width > rendered.height)
+    doc.close()
+
+
+def test_embedded_scan_falls_back_for_visible_text_overlay() -> None:
+    doc = _scan_doc()
+    doc[0].insert_text((20, 50), "Stamped overlay")
+
+    assert extract_embedded_scan(doc[0], DocumentImageIndex(doc)) is None
+    doc.close()
+
+
+def test_embedded_scan_falls_back_for_low_resolution_image() -> None:
+    doc = _scan_doc(image_px=(200, 100))
+
+    assert extract_embedded_scan(doc[0], DocumentImageIndex(doc)) is None
+    doc.close()
+
+
+def test_embedded_scan_falls_back_for_partial_coverage() -> None:
+    doc = fitz.open()
+    page = doc.new_page(width=200, height=100)
+    page.insert_image(fitz.Rect(0, 0, 100, 100), stream=_marked_scan_png(800, 800))
+
+    assert extract_embedded_scan(page, DocumentImageIndex(doc)) is None
+    doc.close()
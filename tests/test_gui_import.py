@@ -2,3 +2,35 @@ def test_import_main_window() -> None:
     from roop_pdfmd.gui.main_window import MainWindow
 
     assert MainWindow is not None
+
+
+def test_dashboard_renders_snapshot(monkeypatch) -> None:
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    from roop_pdfmd.core.models import PageMode
+    from roop_pdfmd.core.throughput import SlowPage, ThroughputSnapshot
+    from roop_pdfmd.gui.dashboard import ThroughputDashboard
+
+    app = QApplication.instance() or QApplication([])
+    dashboard = ThroughputDashboard()
+    dashboard.update_snapshot(
+        ThroughputSnapshot(
+            total_pages=5000,
+            pages_done=100,
+            ocr_pages=60,
+            extract_pages=40,
+            error_pages=0,
+            elapsed_seconds=120.0,
+            pages_per_second=0.83,
+            recent_pages_per_second=0.5,
+            remaining_seconds=9800.0,
+            stage_seconds={"classify": 10.0, "render": 20.0, "ocr": 70.0},
+            slowest_pages=[SlowPage(page_number=42, seconds=9.5, mode=PageMode.OCR)],
+        )
+    )
+
+    assert dashboard.projected_value.text().startswith("2:45:20")
+    assert dashboard.stage_bars["ocr"].value() == 70
+    assert "p42 9.5s OCR" in dashboard.slowest_value.text()
+    assert app is not None
@@ -0,0 +1,78 @@
+import os
+from pathlib import Path
+
+import fitz
+
+from roop_pdfmd.core.models import AppSettings, ConversionResult
+
+
+def _make_pdf(path: Path, pages: int = 3) -> Path:
+    doc = fitz.open()
+    for idx in range(pages):
+        doc.new_page().insert_text((72, 72), f"Worker page {idx + 1} has a text layer.")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _exit_abruptly(*_args) -> None:
+    os._exit(3)
+
+
+def _collect(worker) -> dict[str, list]:
+    events: dict[str, list] = {"progress": [], "preview": [], "finished": [], "failed": []}
+    worker.progress.connect(lambda *args: events["progress"].append(args))
+    worker.preview_chunk.connect(lambda *args: events["preview"].append(args))
+    worker.finished.connect(events["finished"].append)
+    worker.failed.connect(events["failed"].append)
+    return events
+
+
+def test_worker_streams_child_process_events(tmp_path: Path) -> None:
+    from roop_pdfmd.gui.worker import ConversionWorker
+
+    pdf_path = _make_pdf(tmp_path / "doc.pdf")
+    worker = ConversionWorker(str(pdf_path), str(tmp_path / "out"), AppSettings(ocr_backend="stub"))
+    events = _collect(worker)
+
+    worker.run()
+
+    assert not events["failed"]
+    assert [args[:3] for args in events["progress"]] == [
+        (1, 3, "EXTRACT"),
+        (2, 3, "EXTRACT"),
+        (3, 3, "EXTRACT"),
+    ]
+    assert "Worker page 2" in events["preview"][1][0]
+    (result,) = events["finished"]
+    assert isinstance(result, ConversionResult)
+    assert result.markdown_path.is_file()
+
+
+def test_worker_reports_a_crashed_child(tmp_path: Path, monkeypatch) -> None:
+    import roop_pdfmd.gui.worker as worker_module
+
+    monkeypatch.setattr(worker_module, "run_conversion", _exit_abruptly)
+    pdf_path = _make_pdf(tmp_path / "doc.pdf")
+    worker = worker_module.ConversionWorker(str(pdf_path), str(tmp_path / "out"), AppSettings())
+    events = _collect(worker)
+
+    worker.run()
+
+    assert not events["finished"]
+    assert events["failed"] == ["Conversion process exited unexpectedly (exit code 3)."]
+
+
+def test_cancel_during_start_up_reaches_the_child(tmp_path: Path) -> None:
+    from roop_pdfmd.gui.worker import ConversionWorker
+
+    pdf_path = _make_pdf(tmp_path / "doc.pdf", pages=300)
+    worker = ConversionWorker(str(pdf_path), str(tmp_path / "out"), AppSettings(ocr_backend="stub"))
+    events = _collect(worker)
+
+    worker.cancel()
+    worker.run()
+
+    (result,) = events["finished"]
+    assert result.cancelled
+    assert result.processed_pages < 300
@@ -0,0 +1,188 @@
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.__main__ import main
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.history import (
+    CostModel,
+    DocumentFeatures,
+    HistoryPage,
+    HistoryRun,
+    RunHistory,
+    fit_cost_model,
+    shortest_first,
+)
+from roop_pdfmd.core.models import AppSettings, PageMode
+from roop_pdfmd.core.sharding import ShardQueue, run_shard_worker
+
+
+def _make_pdf(path: Path, text_pages: int, scan_pages: int = 0) -> Path:
+    doc = fitz.open()
+    for idx in range(text_pages):
+        page = doc.new_page()
+        page.insert_textbox(
+            fitz.Rect(72, 72, 540, 720), " ".join(f"history{idx} word{n}" for n in range(60))
+        )
+    for _ in range(scan_pages):
+        page = doc.new_page()
+        page.draw_rect(fitz.Rect(72, 72, 300, 300), color=(0, 0, 0), fill=(0.5, 0.5, 0.5))
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _run(name: str, finished_at: float, pages: list[HistoryPage], factor: float = 1.0):
+    return HistoryRun(
+        metadata_path=name,
+        input_pdf=name,
+        finished_at=finished_at,
+        duration_seconds=factor * sum(page.seconds for page in pages),
+        total_pages=len(pages),
+        processed_pages=len(pages),
+        ocr_pages=sum(page.mode == PageMode.OCR for page in pages),
+        pages=pages,
+    )
+
+
+def test_cost_model_fits_page_costs_and_wall_factor() -> None:
+    letter = 93.5
+    pages = [HistoryPage(PageMode.EXTRACT, 0.1, letter, 0) for _ in range(4)]
+    for dpi in (150, 200, 300):
+        megapixels = letter * dpi * dpi / 1e6
+        pages.append(HistoryPage(PageMode.OCR, 0.5 + 0.2 * megapixels, letter, dpi))
+    pages.append(HistoryPage(PageMode.OCR, 60.0, letter, 300, error=True))
+
+    model = fit_cost_model([_run("a", 1.0, pages[:5], factor=0.5), _run("b", 2.0, pages[5:])])
+
+    assert model.extract_seconds_per_page == pytest.approx(0.1)
+    assert model.ocr_base_seconds == pytest.approx(0.5)
+    assert model.ocr_seconds_per_megapixel == pytest.approx(0.2)
+    features = DocumentFeatures(pages=10, ocr_ratio=0.5, page_area_sq_in=letter, ocr_dpi=300)
+    per_ocr_page = 0.5 + 0.2 * features.ocr_megapixels
+    assert model.predict(features) == pytest.approx(
+        model.wall_factor * (5 * 0.1 + 5 * per_ocr_page)
+    )
+    assert 0.5 < model.wall_factor < 1.0
+
+
+def test_assembled_runs_add_pages_but_not_wall_time() -> None:
+    pages = [HistoryPage(PageMode.EXTRACT, 0.1, 93.5, 0) for _ in range(4)]
+    single = _run("single", 1.0, pages[:2], factor=0.5)
+    # A merge of shards converted elsewhere takes next to no time itself.
+    merged = replace(_run("merged", 2.0, pages[2:], factor=0.01), assembled=True)
+
+    model = fit_cost_model([single, merged])
+
+    assert model.extract_pages == 4
+    assert model.wall_factor == pytest.approx(0.5)
+
+
+def test_stored_model_and_backtest_match_refitting_from_runs(tmp_path: Path) -> None:
+    pages = [HistoryPage(PageMode.EXTRACT, 0.05 * n, 93.5, 0) for n in range(1, 4)]
+    for dpi in (150, 200, 300):
+        megapixels = 93.5 * dpi * dpi / 1e6
+        pages.append(HistoryPage(PageMode.OCR, 0.4 + 0.3 * megapixels, 93.5, dpi))
+    pages.append(HistoryPage(PageMode.OCR, 30.0, 93.5, 300, error=True))
+    runs = [
+        _run("a", 1.0, pages[:2], factor=0.8),
+        _run("b", 2.0, pages[2:4], factor=1.5),
+        replace(_run("c", 3.0, pages[4:6], factor=0.1), assembled=True),
+        replace(_run("d", 4.0, pages[:3], factor=9.0), cancelled=True),
+        _run("e", 5.0, pages[5:], factor=0.6),
+    ]
+
+    with RunHistory(tmp_path / "history.sqlite3") as history:
+        for run in runs:
+            history.add(run)
+        stored = history.model()
+        report = history.accuracy()
+
+    expected = fit_cost_model(runs)
+    assert (stored.runs, stored.extract_pages, stored.ocr_pages) == (5, 6, 4)
+    for name in ("extract_seconds_per_page", "ocr_base_seconds", "ocr_seconds_per_megapixel"):
+        assert getattr(stored, name) == pytest.approx(getattr(expected, name))
+    assert stored.wall_factor == pytest.approx(expected.wall_factor)
+    assert expected.ocr_seconds_per_megapixel > 0
+    usable = [run for run in runs if not run.cancelled]
+    assert [item.predicted_seconds for item in report.backtest] == pytest.approx(
+        [fit_cost_model(usable[:idx]).predict(usable[idx].features()) for idx in (1, 3)]
+    )
+
+
+def test_sharded_merge_is_recorded_as_assembled(tmp_path: Path) -> None:
+    history_path = tmp_path / "history.sqlite3"
+    pdf_path = _make_pdf(tmp_path / "mixed.pdf", text_pages=4)
+    settings = AppSettings(ocr_backend="stub", history_path=str(history_path))
+    Converter().convert(pdf_path, tmp_path / "single", settings)
+
+    queue = ShardQueue(tmp_path / "queue")
+    job = queue.publish(pdf_path, tmp_path / "sharded", settings, shard_pages=2)
+    run_shard_worker(queue.root)
+    result = queue.merge(job.job_id)
+
+    assert result.assembled
+    assert json.loads(result.metadata_path.read_text(encoding="utf-8"))["assembled"] is True
+    with RunHistory(history_path) as history:
+        runs = history.runs()
+        report = history.accuracy()
+    assert [run.assembled for run in runs] == [False, True]
+    assert report.model.extract_pages == 8
+    assert report.backtest == []
+
+
+def test_conversions_record_history_and_use_it_for_estimates(tmp_path: Path) -> None:
+    history_path = tmp_path / "history.sqlite3"
+    pdf_path = _make_pdf(tmp_path / "mixed.pdf", text_pages=2, scan_pages=2)
+    settings = AppSettings(ocr_backend="stub", ocr_dpi=100, history_path=str(history_path))
+    converter = Converter()
+
+    first = converter.convert(pdf_path, tmp_path / "first", settings)
+    assert first.predicted_seconds == 0.0
+    assert all(page.page_area_sq_in == 96.64 for page in first.pages)
+
+    expected = converter.estimate(pdf_path, settings, history_path)
+    second = converter.convert(pdf_path, tmp_path / "second", settings)
+    assert second.predicted_seconds == pytest.approx(expected)
+    metadata = json.loads(second.metadata_path.read_text(encoding="utf-8"))
+    assert metadata["predicted_seconds"] == second.predicted_seconds
+
+    with RunHistory(history_path) as history:
+        runs = history.runs()
+        report = history.accuracy()
+    assert [run.ocr_pages for run in runs] == [2, 2]
+    assert len(report.backtest) == 1
+    assert len(report.estimates) == 1
+
+
+def test_shortest_first_orders_by_expected_time(tmp_path: Path) -> None:
+    scans = _make_pdf(tmp_path / "scans.pdf", text_pages=0, scan_pages=3)
+    text = _make_pdf(tmp_path / "text.pdf", text_pages=5)
+    missing = tmp_path / "missing.pdf"
+
+    ordered = shortest_first([missing, scans, text], AppSettings(), CostModel())
+
+    assert [path for path, _ in ordered] == [text, scans, missing]
+    assert ordered[0][1] < ordered[1][1] < ordered[2][1]
+
+
+def test_history_cli_round_trip(tmp_path: Path, monkeypatch, capsys) -> None:
+    pdf_path = _make_pdf(tmp_path / "doc.pdf", text_pages=2)
+    Converter().convert(pdf_path, tmp_path / "out" / "a", AppSettings(ocr_backend="stub"))
+    Converter().convert(pdf_path, tmp_path / "out" / "b", AppSettings(ocr_backend="stub"))
+    history_path = str(tmp_path / "history.sqlite3")
+
+    def run(*args: str) -> int:
+        monkeypatch.setattr(sys, "argv", ["roop-pdfmd", "history", *args])
+        return main()
+
+    assert run("ingest", history_path, str(tmp_path / "out")) == 0
+    assert "Recorded 2 run(s)" in capsys.readouterr().out
+    assert run("accuracy", history_path) == 0
+    assert "Back-test (each run predicted from earlier runs): 1 run(s)" in capsys.readouterr().out
+    assert run("estimate", history_path, str(pdf_path)) == 0
+    assert str(pdf_path) in capsys.readouterr().out
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import fitz
+
+from roop_pdfmd.core.image_index import DocumentImageIndex
+from roop_pdfmd.core.text_quality import detect_page_text_quality
+
+
+def _png_bytes(color: tuple[int, int, int], size: int = 16) -> bytes:
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, size, size), False)
+    pix.set_rect(pix.irect, color)
+    return pix.tobytes("png")
+
+
+def _make_image_pdf(path: Path) -> None:
+    logo = _png_bytes((200, 10, 10))
+    scan = _png_bytes((20, 20, 20), size=32)
+
+    doc = fitz.open()
+    for idx in range(3):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {idx + 1} caption text")
+        page.insert_image(fitz.Rect(10, 10, 60, 60), stream=logo)
+        if idx == 1:
+            page.insert_image(fitz.Rect(100, 100, 500, 700), stream=scan)
+            page.insert_image(fitz.Rect(300, 10, 350, 60), stream=logo)
+    doc.new_page()
+    doc.save(path)
+    doc.close()
+
+
+def _reference_ratio(page: fitz.Page) -> float:
+    page_area = max(float(page.rect.width * page.rect.height), 1.0)
+    total_area = 0.0
+    for image_info in page.get_images(full=True):
+        for rect in page.get_image_rects(image_info[0]):
+            total_area += max(float(rect.width * rect.height), 0.0)
+    return min(total_area / page_area, 1.0)
+
+
+def test_image_index_matches_get_image_rects(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "images.pdf"
+    _make_image_pdf(pdf_path)
+
+    with fitz.open(pdf_path) as doc:
+        index = DocumentImageIndex(doc).build()
+        for page in doc:
+            assert index.image_area_ratio(page) == _reference_ratio(page)
+
+        assert len({placement.xref for placement in index.placements(doc[1])}) == 2
+        assert index.placements(doc[3]) == []
+
+
+def test_detect_page_text_quality_is_unchanged_with_index(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "images.pdf"
+    _make_image_pdf(pdf_path)
+
+    with fitz.open(pdf_path) as doc:
+        index = DocumentImageIndex(doc)
+        for page in doc:
+            assert detect_page_text_quality(page, index) == detect_page_text_quality(page)
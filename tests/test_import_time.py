@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import roop_pdfmd
+
+# Loose ceiling for slow CI machines; the heavy-module check is the precise guard.
+_IMPORT_BUDGET_SECONDS = 0.5
+_HEAVY_MODULES = ("fitz", "pymupdf", "pytesseract", "PIL", "PySide6")
+
+
+def _import_profile(statement: str) -> dict[str, int]:
+    """Run ``statement`` in a fresh interpreter; map module name -> cumulative µs."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(roop_pdfmd.__file__).parents[1])},
+    )
+    profile: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def _heavy(profile: dict[str, int]) -> list[str]:
+    return sorted(name for name in profile if name.split(".")[0] in _HEAVY_MODULES)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import roop_pdfmd.core",
+        "from roop_pdfmd.core import AppSettings, PageMode",
+        "import roop_pdfmd.__main__",
+        "import roop_pdfmd.core.ocr_backends",
+    ],
+)
+def test_light_imports_do_not_load_heavy_stacks(statement: str) -> None:
+    assert _heavy(_import_profile(statement)) == []
+
+
+def test_core_import_fits_budget() -> None:
+    profile = _import_profile("import roop_pdfmd.core")
+
+    assert profile["roop_pdfmd.core"] / 1_000_000 < _IMPORT_BUDGET_SECONDS
+
+
+def test_converter_is_loaded_on_first_access() -> None:
+    import roop_pdfmd.core as core
+    from roop_pdfmd.core.converter import Converter
+
+    assert core.Converter is Converter
+    assert "Converter" in dir(core)
+    with pytest.raises(AttributeError):
+        core.NotAThing  # noqa: B018
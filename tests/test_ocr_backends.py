@@ -0,0 +1,292 @@
+import json
+import os
+import sys
+import threading
+import time
+import types
+from dataclasses import replace
+from pathlib import Path
+
+import fitz
+import pytest
+from PIL import Image
+
+from roop_pdfmd.core.converter import ConversionError, Converter
+from roop_pdfmd.core.models import AppSettings, PageMode
+from roop_pdfmd.core.ocr_backends import (
+    DEFAULT_OCR_BACKEND,
+    available_ocr_backends,
+    create_ocr_backend,
+)
+from roop_pdfmd.core.session import ConverterSession
+from roop_pdfmd.core.tesseract import OcrCancelledError
+
+
+def _make_blank_pdf(path: Path, pages: int = 2) -> None:
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page()
+    doc.save(path)
+    doc.close()
+
+
+def _make_echo_tesseract(path: Path) -> Path:
+    # Reports the size of the PNM image it was piped on stdin.
+    path.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "if '--version' in sys.argv:\n"
+        "    print('tesseract 5.3.0')\n"
+        "    sys.exit(0)\n"
+        "assert sys.argv[1:3] == ['stdin', 'stdout'], sys.argv\n"
+        "header = sys.stdin.buffer.read().split(maxsplit=3)\n"
+        "print('piped', header[0].decode(), header[1].decode(), header[2].decode())\n",
+        encoding="utf-8",
+    )
+    path.chmod(0o755)
+    return path
+
+
+def test_stub_backend_is_deterministic() -> None:
+    backend = create_ocr_backend("stub")
+    image = Image.new("L", (40, 20), color=255)
+
+    first = backend.image_to_string(image, "")
+    assert first == backend.image_to_string(image.copy(), "")
+    assert first.startswith("stub ocr 40x20 L ")
+    assert not backend.requires_tesseract_binary
+
+
+def test_default_backends_are_available() -> None:
+    names = available_ocr_backends()
+
+    assert DEFAULT_OCR_BACKEND == "pytesseract"
+    assert {"pytesseract", "tesseract-pipe"} <= set(names)
+    assert "stub" not in names
+    assert "stub" in available_ocr_backends(include_internal=True)
+
+
+def test_stored_stub_backend_falls_back_to_default() -> None:
+    pytest.importorskip("PySide6")
+    from roop_pdfmd.gui.settings_store import _as_ocr_backend
+
+    assert _as_ocr_backend("stub") == DEFAULT_OCR_BACKEND
+    assert _as_ocr_backend("nope") == DEFAULT_OCR_BACKEND
+    assert _as_ocr_backend("tesseract-pipe") == "tesseract-pipe"
+
+
+def test_unknown_backend_is_rejected(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "blank.pdf"
+    _make_blank_pdf(pdf_path)
+
+    with pytest.raises(ValueError):
+        create_ocr_backend("nope")
+    with pytest.raises(ConversionError, match="nope"):
+        Converter().convert(pdf_path, tmp_path / "out", AppSettings(ocr_backend="nope"))
+
+
+def test_converter_ocr_with_stub_backend_needs_no_tesseract(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "blank.pdf"
+    _make_blank_pdf(pdf_path)
+    settings = AppSettings(ocr_backend="stub", tesseract_path=str(tmp_path / "missing"))
+
+    result = Converter().convert(pdf_path, tmp_path / "out", settings)
+
+    assert result.ocr_pages == 2
+    assert result.errors == []
+    assert result.ocr_backend == "stub"
+    assert "stub ocr" in result.markdown_path.read_text(encoding="utf-8")
+    metadata = json.loads(result.metadata_path.read_text(encoding="utf-8"))
+    assert metadata["ocr_backend"] == "stub"
+    assert {page["mode"] for page in metadata["pages"]} == {PageMode.OCR.value}
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX shebang script")
+class _FakeTessApi:
+    created: list["_FakeTessApi"] = []
+
+    def __init__(self, lang: str) -> None:
+        self.lang = lang
+        self.ended = False
+        self.on_recognize = lambda: None
+        _FakeTessApi.created.append(self)
+
+    def SetPageSegMode(self, psm: int) -> None:
+        pass
+
+    def SetImage(self, image) -> None:
+        self.image = image
+
+    def GetUTF8Text(self) -> str:
+        self.on_recognize()
+        return f"text {self.image.width}x{self.image.height}"
+
+    def End(self) -> None:
+        self.ended = True
+
+
+@pytest.fixture
+def fake_tesserocr(monkeypatch) -> type[_FakeTessApi]:
+    _FakeTessApi.created = []
+    module = types.SimpleNamespace(PyTessBaseAPI=_FakeTessApi)
+    monkeypatch.setitem(sys.modules, "tesserocr", module)
+    # Set first so the value the backend sets is undone afterwards.
+    monkeypatch.setenv("OMP_THREAD_LIMIT", "")
+    monkeypatch.delenv("OMP_THREAD_LIMIT")
+    return _FakeTessApi
+
+
+def test_tesserocr_checks_cancellation_around_recognition(fake_tesserocr) -> None:
+    backend = create_ocr_backend("tesserocr")
+    image = Image.new("L", (8, 4), 255)
+    cancel_event = threading.Event()
+
+    assert os.environ["OMP_THREAD_LIMIT"] == "1"
+    assert backend.image_to_string(image, "", cancel_event=cancel_event) == "text 8x4"
+    (api,) = fake_tesserocr.created
+    api.on_recognize = cancel_event.set
+    with pytest.raises(OcrCancelledError):
+        backend.image_to_string(image, "", cancel_event=cancel_event)
+    with pytest.raises(OcrCancelledError):
+        backend.image_to_string(image, "", cancel_event=cancel_event)
+
+
+def test_session_close_ends_tesserocr_engines(fake_tesserocr) -> None:
+    session = ConverterSession()
+    backend = session._ocr_backend("tesserocr")
+    image = Image.new("L", (8, 4), 255)
+    worker = threading.Thread(target=backend.image_to_string, args=(image, ""))
+    worker.start()
+    worker.join()
+    backend.image_to_string(image, "")
+    backend.image_to_string(image, "", lang="deu")
+
+    session.close()
+
+    assert len(fake_tesserocr.created) == 3
+    assert all(api.ended for api in fake_tesserocr.created)
+
+
+def test_pipe_backend_streams_pnm_over_stdin(tmp_path: Path) -> None:
+    tesseract = _make_echo_tesseract(tmp_path / "tesseract")
+    backend = create_ocr_backend("tesseract-pipe")
+
+    text = backend.image_to_string(Image.new("L", (30, 10), color=255), str(tesseract))
+
+    assert text.split() == ["piped", "P5", "30", "10"]
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX shebang script")
+def test_cancelling_kills_an_in_flight_tesseract(tmp_path: Path) -> None:
+    tesseract = tmp_path / "tesseract"
+    tesseract.write_text(f"#!{sys.executable}\nimport time\ntime.sleep(60)\n", encoding="utf-8")
+    tesseract.chmod(0o755)
+    backend = create_ocr_backend("tesseract-pipe")
+    cancel_event = threading.Event()
+    timer = threading.Timer(0.2, cancel_event.set)
+    timer.start()
+
+    started = time.monotonic()
+    with pytest.raises(OcrCancelledError):
+        backend.image_to_string(
+            Image.new("L", (30, 10), 255), str(tesseract), cancel_event=cancel_event
+        )
+
+    assert time.monotonic() - started < 10
+
+
+def _make_batch_tesseract(path: Path, calls_log: Path) -> Path:
+    # Fake CLI: accepts a single image or a list file; fails on images under 100px wide.
+    path.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "from PIL import Image\n"
+        "if '--version' in sys.argv:\n"
+        "    print('tesseract 5.3.0')\n"
+        "    sys.exit(0)\n"
+        "source, output_base = sys.argv[1], sys.argv[2]\n"
+        "if source.endswith('.lst'):\n"
+        "    paths = [line.strip() for line in open(source) if line.strip()]\n"
+        "else:\n"
+        "    paths = [source]\n"
+        f"with open({str(calls_log)!r}, 'a') as log:\n"
+        "    log.write(f'{len(paths)}\\n')\n"
+        "pages = []\n"
+        "for image_path in paths:\n"
+        "    width, height = Image.open(image_path).size\n"
+        "    if width < 100:\n"
+        "        sys.stderr.write('Error: image too small\\n')\n"
+        "        sys.exit(1)\n"
+        "    pages.append(f'page {width}x{height}\\n\\f')\n"
+        "with open(output_base + '.txt', 'w') as out:\n"
+        "    out.write(''.join(pages))\n",
+        encoding="utf-8",
+    )
+    path.chmod(0o755)
+    return path
+
+
+def _make_sized_blank_pdf(path: Path, widths: list[int]) -> None:
+    doc = fitz.open()
+    for idx, width in enumerate(widths):
+        doc.new_page(width=width, height=100 + idx)
+    doc.save(path)
+    doc.close()
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX shebang script")
+def test_batched_ocr_matches_per_page_output(tmp_path: Path) -> None:
+    calls_log = tmp_path / "calls.log"
+    tesseract = _make_batch_tesseract(tmp_path / "tesseract", calls_log)
+    pdf_path = tmp_path / "scan.pdf"
+    _make_sized_blank_pdf(pdf_path, [200, 210, 220, 230])
+    base = AppSettings(tesseract_path=str(tesseract), ocr_dpi=72)
+
+    single = Converter().convert(pdf_path, tmp_path / "single", base)
+    single_calls = calls_log.read_text().split()
+    calls_log.unlink()
+    batched = Converter().convert(
+        pdf_path, tmp_path / "batched", replace(base, ocr_batch_size=3)
+    )
+
+    assert single_calls == ["1", "1", "1", "1"]
+    assert calls_log.read_text().split() == ["3", "1"]
+    markdown = batched.markdown_path.read_text(encoding="utf-8")
+    assert markdown == single.markdown_path.read_text(encoding="utf-8")
+    assert "page 230x103" in markdown
+    assert [page.ocr_batch_size for page in batched.pages] == [3, 3, 3, 1]
+    assert batched.errors == []
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX shebang script")
+def test_batched_ocr_failure_is_attributed_to_its_page(tmp_path: Path) -> None:
+    tesseract = _make_batch_tesseract(tmp_path / "tesseract", tmp_path / "calls.log")
+    pdf_path = tmp_path / "scan.pdf"
+    _make_sized_blank_pdf(pdf_path, [200, 50, 220])
+    settings = AppSettings(tesseract_path=str(tesseract), ocr_dpi=72, ocr_batch_size=8)
+
+    result = Converter().convert(pdf_path, tmp_path / "out", settings)
+
+    assert len(result.errors) == 1
+    assert result.errors[0].startswith("Page 2:")
+    assert [bool(page.error) for page in result.pages] == [False, True, False]
+    assert result.ocr_pages == 2
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX shebang script")
+def test_batch_is_split_at_memory_cap(tmp_path: Path) -> None:
+    calls_log = tmp_path / "calls.log"
+    tesseract = _make_batch_tesseract(tmp_path / "tesseract", calls_log)
+    pdf_path = tmp_path / "scan.pdf"
+    _make_sized_blank_pdf(pdf_path, [1000] * 4)
+    settings = AppSettings(
+        tesseract_path=str(tesseract),
+        ocr_dpi=600,
+        ocr_batch_size=8,
+        ocr_batch_max_megapixels=20,
+    )
+
+    Converter().convert(pdf_path, tmp_path / "out", settings)
+
+    # Each page renders to about 7 megapixels, so only two fit under the cap.
+    assert calls_log.read_text().split() == ["2", "2"]
@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.core.page_index import (
+    PageIndexError,
+    PageIndexReader,
+    join_page_blocks,
+    write_page_index,
+)
+
+
+def _make_text_pdf(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    for idx in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Text layer content for page number {idx + 1}, naïve café.")
+    doc.save(path)
+    doc.close()
+
+
+def test_join_page_blocks_spans_match_content() -> None:
+    blocks = ["--- Page 1 ---\nalpha\n", "--- Page 2 ---\nbéta\n", "--- Page 3 ---\n\f\n"]
+
+    content, spans = join_page_blocks(blocks)
+    data = content.encode("utf-8")
+
+    assert content == "\n".join(blocks).strip() + "\n"
+    assert [data[start : start + size].decode("utf-8") for start, size in spans[:2]] == blocks[:2]
+    assert data[spans[2][0] :].decode("utf-8").startswith("--- Page 3 ---")
+    assert spans[2][0] + spans[2][1] <= len(data)
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_reader_seeks_to_pages_of_converted_output(tmp_path: Path, use_mmap: bool) -> None:
+    pdf_path = tmp_path / "doc.pdf"
+    _make_text_pdf(pdf_path, pages=5)
+
+    result = Converter().convert(pdf_path, tmp_path / "out", AppSettings())
+
+    assert result.page_index_path == tmp_path / "out" / "doc.pages.idx"
+    with PageIndexReader.for_output(result.markdown_path, use_mmap=use_mmap) as reader:
+        assert len(reader) == 5
+        assert reader.page_numbers() == [1, 2, 3, 4, 5]
+        page = reader.read_page(4)
+        assert page.startswith("--- Page 4 ---\n")
+        assert "page number 4, naïve café." in page
+        assert "Page 5" not in page
+        assert reader.read_page(2, kind="text").startswith("--- Page 2 ---")
+        assert reader.read_pages(2, 3) == reader.read_page(2) + "\n" + reader.read_page(3)
+        with pytest.raises(PageIndexError):
+            reader.read_page(6)
+
+
+def test_reader_handles_gaps_and_detects_stale_output(tmp_path: Path) -> None:
+    content, spans = join_page_blocks(["--- Page 2 ---\nb\n", "--- Page 7 ---\ng\n"])
+    markdown_path = tmp_path / "gap.md"
+    markdown_path.write_bytes(content.encode("utf-8"))
+    size = len(content.encode("utf-8"))
+    index_path = tmp_path / "gap.pages.idx"
+    write_page_index(index_path, [2, 7], spans, spans, size, size)
+
+    with PageIndexReader(index_path) as reader:
+        assert reader.read_page(7) == "--- Page 7 ---\ng\n"
+        with pytest.raises(PageIndexError):
+            reader.read_page(1)
+
+    markdown_path.write_bytes(content.encode("utf-8") + b"edited")
+    with PageIndexReader(index_path) as reader, pytest.raises(PageIndexError, match="out of date"):
+        reader.read_page(2)
+
+
+def test_page_index_can_be_disabled(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "doc.pdf"
+    _make_text_pdf(pdf_path, pages=1)
+
+    result = Converter().convert(
+        pdf_path, tmp_path / "out", AppSettings(write_page_index=False)
+    )
+
+    assert result.page_index_path is None
+    assert not (tmp_path / "out" / "doc.pages.idx").exists()
@@ -0,0 +1,106 @@
+import json
+from pathlib import Path
+
+import fitz
+from PIL import Image
+
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.models import AppSettings, PageMode
+from roop_pdfmd.core.ocr_backends import StubOcrBackend
+from roop_pdfmd.core.page_retry import render_banded, retry_steps
+
+
+class _PickyBackend(StubOcrBackend):
+    """Runs out of memory on images above ``max_pixels``."""
+
+    def __init__(self, max_pixels: int) -> None:
+        self.max_pixels = max_pixels
+        self.sizes: list[tuple[int, int]] = []
+
+    def image_to_string(
+        self, image, tesseract_cmd, lang="eng", cancel_event=None, env=None, psm=None
+    ):
+        self.sizes.append(image.size)
+        if image.width * image.height > self.max_pixels:
+            raise MemoryError()
+        return super().image_to_string(image, tesseract_cmd, lang)
+
+
+def _make_scan_pdf(path: Path, pages: int = 1) -> Path:
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page().draw_rect(fitz.Rect(72, 72, 300, 300), fill=(0.2, 0.2, 0.2))
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_retry_steps_get_cheaper_and_stop_at_the_floor() -> None:
+    steps = retry_steps(AppSettings(ocr_dpi=300, ocr_batch_size=4), 5)
+
+    assert [(step.settings.ocr_dpi, step.banded) for step in steps] == [
+        (200, False),
+        (150, True),
+        (120, True),
+        (100, True),
+    ]
+    assert all(step.settings.ocr_preprocess_grayscale for step in steps)
+    assert not any(step.settings.ocr_use_embedded_images for step in steps)
+    assert {step.settings.ocr_batch_size for step in steps} == {1}
+    assert retry_steps(AppSettings(), 0) == []
+
+
+def test_banded_render_matches_full_render() -> None:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_textbox(fitz.Rect(72, 72, 540, 720), "banded rendering " * 200)
+
+    banded = render_banded(page, 150)
+    pix = page.get_pixmap(dpi=150, colorspace=fitz.csGRAY, alpha=False)
+
+    assert banded.tobytes() == Image.frombytes("L", (pix.width, pix.height), pix.samples).tobytes()
+
+
+def test_failed_page_is_recovered_at_lower_dpi(tmp_path: Path) -> None:
+    pdf_path = _make_scan_pdf(tmp_path / "scan.pdf", pages=2)
+    backend = _PickyBackend(max_pixels=4_000_000)
+    settings = AppSettings(ocr_backend="picky", ocr_dpi=300, page_retry_attempts=2)
+
+    result = Converter(ocr_backend_factory=lambda _: backend).convert(
+        pdf_path, tmp_path / "out", settings
+    )
+
+    assert not result.errors
+    assert result.retried_pages == 2
+    page = result.pages[0]
+    assert (page.mode, page.ocr_dpi, page.ocr_source) == (PageMode.OCR, 200, "render")
+    assert [(attempt.ocr_dpi, attempt.error) for attempt in page.attempts] == [
+        (300, "MemoryError"),
+        (200, ""),
+    ]
+    metadata = json.loads(result.metadata_path.read_text(encoding="utf-8"))
+    assert metadata["retried_pages"] == 2
+    assert metadata["pages"][1]["attempts"][1]["ocr_dpi"] == 200
+    assert "stub ocr" in result.markdown_path.read_text(encoding="utf-8")
+
+
+def test_page_keeps_its_error_when_retries_run_out(tmp_path: Path) -> None:
+    pdf_path = _make_scan_pdf(tmp_path / "scan.pdf")
+    backend = _PickyBackend(max_pixels=0)
+    converter = Converter(ocr_backend_factory=lambda _: backend)
+
+    off = converter.convert(pdf_path, tmp_path / "off", AppSettings(ocr_dpi=300))
+    retried = converter.convert(
+        pdf_path, tmp_path / "retried", AppSettings(ocr_dpi=300, page_retry_attempts=3)
+    )
+
+    assert off.errors == ["Page 1: MemoryError"]
+    assert off.pages[0].attempts == []
+    assert retried.errors == ["Page 1: MemoryError"]
+    assert [(a.ocr_dpi, a.banded) for a in retried.pages[0].attempts] == [
+        (300, False),
+        (200, False),
+        (150, True),
+        (120, True),
+    ]
+    assert backend.sizes[-1] == (992, 1404)
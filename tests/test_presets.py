@@ -0,0 +1,118 @@
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.__main__ import _PRESETS
+from roop_pdfmd.core.converter import ConversionError, Converter
+from roop_pdfmd.core.models import AppSettings, PageMode
+from roop_pdfmd.core.presets import PRESET_FIELDS, PRESETS, Preset, apply_preset, matching_preset
+from roop_pdfmd.service.jobs import _apply_overrides
+
+
+def _make_captioned_image_pdf(path: Path, caption: str) -> None:
+    photo = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 200, 150), False)
+    photo.set_rect(photo.irect, (90, 120, 150))
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_image(fitz.Rect(54, 54, 558, 650), pixmap=photo)
+    page.insert_text((54, 680), caption, fontsize=11)
+    doc.save(path)
+    doc.close()
+
+
+def test_balanced_preset_is_the_defaults() -> None:
+    defaults = AppSettings()
+
+    assert apply_preset(defaults, Preset.BALANCED) == defaults
+    assert matching_preset(defaults) == "balanced"
+
+
+@pytest.mark.parametrize("preset", list(Preset))
+def test_apply_then_match_round_trips(preset: Preset) -> None:
+    settings = apply_preset(AppSettings(tesseract_path="/opt/tesseract"), preset.value)
+
+    assert set(PRESETS[preset]) == set(PRESET_FIELDS)
+    assert matching_preset(settings) == preset.value
+    assert settings.tesseract_path == "/opt/tesseract"
+    assert matching_preset(replace(settings, ocr_dpi=settings.ocr_dpi + 1)) == ""
+
+
+def test_cli_choices_match_the_presets() -> None:
+    assert _PRESETS == tuple(preset.value for preset in Preset)
+
+
+def test_unknown_preset_is_rejected() -> None:
+    with pytest.raises(ValueError, match="turbo"):
+        apply_preset(AppSettings(), "turbo")
+    with pytest.raises(ConversionError, match="turbo"):
+        _apply_overrides(AppSettings(), {"preset": "turbo"})
+
+
+def test_service_overrides_apply_preset_before_fields() -> None:
+    settings = _apply_overrides(AppSettings(), {"preset": "fast", "ocr_dpi": 250})
+
+    assert settings.ocr_psm == PRESETS[Preset.FAST]["ocr_psm"]
+    assert settings.ocr_dpi == 250
+
+
+def test_classifier_thresholds_decide_captioned_image_pages(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "figure.pdf"
+    _make_captioned_image_pdf(pdf_path, "Figure 7: pump housing, rear")
+    base = AppSettings(ocr_backend="stub")
+
+    default = Converter().convert(pdf_path, tmp_path / "default", base)
+    fast = Converter().convert(pdf_path, tmp_path / "fast", apply_preset(base, Preset.FAST))
+
+    assert default.pages[0].mode == PageMode.OCR
+    assert fast.pages[0].mode == PageMode.EXTRACT
+
+
+def test_preset_is_recorded_in_metadata(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "figure.pdf"
+    _make_captioned_image_pdf(pdf_path, "Figure 7: pump housing, rear")
+    accurate = apply_preset(AppSettings(ocr_backend="stub"), Preset.ACCURATE)
+
+    result = Converter().convert(pdf_path, tmp_path / "accurate", accurate)
+    custom = Converter().convert(pdf_path, tmp_path / "custom", replace(accurate, ocr_dpi=150))
+
+    assert result.preset == "accurate"
+    assert json.loads(result.metadata_path.read_text(encoding="utf-8"))["preset"] == "accurate"
+    assert custom.preset == ""
+    assert json.loads(custom.metadata_path.read_text(encoding="utf-8"))["preset"] == "custom"
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX shebang script")
+def test_page_segmentation_mode_reaches_tesseract(tmp_path: Path) -> None:
+    argv_log = tmp_path / "argv.log"
+    tesseract = tmp_path / "tesseract"
+    tesseract.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "if '--version' in sys.argv:\n"
+        "    print('tesseract 5.3.0')\n"
+        "    sys.exit(0)\n"
+        f"open({str(argv_log)!r}, 'a').write(' '.join(sys.argv[1:]) + '\\n')\n"
+        "sys.stdin.buffer.read()\n"
+        "print('scanned text')\n",
+        encoding="utf-8",
+    )
+    tesseract.chmod(0o755)
+    doc = fitz.open()
+    doc.new_page()
+    doc.save(tmp_path / "scan.pdf")
+    doc.close()
+    settings = AppSettings(
+        tesseract_path=str(tesseract),
+        ocr_backend="tesseract-pipe",
+        ocr_dpi=72,
+        ocr_psm=6,
+    )
+
+    result = Converter().convert(tmp_path / "scan.pdf", tmp_path / "out", settings)
+
+    assert result.errors == []
+    assert "--psm 6" in argv_log.read_text(encoding="utf-8")
@@ -0,0 +1,133 @@
+import json
+import math
+import random
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.__main__ import main
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.core.report import (
+    DurationHistogram,
+    ReportError,
+    build_report,
+    iter_metadata_files,
+)
+
+
+def _write_metadata(path: Path, name: str, seconds: list[float], **fields) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pages = [
+        {"page_number": idx, "mode": "OCR" if idx % 2 else "EXTRACT", "duration_seconds": value}
+        for idx, value in enumerate(seconds, start=1)
+    ]
+    payload = {
+        "input_pdf": name,
+        "processed_pages": len(pages),
+        "ocr_pages": sum(page["mode"] == "OCR" for page in pages),
+        "extracted_pages": sum(page["mode"] == "EXTRACT" for page in pages),
+        "duration_seconds": sum(seconds),
+        "errors": [],
+        "pages": pages,
+        **fields,
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def test_histogram_percentiles_are_within_one_percent() -> None:
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(0, 1.5) for _ in range(20_000)]
+    histogram = DurationHistogram()
+    for value in samples:
+        histogram.add(value)
+
+    ordered = sorted(samples)
+    for percent in (1, 50, 90, 99, 100):
+        exact = ordered[math.ceil(percent / 100 * len(ordered)) - 1]
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=0.011)
+    assert histogram.percentile(100) == max(samples)
+    assert DurationHistogram().percentile(50) == 0.0
+
+
+def test_report_aggregates_a_folder_tree(tmp_path: Path) -> None:
+    _write_metadata(tmp_path / "a" / "one.meta.json", "one.pdf", [1.0, 3.0])
+    _write_metadata(
+        tmp_path / "a" / "deep" / "two.meta.json",
+        "two.pdf",
+        [0.5, 0.5, 9.0, 0.5],
+        errors=["Page 3: boom"],
+        cancelled=True,
+    )
+    _write_metadata(tmp_path / "b" / "three.meta.json", "three.pdf", [2.0])
+    (tmp_path / "b" / "broken.meta.json").write_text("{not json", encoding="utf-8")
+    (tmp_path / "b" / "notes.json").write_text("{}", encoding="utf-8")
+
+    report = build_report([tmp_path], slowest=2)
+
+    assert report.documents == 3
+    assert report.unreadable_files == 1
+    assert report.cancelled_documents == 1
+    assert report.documents_with_errors == 1
+    assert report.pages == 7
+    assert report.ocr_pages == 4
+    assert report.ocr_ratio == pytest.approx(4 / 7)
+    assert report.pages_per_second == pytest.approx(7 / 16.5)
+    assert [doc.input_pdf for doc in report.slowest_documents] == ["two.pdf", "one.pdf"]
+    assert report.page_seconds["all"]["pages"] == 7
+    assert report.page_seconds["all"]["max"] == 9.0
+    assert report.page_seconds["OCR"]["pages"] == 4
+    assert "BLANK" not in report.page_seconds
+    assert "two.pdf" in report.format_table()
+
+
+def test_merged_documents_count_their_page_times(tmp_path: Path) -> None:
+    # The merge itself took 0.1s; the shards spent 6s converting pages.
+    _write_metadata(
+        tmp_path / "merged.meta.json",
+        "merged.pdf",
+        [2.0, 4.0],
+        assembled=True,
+        duration_seconds=0.1,
+    )
+
+    report = build_report([tmp_path])
+
+    assert report.assembled_documents == 1
+    assert report.duration_seconds == pytest.approx(6.0)
+    assert report.pages_per_second == pytest.approx(2 / 6.0)
+    assert report.slowest_documents[0].duration_seconds == pytest.approx(6.0)
+    assert "1 merged from shards" in report.format_table()
+
+
+def test_missing_path_is_reported(tmp_path: Path) -> None:
+    with pytest.raises(ReportError, match="missing"):
+        list(iter_metadata_files([tmp_path / "missing"]))
+
+
+def test_report_cli_reads_converter_metadata(tmp_path: Path, monkeypatch, capsys) -> None:
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "A page with a text layer on it, long enough to extract.")
+    doc.new_page()
+    doc.save(tmp_path / "doc.pdf")
+    doc.close()
+    Converter().convert(tmp_path / "doc.pdf", tmp_path / "out", AppSettings(ocr_backend="stub"))
+
+    def run(*args: str) -> int:
+        monkeypatch.setattr(sys, "argv", ["roop-pdfmd", "report", *args])
+        return main()
+
+    assert run(str(tmp_path / "out"), "--json") == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["documents"] == 1
+    assert payload["pages"] == 2
+    assert payload["ocr_ratio"] == 0.5
+    assert payload["slowest_documents"][0]["input_pdf"].endswith("doc.pdf")
+    assert run(str(tmp_path / "out")) == 0
+    assert "OCR ratio         50.0%" in capsys.readouterr().out
+    assert run(str(tmp_path / "missing")) == 2
+    (tmp_path / "empty").mkdir()
+    assert run(str(tmp_path / "empty")) == 1
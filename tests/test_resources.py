@@ -0,0 +1,125 @@
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.models import AppSettings, MemoryLimitAction
+from roop_pdfmd.core.resources import MemoryGuard, degraded_settings, memory_usage
+
+
+def _make_blank_pdf(path: Path, pages: int) -> Path:
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page(width=144, height=144)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_memory_usage_reports_resident_set() -> None:
+    rss, peak = memory_usage()
+    assert rss > 0
+    assert peak >= rss
+
+
+def test_conversion_records_page_and_run_resources(tmp_path: Path) -> None:
+    pdf_path = _make_blank_pdf(tmp_path / "blank.pdf", pages=2)
+    settings = AppSettings(ocr_backend="stub", ocr_dpi=144, track_python_memory=True)
+
+    result = Converter().convert(pdf_path, tmp_path / "out", settings)
+
+    for page in result.pages:
+        assert page.ocr_dpi == 144
+        assert page.image_bytes == 288 * 288 * 3
+        assert page.cpu_seconds >= 0
+        assert 0 < page.rss_bytes <= result.process_peak_rss_bytes
+        assert page.python_peak_bytes > 0
+    assert result.peak_image_bytes == 288 * 288 * 3
+    assert result.process_peak_rss_bytes > 0
+    assert result.process_python_peak_bytes > 0
+    assert not tracemalloc.is_tracing()
+
+    metadata = json.loads(result.metadata_path.read_text(encoding="utf-8"))
+    assert metadata["process_peak_rss_bytes"] == result.process_peak_rss_bytes
+    assert metadata["pages"][0]["rss_bytes"] == result.pages[0].rss_bytes
+    assert metadata["resource_warnings"] == []
+    assert metadata["pages"][0]["image_bytes"] == 288 * 288 * 3
+
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="Tesseract CPU is read through wait4")
+def test_cpu_seconds_count_own_tesseract_runs_but_not_other_threads(tmp_path: Path) -> None:
+    tesseract = tmp_path / "tesseract"
+    tesseract.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, time\n"
+        "sys.stdin.buffer.read()\n"
+        "while time.process_time() < 0.3:\n"
+        "    pass\n"
+        "print('scanned text')\n",
+        encoding="utf-8",
+    )
+    tesseract.chmod(0o755)
+    pdf_path = _make_blank_pdf(tmp_path / "blank.pdf", pages=1)
+    settings = AppSettings(
+        tesseract_path=str(tesseract), ocr_backend="tesseract-pipe", ocr_dpi=72
+    )
+    done = threading.Event()
+
+    def spin() -> None:
+        # Another conversion's worth of CPU in the same process.
+        while not done.is_set():
+            sum(range(1000))
+
+    spinner = threading.Thread(target=spin)
+    spinner.start()
+    try:
+        result = Converter().convert(pdf_path, tmp_path / "out", settings)
+    finally:
+        done.set()
+        spinner.join()
+
+    assert result.errors == []
+    assert 0.3 <= result.pages[0].cpu_seconds < 0.45
+    assert result.cpu_seconds == result.pages[0].cpu_seconds
+
+
+def test_soft_limit_degrades_ocr_settings(tmp_path: Path) -> None:
+    pdf_path = _make_blank_pdf(tmp_path / "blank.pdf", pages=7)
+    settings = AppSettings(
+        ocr_backend="stub",
+        ocr_dpi=300,
+        ocr_batch_size=4,
+        memory_soft_limit_mb=1,
+        memory_limit_action=MemoryLimitAction.DEGRADE,
+    )
+
+    result = Converter().convert(pdf_path, tmp_path / "out", settings)
+
+    # Degraded before page 1, then again once the cooldown has passed.
+    assert [page.ocr_dpi for page in result.pages] == [200] * 6 + [150]
+    assert all(page.ocr_batch_size == 1 for page in result.pages)
+    assert len(result.resource_warnings) == 2
+    assert result.resource_warnings[0].startswith("Page 1: Memory use")
+    assert settings.ocr_dpi == 300
+
+
+def test_soft_limit_warns_once_per_excursion() -> None:
+    settings = AppSettings(memory_soft_limit_mb=1)
+    guard = MemoryGuard(settings.memory_soft_limit_mb, settings.memory_limit_action)
+
+    checked, warning = guard.check(settings)
+    assert checked is settings
+    assert "soft limit of 1 MB" in warning
+    assert guard.check(settings) == (settings, "")
+    assert MemoryGuard(0, MemoryLimitAction.WARN).check(settings) == (settings, "")
+
+
+def test_degraded_settings_bottom_out() -> None:
+    assert degraded_settings(AppSettings(ocr_dpi=150, ocr_batch_size=1)) is None
+    assert degraded_settings(AppSettings(ocr_dpi=400)).ocr_dpi == 266
@@ -0,0 +1,100 @@
+import json
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.__main__ import main
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.core.search_index import SearchIndex, SearchIndexError
+
+
+def _make_pdf(path: Path, page_texts: list[str]) -> Path:
+    doc = fitz.open()
+    for text in page_texts:
+        page = doc.new_page()
+        # Enough words that the text layer is trusted and no OCR is needed.
+        filler = " ".join(f"lorem{idx} ipsum{idx}" for idx in range(30))
+        page.insert_textbox(fitz.Rect(72, 72, 540, 720), f"{text} {filler}")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_pages_are_indexed_during_conversion(tmp_path: Path) -> None:
+    index_path = tmp_path / "corpus.sqlite3"
+    settings = AppSettings(search_index_path=str(index_path))
+    first = _make_pdf(tmp_path / "first.pdf", ["Quarterly revenue grew strongly.", "Nothing here."])
+    second = _make_pdf(tmp_path / "second.pdf", ["Filler page.", "Revenue fell in the quarter."])
+
+    Converter().convert(first, tmp_path / "out1", settings)
+    Converter().convert(second, tmp_path / "out2", settings)
+
+    with SearchIndex(index_path) as index:
+        hits = index.search("revenue")
+        assert {(Path(hit.document).name, hit.page_number) for hit in hits} == {
+            ("first.pdf", 1),
+            ("second.pdf", 2),
+        }
+        assert all("[Revenue]" in hit.snippet or "[revenue]" in hit.snippet for hit in hits)
+        assert [hit.page_number for hit in index.search("revenue", document=second)] == [2]
+        assert index.search("quarterly revenue")[0].markdown_path.endswith("first.md")
+        assert sorted(count for _, count in index.documents()) == [2, 2]
+
+
+def test_reconverting_replaces_a_documents_pages(tmp_path: Path) -> None:
+    pdf_path = _make_pdf(tmp_path / "doc.pdf", ["Unique marker zebra."])
+    settings = AppSettings(search_index_path="search.sqlite3")
+
+    Converter().convert(pdf_path, tmp_path / "out", settings)
+    result = Converter().convert(pdf_path, tmp_path / "out", settings)
+
+    with SearchIndex(result.output_dir / "search.sqlite3") as index:
+        assert len(index.search("zebra")) == 1
+        with pytest.raises(SearchIndexError):
+            index.search('"unbalanced', raw=True)
+        assert index.search('"unbalanced') == []
+
+
+def test_reindexing_one_document_keeps_the_others(tmp_path: Path) -> None:
+    with SearchIndex(tmp_path / "corpus.sqlite3") as index:
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            writer = index.writer(name)
+            writer.add_page(1, f"shared corpus words {name} original")
+            writer.add_page(2, f"second page of {name}")
+            writer.finish()
+
+        writer = index.writer("b.pdf")
+        writer.add_page(1, "shared corpus words rewritten")
+        writer.finish()
+
+        assert {hit.document for hit in index.search("shared corpus")} == {
+            "a.pdf",
+            "b.pdf",
+            "c.pdf",
+        }
+        assert [hit.document for hit in index.search("rewritten")] == ["b.pdf"]
+        assert index.search("second page b.pdf") == []
+        assert {hit.document for hit in index.search("original")} == {"a.pdf", "c.pdf"}
+        assert dict(index.documents()) == {"a.pdf": 2, "b.pdf": 1, "c.pdf": 2}
+        plan = index._conn.execute(
+            "EXPLAIN QUERY PLAN DELETE FROM page_texts WHERE document_id = 1"
+        ).fetchall()
+        assert any("page_texts_document" in row[-1] for row in plan)
+
+
+def test_search_cli_prints_hits(tmp_path: Path, monkeypatch, capsys) -> None:
+    pdf_path = _make_pdf(tmp_path / "doc.pdf", ["Alpha page.", "Beta gamma page."])
+    index_path = tmp_path / "search.sqlite3"
+    Converter().convert(pdf_path, tmp_path / "out", AppSettings(search_index_path=str(index_path)))
+
+    monkeypatch.setattr(sys, "argv", ["roop-pdfmd", "search", str(index_path), "gamma", "--json"])
+    assert main() == 0
+    hit = json.loads(capsys.readouterr().out)
+    assert hit["page_number"] == 2
+    assert hit["document"] == str(pdf_path.resolve())
+
+    monkeypatch.setattr(sys, "argv", ["roop-pdfmd", "search", str(index_path), "delta"])
+    assert main() == 1
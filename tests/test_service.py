@@ -0,0 +1,148 @@
+import asyncio
+import http.client
+import json
+import socket
+import threading
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.service.http_server import ConversionHttpServer
+from roop_pdfmd.service.jobs import ConversionService
+
+
+def _make_text_pdf(path: Path, pages: int = 3) -> bytes:
+    doc = fitz.open()
+    for idx in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Service page {idx + 1} has a text layer.")
+    doc.save(path)
+    doc.close()
+    return path.read_bytes()
+
+
+@pytest.fixture(scope="module")
+def server_port(tmp_path_factory: pytest.TempPathFactory):
+    service = ConversionService(tmp_path_factory.mktemp("service"), workers=1)
+    loop = asyncio.new_event_loop()
+    server = ConversionHttpServer(service, port=0)
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    yield server.port
+
+    asyncio.run_coroutine_threadsafe(server.stop(), loop).result(timeout=10)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=10)
+    loop.close()
+    service.close()
+
+
+def _request(port: int, method: str, path: str, body: bytes = b"", headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    connection.request(method, path, body=body, headers=headers or {})
+    response = connection.getresponse()
+    data = response.read()
+    connection.close()
+    return response.status, data
+
+
+def test_upload_streams_page_progress_and_serves_results(server_port: int, tmp_path: Path) -> None:
+    pdf_bytes = _make_text_pdf(tmp_path / "upload.pdf")
+
+    status, data = _request(
+        server_port,
+        "POST",
+        "/jobs?filename=report.pdf",
+        body=pdf_bytes,
+        headers={"Content-Type": "application/pdf"},
+    )
+    assert status == 202
+    job_id = json.loads(data)["job_id"]
+
+    status, data = _request(server_port, "GET", f"/jobs/{job_id}/events")
+    events = [json.loads(line) for line in data.decode("utf-8").splitlines()]
+    assert status == 200
+    assert [event["current_page"] for event in events if event["type"] == "page"] == [1, 2, 3]
+    assert events[-1]["type"] == "completed"
+
+    status, data = _request(server_port, "GET", f"/jobs/{job_id}/result/markdown")
+    assert status == 200
+    assert "Service page 2 has a text layer." in data.decode("utf-8")
+
+    job = json.loads(_request(server_port, "GET", f"/jobs/{job_id}")[1])
+    assert Path(job["input_pdf"]).name == "report.pdf"
+
+
+def test_local_path_job_and_metrics(server_port: int, tmp_path: Path) -> None:
+    pdf_path = tmp_path / "local.pdf"
+    _make_text_pdf(pdf_path, pages=2)
+    payload = {"path": str(pdf_path), "output_dir": "local-out"}
+
+    status, data = _request(
+        server_port,
+        "POST",
+        "/jobs",
+        body=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    assert status == 202
+    job_id = json.loads(data)["job_id"]
+    _request(server_port, "GET", f"/jobs/{job_id}/events")
+
+    status, data = _request(server_port, "GET", f"/jobs/{job_id}")
+    job = json.loads(data)
+    assert job["state"] == "completed"
+    assert Path(job["output_dir"]).parts[-2:] == ("outputs", "local-out")
+    assert (Path(job["output_dir"]) / "local.md").exists()
+
+    metrics = json.loads(_request(server_port, "GET", "/metrics")[1])
+    assert metrics["jobs"]["completed"] >= 1
+    assert metrics["pages_processed"] >= 2
+
+
+def test_rejects_unknown_settings_and_missing_jobs(server_port: int, tmp_path: Path) -> None:
+    pdf_path = tmp_path / "local.pdf"
+    _make_text_pdf(pdf_path, pages=1)
+    payload = {"path": str(pdf_path), "settings": {"not_a_setting": 1}}
+
+    status, _ = _request(
+        server_port,
+        "POST",
+        "/jobs",
+        body=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    assert status == 400
+    assert _request(server_port, "GET", "/jobs/missing")[0] == 404
+
+
+@pytest.mark.parametrize("output_dir", ["../escaped", "/tmp/roop-escaped"])
+def test_rejects_output_dir_outside_output_root(
+    server_port: int, tmp_path: Path, output_dir: str
+) -> None:
+    pdf_path = tmp_path / "local.pdf"
+    _make_text_pdf(pdf_path, pages=1)
+    payload = {"path": str(pdf_path), "output_dir": output_dir}
+
+    status, data = _request(
+        server_port,
+        "POST",
+        "/jobs",
+        body=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert status == 400
+    assert "output_dir" in json.loads(data)["error"]
+
+
+@pytest.mark.parametrize("length", [b"lots", b"-5"])
+def test_malformed_content_length_is_a_bad_request(server_port: int, length: bytes) -> None:
+    with socket.create_connection(("127.0.0.1", server_port), timeout=10) as sock:
+        sock.sendall(b"POST /jobs HTTP/1.1\r\nHost: x\r\nContent-Length: " + length + b"\r\n\r\n")
+        response = sock.makefile("rb").readline()
+
+    assert response.startswith(b"HTTP/1.1 400")
@@ -0,0 +1,100 @@
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.core.converter import ConversionError
+from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.core.session import ConverterSession
+
+
+def _make_blank_pdf(path: Path, pages: int = 2) -> Path:
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page()
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _make_counting_tesseract(path: Path, probes_log: Path) -> Path:
+    path.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "if '--version' in sys.argv:\n"
+        f"    open({str(probes_log)!r}, 'a').write('probe\\n')\n"
+        "    print('tesseract 5.3.0')\n"
+        "    sys.exit(0)\n"
+        "open(sys.argv[2] + '.txt', 'w').write('scanned words\\n\\f')\n",
+        encoding="utf-8",
+    )
+    path.chmod(0o755)
+    return path
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX shebang script")
+def test_session_probes_tesseract_once(tmp_path: Path) -> None:
+    probes_log = tmp_path / "probes.log"
+    tesseract = _make_counting_tesseract(tmp_path / "tesseract", probes_log)
+    settings = AppSettings(tesseract_path=str(tesseract), ocr_dpi=72)
+
+    with ConverterSession(settings) as session:
+        for idx in range(3):
+            pdf_path = _make_blank_pdf(tmp_path / f"doc{idx}.pdf")
+            result = session.convert(pdf_path, tmp_path / f"out{idx}")
+            assert result.ocr_pages == 2
+        stats = session.stats()
+
+    assert probes_log.read_text().split() == ["probe"]
+    assert stats.tesseract_probes == 1
+    assert stats.documents_converted == 3
+    assert stats.pages_processed == stats.ocr_pages == 6
+
+
+def test_session_runs_documents_concurrently(tmp_path: Path) -> None:
+    settings = AppSettings(ocr_backend="stub")
+    jobs = [
+        (_make_blank_pdf(tmp_path / f"doc{idx}.pdf", pages=idx + 1), tmp_path / f"out{idx}")
+        for idx in range(4)
+    ]
+    jobs.append((tmp_path / "missing.pdf", tmp_path / "out-missing"))
+
+    with ConverterSession(settings, max_workers=3) as session:
+        outcomes = list(session.convert_many(jobs))
+        stats = session.stats()
+
+    assert [outcome.ocr_pages for outcome in outcomes[:4]] == [1, 2, 3, 4]
+    assert isinstance(outcomes[4], ConversionError)
+    assert stats.documents_converted == 4
+    assert stats.documents_failed == 1
+    assert stats.tesseract_probes == 0
+
+
+def test_convert_many_wraps_unexpected_errors_and_cancels_on_close(tmp_path: Path) -> None:
+    pdf_path = _make_blank_pdf(tmp_path / "doc.pdf")
+    (tmp_path / "blocked").write_text("a file, not a folder", encoding="utf-8")
+    jobs = [(pdf_path, tmp_path / "blocked" / "out")]
+    jobs += [(pdf_path, tmp_path / f"out{idx}") for idx in range(4)]
+
+    with ConverterSession(AppSettings(ocr_backend="stub")) as session:
+        outcomes = session.convert_many(jobs)
+        error = next(outcomes)
+        assert next(outcomes).processed_pages == 2
+        outcomes.close()
+
+    assert isinstance(error, ConversionError)
+    assert isinstance(error.__cause__, OSError)
+    assert not (tmp_path / "out3").exists()
+
+
+def test_closed_session_rejects_work(tmp_path: Path) -> None:
+    pdf_path = _make_blank_pdf(tmp_path / "doc.pdf")
+    session = ConverterSession(AppSettings(ocr_backend="stub"))
+    session.close()
+
+    assert session.closed
+    with pytest.raises(ConversionError, match="closed"):
+        session.convert(pdf_path, tmp_path / "out")
+    with pytest.raises(ConversionError, match="closed"):
+        session.submit(pdf_path, tmp_path / "out")
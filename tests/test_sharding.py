@@ -0,0 +1,177 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+import fitz
+import pytest
+
+from roop_pdfmd.__main__ import main
+from roop_pdfmd.core.converter import Converter
+from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.core.ocr_backends import create_ocr_backend
+from roop_pdfmd.core.sharding import ShardError, ShardQueue, run_shard_worker
+
+# Timings and resource samples differ between any two runs.
+_VOLATILE_KEYS = {
+    "duration_seconds",
+    "classify_seconds",
+    "render_seconds",
+    "ocr_seconds",
+    "ocr_threads",
+    "cpu_seconds",
+    "rss_bytes",
+    "python_peak_bytes",
+    "process_peak_rss_bytes",
+    "process_python_peak_bytes",
+}
+_WORDS = (
+    "revenue margin office workflow analysis quarterly forecast customer contract "
+    "increase decrease operating segment liquidity capital"
+).split()
+
+
+def _make_report_pdf(path: Path, pages: int = 10) -> Path:
+    doc = fitz.open()
+    for number in range(1, pages + 1):
+        page = doc.new_page()
+        if number in (4, 8):
+            # Scanned slip sheet: text layer is kept the first time, OCR'd
+            # when it repeats, and the repeat lands in a later shard.
+            scan = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 40), 0)
+            scan.clear_with(200)
+            page.insert_image(fitz.Rect(72, 300, 432, 660), pixmap=scan)
+            page.insert_text((72, 72), "Scanned exhibit follows on the next sheet")
+            continue
+        body = " ".join(_WORDS[(number * 7 + idx) % len(_WORDS)] for idx in range(60))
+        text = f"ACME Annual Report\nnued {body}\n{_WORDS[number]} conti-"
+        page.insert_textbox(fitz.Rect(72, 72, 540, 720), text)
+        page.insert_text((72, 760), f"Page {number}")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _strip_timings(metadata_path: Path) -> dict:
+    payload = json.loads(metadata_path.read_text(encoding="utf-8"))
+    for key in _VOLATILE_KEYS & payload.keys():
+        payload.pop(key)
+    payload["pages"] = [
+        {key: value for key, value in page.items() if key not in _VOLATILE_KEYS}
+        for page in payload["pages"]
+    ]
+    return payload
+
+
+def test_sharded_output_matches_single_process_run(tmp_path: Path) -> None:
+    pdf_path = _make_report_pdf(tmp_path / "report.pdf")
+    settings = AppSettings(
+        ocr_backend="stub",
+        ocr_dpi=72,
+        dehyphenate=True,
+        strip_headers_footers=True,
+    )
+    expected = Converter().convert(pdf_path, tmp_path / "single", settings)
+
+    queue = ShardQueue(tmp_path / "queue")
+    job = queue.publish(pdf_path, tmp_path / "sharded", settings, shard_pages=3)
+    assert job.shards == [(1, 3), (4, 6), (7, 9), (10, 10)]
+    assert run_shard_worker(queue.root, "worker-a", max_shards=2) == 2
+    assert run_shard_worker(queue.root, "worker-b") == 2
+    assert queue.status(job.job_id).complete
+
+    result = queue.merge(job.job_id)
+
+    assert result.markdown_path.read_bytes() == expected.markdown_path.read_bytes()
+    assert result.text_path.read_bytes() == expected.text_path.read_bytes()
+    assert result.page_index_path.read_bytes() == expected.page_index_path.read_bytes()
+    single = _strip_timings(expected.metadata_path)
+    sharded = _strip_timings(result.metadata_path)
+    assert (single.pop("assembled"), sharded.pop("assembled")) == (False, True)
+    for payload, out_dir in ((single, "single"), (sharded, "sharded")):
+        for key in ("output_dir", "markdown_path", "text_path", "page_index_path"):
+            payload[key] = payload[key].replace(str(tmp_path / out_dir), "")
+    assert sharded == single
+    modes = [page.mode.value for page in result.pages]
+    assert modes[3] == "EXTRACT" and modes[7] == "OCR"
+    markdown = result.markdown_path.read_text(encoding="utf-8")
+    # Stripped everywhere but the first page, which only has one neighbour.
+    assert markdown.count("ACME") == 1
+    assert "margin continued" in markdown
+
+
+def test_expired_lease_is_reclaimed(tmp_path: Path) -> None:
+    pdf_path = _make_report_pdf(tmp_path / "report.pdf", pages=2)
+    queue = ShardQueue(tmp_path / "queue")
+    queue.publish(pdf_path, tmp_path / "out", AppSettings(), shard_pages=2)
+
+    stale = queue.claim("crashed-worker", lease_seconds=0.05)
+    assert stale is not None
+    assert queue.claim("other-worker") is None
+
+    time.sleep(0.1)
+    lease = queue.claim("other-worker")
+    assert lease is not None
+    assert lease.index == stale.index
+    assert not stale.renew()
+    assert lease.renew()
+
+
+def test_failed_shards_are_retried_until_attempts_run_out(tmp_path: Path) -> None:
+    pdf_path = _make_report_pdf(tmp_path / "report.pdf", pages=2)
+    queue = ShardQueue(tmp_path / "queue")
+    job = queue.publish(pdf_path, tmp_path / "out", AppSettings(), shard_pages=2, max_attempts=2)
+
+    for _ in range(2):
+        lease = queue.claim("worker")
+        assert lease is not None
+        lease.fail("tesseract crashed")
+    assert queue.claim("worker") is None
+    assert queue.status(job.job_id).failed == 1
+    with pytest.raises(ShardError, match="incomplete"):
+        queue.merge(job.job_id)
+
+    assert queue.reset_failed(job.job_id) == 1
+    assert queue.claim("worker") is not None
+
+
+def test_shard_cli_round_trip(tmp_path: Path, monkeypatch, capsys) -> None:
+    pdf_path = _make_report_pdf(tmp_path / "report.pdf", pages=3)
+    queue_dir = tmp_path / "queue"
+
+    def run(*args: str) -> int:
+        monkeypatch.setattr(sys, "argv", ["roop-pdfmd", "shard", *args])
+        return main()
+
+    out_dir = tmp_path / "out"
+    assert run("publish", str(queue_dir), str(pdf_path), str(out_dir), "--shard-pages", "2") == 0
+    job_id = capsys.readouterr().out.strip()
+    assert run("status", str(queue_dir), job_id) == 1
+    assert run("work", str(queue_dir)) == 0
+    assert run("status", str(queue_dir), job_id) == 0
+    assert run("merge", str(queue_dir), job_id, "--remove") == 0
+    assert (out_dir / "report.md").exists()
+    assert not (queue_dir / job_id).exists()
+
+
+def test_worker_reuses_one_ocr_backend_across_shards(tmp_path: Path, monkeypatch) -> None:
+    created: list[str] = []
+
+    def counting_factory(name: str):
+        created.append(name)
+        return create_ocr_backend(name)
+
+    monkeypatch.setattr("roop_pdfmd.core.converter.create_ocr_backend", counting_factory)
+    monkeypatch.setattr("roop_pdfmd.core.session.create_ocr_backend", counting_factory)
+    pdf_path = tmp_path / "scans.pdf"
+    doc = fitz.open()
+    for _ in range(6):
+        doc.new_page()
+    doc.save(pdf_path)
+    doc.close()
+    queue = ShardQueue(tmp_path / "queue")
+    job = queue.publish(pdf_path, tmp_path / "out", AppSettings(ocr_backend="stub"), shard_pages=2)
+
+    assert run_shard_worker(queue.root, "worker") == 3
+    assert created == ["stub"]
+    assert queue.merge(job.job_id).ocr_pages == 6
@@ -1,6 +1,83 @@
-from roop_pdfmd.core.text_utils import dehyphenate_text
+from roop_pdfmd.core.text_utils import TextPipeline, dehyphenate_text
 
 
 def test_dehyphenate_text_joins_linebreak_hyphenation() -> None:
     source = "This is hyphen-\nated text."
     assert dehyphenate_text(source) == "This is hyphenated text."
+
+
+def test_pipeline_disabled_passes_pages_through_immediately() -> None:
+    pipeline = TextPipeline()
+
+    assert pipeline.push(1, "a  b-\nc") == [(1, "a  b-\nc")]
+    assert pipeline.finish() == []
+
+
+def test_pipeline_dehyphenates_across_page_boundary() -> None:
+    pipeline = TextPipeline(dehyphenate=True)
+
+    assert pipeline.push(1, "The experi-\nment was a suc-") == []
+    released = pipeline.push(2, "cess overall.\nNext line.")
+    assert released == [(1, "The experiment was a success")]
+    assert pipeline.finish() == [(2, "overall.\nNext line.")]
+
+
+def test_pipeline_does_not_join_capitalised_next_page() -> None:
+    pages = list(TextPipeline(dehyphenate=True).process(["Well-", "Known heading"]))
+
+    assert pages == ["Well-", "Known heading"]
+
+
+def test_pipeline_normalizes_ligatures_and_whitespace() -> None:
+    pipeline = TextPipeline(normalize_unicode=True, collapse_whitespace=True)
+
+    source = "ﬁnal  ofﬁce  re­port   \n\n\n\nCafé \t"
+
+    assert list(pipeline.process([source])) == ["final office report\n\nCafé"]
+
+
+def test_pipeline_strips_running_headers_and_page_numbers() -> None:
+    bodies = [
+        "Revenue grew.\nCosts fell.\nMargins rose.",
+        "Hiring slowed.\nOffices closed.\nTravel stopped.",
+        "Outlook is stable.\nRisks remain.\nThanks for reading.",
+    ]
+    pages = [
+        f"ACME Annual Report 2023\n{body}\nPage {number} of 3"
+        for number, body in enumerate(bodies, start=1)
+    ]
+
+    stripped = list(TextPipeline(strip_headers_footers=True).process(pages))
+
+    # Only two pages have been seen when the first is released, so its
+    # header stays; page numbers go as soon as a neighbour has one.
+    assert stripped == [f"ACME Annual Report 2023\n{bodies[0]}", *bodies[1:]]
+
+
+def test_pipeline_keeps_first_lines_repeated_on_only_two_pages() -> None:
+    pages = [
+        "Chapter 3\nThe method is described here.\n1",
+        "Chapter 3\nResults follow from the method.\n2",
+        "Table 2\nRow one.\n3",
+        "Table 4\nRow two.\n4",
+        "12 March 2024\nMinutes of the meeting.\n5",
+    ]
+
+    stripped = list(TextPipeline(strip_headers_footers=True).process(pages))
+
+    assert stripped == [page.rsplit("\n", 1)[0] for page in pages]
+
+
+def test_pipeline_strips_header_before_joining_hyphenated_word() -> None:
+    pages = [
+        "Journal of Things\nIntro text with hyphen-\n12",
+        "Journal of Things\nated words here.\n13",
+        "Journal of Things\nClosing text.\n14",
+    ]
+    pipeline = TextPipeline(dehyphenate=True, strip_headers_footers=True)
+
+    assert list(pipeline.process(pages)) == [
+        "Journal of Things\nIntro text with hyphenated",
+        "words here.",
+        "Closing text.",
+    ]
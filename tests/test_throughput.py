@@ -0,0 +1,58 @@
+from roop_pdfmd.core.models import PageMode, PageResult
+from roop_pdfmd.core.throughput import ThroughputTracker
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _page(number: int, mode: PageMode, seconds: float, error: str = "") -> PageResult:
+    ocr = seconds * 0.8 if mode == PageMode.OCR else 0.0
+    return PageResult(
+        page_number=number,
+        mode=mode,
+        duration_seconds=seconds,
+        text_length=10,
+        error=error,
+        classify_seconds=seconds - ocr,
+        ocr_seconds=ocr,
+    )
+
+
+def test_tracker_reports_split_stages_and_slowest_pages() -> None:
+    clock = _Clock()
+    tracker = ThroughputTracker(total_pages=10, slowest=2, clock=clock)
+    durations = [
+        (PageMode.EXTRACT, 0.1),
+        (PageMode.OCR, 2.0),
+        (PageMode.OCR, 3.0),
+        (PageMode.EXTRACT, 0.2),
+    ]
+    for number, (mode, seconds) in enumerate(durations, start=1):
+        clock.now += seconds
+        tracker.add(_page(number, mode, seconds, error="boom" if number == 4 else ""))
+
+    snapshot = tracker.snapshot()
+    assert (snapshot.ocr_pages, snapshot.extract_pages, snapshot.error_pages) == (2, 2, 1)
+    assert [page.page_number for page in snapshot.slowest_pages] == [3, 2]
+    assert snapshot.stage_seconds["ocr"] == 4.0
+    assert round(snapshot.elapsed_seconds, 6) == 5.3
+    assert round(snapshot.pages_per_second, 3) == round(4 / 5.3, 3)
+
+
+def test_remaining_time_follows_recent_rate() -> None:
+    clock = _Clock()
+    tracker = ThroughputTracker(total_pages=100, clock=clock)
+    for number in range(1, 41):
+        # Fast text pages first, then slow scans.
+        clock.now += 0.1 if number <= 20 else 2.0
+        tracker.add(_page(number, PageMode.OCR if number > 20 else PageMode.EXTRACT, 0.1))
+
+    snapshot = tracker.snapshot()
+    assert snapshot.recent_pages_per_second == 0.5
+    assert snapshot.remaining_seconds == 120.0
+    assert snapshot.pages_per_second > snapshot.recent_pages_per_second
@@ -0,0 +1,242 @@
+import json
+import time
+from pathlib import Path
+
+import fitz
+
+from roop_pdfmd.core.converter import ConversionError
+from roop_pdfmd.core.models import AppSettings
+from roop_pdfmd.service.jobs import Job, JobState
+from roop_pdfmd.service.watch import JOURNAL_NAME, FolderWatcher, WatchFolder
+
+
+def _write_pdf(path: Path, text: str = "Inbox page with a text layer.") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeService:
+    def __init__(self, error: str = "") -> None:
+        self.jobs: dict[str, Job] = {}
+        self.output_names: dict[str, str] = {}
+        self.error = error
+
+    def submit_path(
+        self, input_pdf, output_dir=None, settings_overrides=None, output_name=""
+    ) -> Job:
+        if self.error:
+            raise ConversionError(self.error)
+        job = Job(
+            job_id=str(len(self.jobs)),
+            input_pdf=Path(input_pdf),
+            output_dir=Path(output_dir),
+            settings=AppSettings(),
+        )
+        self.jobs[job.job_id] = job
+        self.output_names[job.job_id] = output_name
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self.jobs.get(job_id)
+
+    def forget(self, job_id: str) -> None:
+        pass
+
+
+def test_settled_inbox_files_are_converted_and_moved_aside(tmp_path: Path) -> None:
+    inbox = tmp_path / "inbox"
+    _write_pdf(inbox / "scanner-a" / "letter.pdf")
+    (inbox / "broken.pdf").write_bytes(b"%PDF-1.7 not really a pdf")
+    (inbox / "notes.txt").write_text("ignored", encoding="utf-8")
+    clock = _Clock()
+    watcher = FolderWatcher(
+        [WatchFolder(inbox, tmp_path / "out")],
+        settings=AppSettings(ocr_backend="stub"),
+        workers=1,
+        settle_seconds=5,
+        clock=clock,
+    )
+    try:
+        watcher.poll()
+        clock.now = 10
+        deadline = time.monotonic() + 120
+        while watcher.busy and time.monotonic() < deadline:
+            watcher.poll()
+            time.sleep(0.05)
+    finally:
+        watcher.close()
+
+    assert (watcher.converted, watcher.failed) == (1, 1)
+    assert (tmp_path / "out" / "scanner-a" / "letter.md").is_file()
+    assert (inbox / "processed" / "scanner-a" / "letter.pdf").is_file()
+    assert (inbox / "failed" / "broken.pdf").is_file()
+    assert (inbox / "failed" / "broken.pdf.error.txt").read_text(encoding="utf-8").strip()
+    assert sorted(path.name for path in inbox.iterdir()) == [
+        "failed",
+        "notes.txt",
+        "processed",
+        "scanner-a",
+    ]
+
+
+def test_files_still_being_written_are_not_picked_up(tmp_path: Path) -> None:
+    inbox = tmp_path / "inbox"
+    pdf_path = _write_pdf(inbox / "scan.pdf")
+    service = _FakeService()
+    clock = _Clock()
+    watcher = FolderWatcher(
+        [WatchFolder(inbox, tmp_path / "out")], settle_seconds=5, service=service, clock=clock
+    )
+
+    watcher.poll()
+    clock.now = 4
+    watcher.poll()
+    with pdf_path.open("ab") as handle:
+        handle.write(b"\n% more pages arriving")
+    clock.now = 8
+    watcher.poll()
+    assert not service.jobs
+
+    clock.now = 14
+    watcher.poll()
+    assert [job.input_pdf for job in service.jobs.values()] == [pdf_path.resolve()]
+
+
+def test_restart_moves_finished_files_aside_without_reconverting(tmp_path: Path) -> None:
+    inbox = tmp_path / "inbox"
+    out_dir = tmp_path / "out"
+    pdf_path = _write_pdf(inbox / "scan.pdf")
+    service = _FakeService()
+    clock = _Clock()
+    watcher = FolderWatcher(
+        [WatchFolder(inbox, out_dir)], settle_seconds=0, service=service, clock=clock
+    )
+    watcher.poll()
+    watcher.poll()
+    (job,) = service.jobs.values()
+    job.state = JobState.COMPLETED
+
+    # Crash after the journal write but before the input was moved.
+    watcher._move_aside = lambda *args: None
+    watcher.poll()
+    assert pdf_path.exists()
+    journal = [json.loads(line) for line in (out_dir / JOURNAL_NAME).read_text().splitlines()]
+    assert [(entry["path"], entry["status"]) for entry in journal] == [("scan.pdf", "done")]
+
+    restarted_service = _FakeService()
+    restarted = FolderWatcher(
+        [WatchFolder(inbox, out_dir)], settle_seconds=0, service=restarted_service, clock=clock
+    )
+    restarted.poll()
+    restarted.poll()
+    assert not restarted_service.jobs
+    assert not pdf_path.exists()
+    assert (inbox / "processed" / "scan.pdf").is_file()
+
+
+def test_settled_backlog_is_submitted_shortest_first(tmp_path: Path) -> None:
+    inbox = tmp_path / "inbox"
+    scan = inbox / "a-scan.pdf"
+    scan.parent.mkdir(parents=True)
+    doc = fitz.open()
+    for _ in range(3):
+        doc.new_page().draw_rect(fitz.Rect(72, 72, 300, 300), fill=(0.5, 0.5, 0.5))
+    doc.save(scan)
+    doc.close()
+    text = _write_pdf(inbox / "b-text.pdf")
+    service = _FakeService()
+    watcher = FolderWatcher(
+        [WatchFolder(inbox, tmp_path / "out")],
+        workers=1,
+        settle_seconds=0,
+        service=service,
+        clock=_Clock(),
+    )
+
+    watcher.poll()
+    watcher.poll()
+
+    assert [job.input_pdf for job in service.jobs.values()] == [text.resolve()]
+
+
+def test_files_that_cannot_be_queued_are_moved_to_failed(tmp_path: Path) -> None:
+    inbox = tmp_path / "inbox"
+    out_dir = tmp_path / "out"
+    _write_pdf(inbox / "scan.pdf")
+    service = _FakeService(error="Queue is full")
+    watcher = FolderWatcher(
+        [WatchFolder(inbox, out_dir)], settle_seconds=0, service=service, clock=_Clock()
+    )
+
+    watcher.poll()
+    watcher.poll()
+    watcher.poll()
+
+    assert watcher.failed == 1
+    assert not watcher.busy
+    error_text = (inbox / "failed" / "scan.pdf.error.txt").read_text(encoding="utf-8")
+    assert "Queue is full" in error_text
+    journal = [json.loads(line) for line in (out_dir / JOURNAL_NAME).read_text().splitlines()]
+    assert [(entry["path"], entry["status"]) for entry in journal] == [("scan.pdf", "failed")]
+
+
+def test_reused_inbox_name_does_not_overwrite_earlier_outputs(tmp_path: Path) -> None:
+    inbox = tmp_path / "inbox"
+    out_dir = tmp_path / "out"
+    _write_pdf(inbox / "scan.pdf", "First scan of the day.")
+    service = _FakeService()
+    watcher = FolderWatcher(
+        [WatchFolder(inbox, out_dir)], settle_seconds=0, service=service, clock=_Clock()
+    )
+    watcher.poll()
+    watcher.poll()
+    (first,) = service.jobs.values()
+    (out_dir / "scan.md").write_text("first", encoding="utf-8")
+    first.state = JobState.COMPLETED
+    watcher.poll()
+    assert (inbox / "processed" / "scan.pdf").is_file()
+
+    _write_pdf(inbox / "scan.pdf", "A different document under the same name.")
+    watcher.poll()
+    watcher.poll()
+
+    names = list(service.output_names.values())
+    assert names[0] == "scan"
+    assert names[1].startswith("scan-") and names[1].endswith("-1")
+    assert service.jobs["1"].output_dir == out_dir
+
+
+def test_journal_and_error_file_write_failures_are_logged_per_file(tmp_path: Path) -> None:
+    inbox = tmp_path / "inbox"
+    out_dir = tmp_path / "out"
+    pdf_path = _write_pdf(inbox / "scan.pdf")
+    service = _FakeService()
+    watcher = FolderWatcher(
+        [WatchFolder(inbox, out_dir)], settle_seconds=0, service=service, clock=_Clock()
+    )
+    # Directories where files are expected make both writes fail.
+    (out_dir / JOURNAL_NAME).mkdir()
+    (inbox / "failed" / "scan.pdf.error.txt").mkdir(parents=True)
+    watcher.poll()
+    watcher.poll()
+    (job,) = service.jobs.values()
+    job.state = JobState.FAILED
+    job.error = "boom"
+
+    watcher.poll()
+
+    assert watcher.failed == 1
+    assert not pdf_path.exists()
+    assert (inbox / "failed" / "scan.pdf").is_file()